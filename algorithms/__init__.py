@@ -3,8 +3,20 @@ Operations Research Algorithms Module
 Contains implementations for Simplex, Assignment, and Transportation problems
 """
 
-from .simplex import SimplexSolver
-from .assignment import AssignmentSolver
-from .transportation import TransportationSolver
+from importlib import import_module
+
+# Solvers load on first access, so importing one submodule does not pull in SciPy
+_SOLVER_MODULES = {
+    'SimplexSolver': '.simplex',
+    'AssignmentSolver': '.assignment',
+    'TransportationSolver': '.transportation',
+}
 
 __all__ = ['SimplexSolver', 'AssignmentSolver', 'TransportationSolver']
+
+
+def __getattr__(name: str):
+    """Import a solver's module the first time the solver is looked up"""
+    if name not in _SOLVER_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(_SOLVER_MODULES[name], __name__), name)
@@ -47,7 +47,8 @@ class AssignmentSolver:
             row_names: Optional names for rows (workers)
             col_names: Optional names for columns (tasks)
         """
-        self.cost_matrix = np.array(cost_matrix, dtype=float)
+        # The matrix is only read, so float64 input is used without a copy
+        self.cost_matrix = np.asarray(cost_matrix, dtype=float)
         self.maximize = maximize
         self.n_rows, self.n_cols = self.cost_matrix.shape
         self.row_names = row_names or [f"Worker {i+1}" for i in range(self.n_rows)]
@@ -0,0 +1,60 @@
+"""
+Sensitivity Ranging
+Closed-form allowable ranges from an optimal simplex basis, computed for all
+coefficients in one NumPy sweep
+"""
+
+import numpy as np
+from typing import Tuple
+
+
+# Tolerance for treating tableau entries as zero
+RATIO_TOL = 1e-9
+
+
+def ratio_limits(values: np.ndarray, directions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Largest steps up and down along each column of directions that keep values + step * column >= 0"""
+    values = np.maximum(values, 0.0)[:, None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        up = np.where(directions < -RATIO_TOL, values / -directions, np.inf).min(axis=0, initial=np.inf)
+        down = np.where(directions > RATIO_TOL, values / directions, np.inf).min(axis=0, initial=np.inf)
+    return up, down
+
+
+def rhs_ranges(B_inv: np.ndarray, x_B: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Allowable increase and decrease of every constraint's RHS
+
+    Changing b_i by delta moves the basic solution to x_B + delta * B_inv[:, i],
+    which must stay non-negative for the basis to remain optimal.
+    """
+    return ratio_limits(x_B, B_inv)
+
+
+def coefficient_ranges(
+    B_inv: np.ndarray,
+    c_B: np.ndarray,
+    A_N: np.ndarray,
+    c_N: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Allowable objective coefficient changes of a maximization problem
+
+    Args:
+        B_inv: Inverse of the optimal basis matrix
+        c_B: Objective coefficients of the basic columns
+        A_N: Constraint columns of the non-basic variables
+        c_N: Objective coefficients of the non-basic columns
+
+    Returns:
+        (basic_increase, basic_decrease, nonbasic_increase): limits for each basic
+        position, and how far each non-basic coefficient can rise before its
+        column would enter; non-basic coefficients can fall without limit
+    """
+    # Only the non-basic part of the optimal tableau is needed
+    tableau_N = B_inv @ A_N
+    reduced_N = c_B @ tableau_N - c_N
+
+    # Changing a basic c_k moves every non-basic reduced cost along row k of the tableau
+    basic_increase, basic_decrease = ratio_limits(reduced_N, tableau_N.T)
+    return basic_increase, basic_decrease, np.maximum(reduced_N, 0.0)
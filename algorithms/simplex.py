@@ -4,10 +4,13 @@ Supports Linear Programming problems with 10+ decision variables and constraints
 """
 
 import numpy as np
+from scipy.linalg import qr
 from scipy.optimize import linprog
 from dataclasses import dataclass
 from typing import Optional, List, Tuple, Dict, Any
 
+from .sensitivity import rhs_ranges, coefficient_ranges
+
 
 @dataclass
 class SensitivityAnalysis:
@@ -19,6 +22,20 @@ class SensitivityAnalysis:
     objective_coeff_ranges: List[Dict]  # Allowable coefficient ranges
 
 
+# Tolerance for treating basis values and reduced costs as zero
+_BASIS_TOL = 1e-9
+
+# Relative size below which a QR diagonal entry marks linearly dependent columns
+_RANK_TOL = 1e-10
+
+
+def _as_float_array(values) -> Optional[np.ndarray]:
+    """Convert to a C-contiguous float64 array, without copying data that already is one"""
+    if values is None:
+        return None
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
 @dataclass 
 class SimplexResult:
     """Contains complete solution results"""
@@ -42,9 +59,14 @@ class SimplexSolver:
     - Variable bounds
     - Sensitivity analysis
     
-    Uses scipy.optimize.linprog with HiGHS method for robust solving
+    Uses scipy.optimize.linprog with HiGHS dual simplex for robust solving;
+    method="tableau" instead pivots from the all-slack basis in NumPy, step by
+    step as taught, falling back to HiGHS when that basis is infeasible
     """
     
+    # Solver backends accepted by the method argument
+    METHODS = ("highs-ds", "highs", "tableau")
+    
     def __init__(
         self,
         c: np.ndarray,
@@ -55,7 +77,8 @@ class SimplexSolver:
         bounds: Optional[List[Tuple[float, float]]] = None,
         maximize: bool = True,
         variable_names: Optional[List[str]] = None,
-        constraint_names: Optional[List[str]] = None
+        constraint_names: Optional[List[str]] = None,
+        method: str = "highs-ds"
     ):
         """
         Initialize the Simplex Solver
@@ -70,40 +93,71 @@ class SimplexSolver:
             maximize: True for maximization, False for minimization
             variable_names: Optional names for decision variables
             constraint_names: Optional names for constraints
+            method: Solver backend, one of METHODS
         """
-        self.c = np.array(c, dtype=float)
-        self.A_ub = np.array(A_ub, dtype=float) if A_ub is not None else None
-        self.b_ub = np.array(b_ub, dtype=float) if b_ub is not None else None
-        self.A_eq = np.array(A_eq, dtype=float) if A_eq is not None else None
-        self.b_eq = np.array(b_eq, dtype=float) if b_eq is not None else None
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown method '{method}', expected one of {self.METHODS}")
+        
+        self.c = _as_float_array(c)
+        self.A_ub = _as_float_array(A_ub)
+        self.b_ub = _as_float_array(b_ub)
+        self.A_eq = _as_float_array(A_eq)
+        self.b_eq = _as_float_array(b_eq)
         self.bounds = bounds if bounds else [(0, None) for _ in range(len(c))]
+        # Default bounds go to linprog as one broadcast pair instead of a per-variable list
+        nonnegative = not bounds or all(tuple(bound) == (0, None) for bound in bounds)
+        self._solve_bounds = (0, None) if nonnegative else bounds
         self.maximize = maximize
         self.variable_names = variable_names or [f"x{i+1}" for i in range(len(c))]
         self.constraint_names = constraint_names or []
+        self.method = method
         
         self._result = None
         self._sensitivity = None
+        
+        # Optimal basis over the columns of [A_ub | I], available after a successful solve
+        self.basis: Optional[np.ndarray] = None
+        self.in_basis: Optional[np.ndarray] = None
+        self.B_inv: Optional[np.ndarray] = None
+        self.c_B: Optional[np.ndarray] = None
+        self._A_full: Optional[np.ndarray] = None
+        self._c_full: Optional[np.ndarray] = None
     
-    def solve(self) -> SimplexResult:
+    def solve(self, initial_basis: Optional[np.ndarray] = None) -> SimplexResult:
         """
         Solve the linear programming problem using the Simplex method
         
+        Args:
+            initial_basis: Optional basis (column indices of [A_ub | I]) to warm-start
+                from, typically the basis of a previous solve of a similar problem
+        
         Returns:
             SimplexResult containing the solution and sensitivity analysis
         """
+        # The tableau method starts from the slack basis like the textbook method
+        if initial_basis is None and self.method == "tableau" and self._has_standard_form():
+            initial_basis = np.arange(len(self.c), len(self.c) + len(self.b_ub))
+        
+        # Warm start; falls through to a cold solve when the basis cannot be used
+        if initial_basis is not None:
+            warm_result = self._solve_from_basis(initial_basis)
+            if warm_result is not None:
+                return warm_result
+        
         # For maximization, negate the objective coefficients
         c_solve = -self.c if self.maximize else self.c
+        self.basis = self.in_basis = self.B_inv = self.c_B = None
         
         try:
-            # Solve using HiGHS method (most robust)
+            # Solve with HiGHS (most robust); dual simplex unless plain "highs" is chosen
             result = linprog(
                 c_solve,
                 A_ub=self.A_ub,
                 b_ub=self.b_ub,
                 A_eq=self.A_eq,
                 b_eq=self.b_eq,
-                bounds=self.bounds,
-                method='highs'
+                bounds=self._solve_bounds,
+                method='highs' if self.method == 'highs' else 'highs-ds'
             )
             
             if result.success:
@@ -179,16 +233,24 @@ class SimplexSolver:
             if marginals is not None:
                 reduced_costs = marginals if not self.maximize else -marginals
         
+        self._factor_basis(result.x, shadow_prices, reduced_costs)
+        return self._build_sensitivity(result.x, shadow_prices, reduced_costs)
+    
+    def _build_sensitivity(
+        self,
+        x: np.ndarray,
+        shadow_prices: np.ndarray,
+        reduced_costs: np.ndarray
+    ) -> SensitivityAnalysis:
+        """Assemble slack values and allowable ranges around a solution"""
         # Calculate slack values for inequality constraints
-        slack_values = np.zeros(n_ub)
-        if self.A_ub is not None and self.b_ub is not None:
-            slack_values = self.b_ub - np.dot(self.A_ub, result.x)
+        slack_values = self._get_slack_values(x)
         
         # Compute allowable ranges for RHS values
-        constraint_rhs_ranges = self._compute_rhs_ranges(result, shadow_prices)
+        constraint_rhs_ranges = self._compute_rhs_ranges(shadow_prices, slack_values)
         
         # Compute allowable ranges for objective coefficients
-        objective_coeff_ranges = self._compute_objective_ranges(result, reduced_costs)
+        objective_coeff_ranges = self._compute_objective_ranges(x, reduced_costs)
         
         return SensitivityAnalysis(
             shadow_prices=shadow_prices,
@@ -198,52 +260,42 @@ class SimplexSolver:
             objective_coeff_ranges=objective_coeff_ranges
         )
     
-    def _compute_rhs_ranges(self, result, shadow_prices: np.ndarray) -> List[Dict]:
+    def _compute_rhs_ranges(self, shadow_prices: np.ndarray, slack_values: np.ndarray) -> List[Dict]:
         """Compute allowable ranges for constraint RHS values"""
-        ranges = []
         n_ub = len(self.b_ub) if self.b_ub is not None else 0
+        if n_ub == 0:
+            return []
         
-        for i in range(n_ub):
-            current_rhs = self.b_ub[i]
-            
-            # Estimate allowable ranges based on slack and shadow prices
-            if shadow_prices[i] != 0:
-                # Binding constraint - calculate ranges
-                allowable_increase = float('inf')
-                allowable_decrease = float('inf')
-                
-                # Use slack values to estimate decrease
-                if i < len(self._get_slack_values(result)):
-                    allowable_decrease = min(allowable_decrease, abs(current_rhs * 0.5))
-                
-                ranges.append({
-                    'constraint': i + 1,
-                    'name': self.constraint_names[i] if i < len(self.constraint_names) else f"Constraint {i+1}",
-                    'current_rhs': current_rhs,
-                    'shadow_price': shadow_prices[i],
-                    'allowable_increase': allowable_increase,
-                    'allowable_decrease': allowable_decrease
-                })
-            else:
-                # Non-binding constraint
-                ranges.append({
-                    'constraint': i + 1,
-                    'name': self.constraint_names[i] if i < len(self.constraint_names) else f"Constraint {i+1}",
-                    'current_rhs': current_rhs,
-                    'shadow_price': 0.0,
-                    'allowable_increase': float('inf'),
-                    'allowable_decrease': self._get_slack_values(result)[i] if i < len(self._get_slack_values(result)) else 0
-                })
+        binding = shadow_prices[:n_ub] != 0
+        if self.B_inv is not None:
+            # Exact ranges from the optimal basis: x_B + delta * B_inv[:, i] must stay >= 0
+            increases, decreases = rhs_ranges(self.B_inv, self.B_inv @ self.b_ub)
+        else:
+            # Binding constraints (non-zero shadow price) estimate the decrease from the RHS,
+            # non-binding ones can drop by their slack; computed for all rows at once
+            increases = np.full(n_ub, np.inf)
+            decreases = np.where(binding, np.abs(self.b_ub * 0.5), slack_values)
         
-        return ranges
+        return [
+            {
+                'constraint': i + 1,
+                'name': self.constraint_names[i] if i < len(self.constraint_names) else f"Constraint {i+1}",
+                'current_rhs': self.b_ub[i],
+                'shadow_price': shadow_prices[i] if binding[i] else 0.0,
+                'allowable_increase': float(increases[i]),
+                'allowable_decrease': float(decreases[i])
+            }
+            for i in range(n_ub)
+        ]
     
-    def _compute_objective_ranges(self, result, reduced_costs: np.ndarray) -> List[Dict]:
+    def _compute_objective_ranges(self, x: np.ndarray, reduced_costs: np.ndarray) -> List[Dict]:
         """Compute allowable ranges for objective function coefficients"""
         ranges = []
+        exact = self._objective_ranging() if self.B_inv is not None else None
         
         for i in range(len(self.c)):
             current_coeff = self.c[i]
-            current_value = result.x[i]
+            current_value = x[i]
             
             if current_value > 1e-6:  # Basic variable
                 ranges.append({
@@ -265,15 +317,270 @@ class SimplexSolver:
                     'allowable_increase': abs(reduced_costs[i]) if i < len(reduced_costs) else float('inf'),
                     'allowable_decrease': float('inf')
                 })
+            
+            if exact is not None:
+                ranges[i]['allowable_increase'] = float(exact[0][i])
+                ranges[i]['allowable_decrease'] = float(exact[1][i])
         
         return ranges
     
-    def _get_slack_values(self, result) -> np.ndarray:
+    def _get_slack_values(self, x: np.ndarray) -> np.ndarray:
         """Get slack values from the solution"""
         if self.A_ub is not None and self.b_ub is not None:
-            return self.b_ub - np.dot(self.A_ub, result.x)
+            return self.b_ub - np.dot(self.A_ub, x)
         return np.array([])
     
+    def _has_standard_form(self) -> bool:
+        """Whether the problem is max/min c x s.t. A_ub x <= b_ub, x >= 0, which basis methods need"""
+        return (
+            self.A_ub is not None and self.b_ub is not None
+            and self.A_eq is None and self._solve_bounds == (0, None)
+        )
+    
+    def _standard_form(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Constraint matrix [A_ub | I] and the matching objective in maximization form"""
+        m = len(self.b_ub)
+        A_full = np.hstack([self.A_ub, np.eye(m)])
+        c_full = np.concatenate([self.c if self.maximize else -self.c, np.zeros(m)])
+        return A_full, c_full
+    
+    def _factor_basis(self, x: np.ndarray, shadow_prices: np.ndarray, reduced_costs: np.ndarray):
+        """Recover the optimal basis of [A_ub | I] from the solution and store its inverse"""
+        if not self._has_standard_form():
+            return
+        
+        m, n = self.A_ub.shape
+        A_full, c_full = self._standard_form()
+        values = np.concatenate([x, self.b_ub - self.A_ub @ x])
+        
+        # Positive columns are basic. A degenerate basis is completed only with zero
+        # columns whose reduced cost is zero: the solver's own basis is made of such
+        # columns, so a completion always exists, and any basis drawn from them
+        # reproduces the solver's duals
+        dual_tol = 1e-7 * max(1.0, np.abs(c_full).max(initial=0.0))
+        column_duals = np.abs(np.concatenate([reduced_costs, shadow_prices[:m]]))
+        positive = np.flatnonzero(values > _BASIS_TOL)
+        zero = np.flatnonzero((values <= _BASIS_TOL) & (column_duals <= dual_tol))
+        missing = m - len(positive)
+        if missing < 0 or len(zero) < missing:
+            return
+        
+        # One column-pivoted QR of the candidates, projected off the span of the
+        # positive columns, picks the completing columns instead of a rank test
+        # per column
+        candidates = A_full[:, zero]
+        if len(positive):
+            Q, R = np.linalg.qr(A_full[:, positive])
+            if np.abs(np.diag(R)).min() <= _RANK_TOL * max(1.0, np.abs(R).max()):
+                return
+            candidates = candidates - Q @ (Q.T @ candidates)
+        if missing:
+            R, pivots = qr(candidates, mode='r', pivoting=True)
+            if abs(R[missing - 1, missing - 1]) <= _RANK_TOL * max(1.0, abs(R[0, 0])):
+                return
+            basis = np.concatenate([positive, zero[pivots[:missing]]])
+        else:
+            basis = positive
+        
+        B_inv = np.linalg.inv(A_full[:, basis])
+        c_B = c_full[basis]
+        
+        # Keep the basis only if it reproduces the solution and no reduced cost is negative
+        scale = max(1.0, np.abs(self.b_ub).max(initial=0.0))
+        if not np.allclose(B_inv @ self.b_ub, values[basis], rtol=1e-7, atol=1e-7 * scale):
+            return
+        reduced = c_B @ B_inv @ A_full - c_full
+        if reduced.min(initial=0.0) < -1e-7 * max(1.0, np.abs(c_full).max(initial=0.0)):
+            return
+        
+        self._set_basis(basis, B_inv, c_B)
+        self._A_full, self._c_full = A_full, c_full
+    
+    def _set_basis(self, basis: np.ndarray, B_inv: np.ndarray, c_B: np.ndarray):
+        """Store an optimal basis with its membership mask over the columns of [A_ub | I]"""
+        self.basis, self.B_inv, self.c_B = basis, B_inv, c_B
+        self.in_basis = np.zeros(len(self.c) + len(basis), dtype=bool)
+        self.in_basis[basis] = True
+    
+    def _objective_ranging(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Allowable objective coefficient increases and decreases from the optimal tableau"""
+        n = len(self.c)
+        nonbasic = np.flatnonzero(~self.in_basis)
+        basic_up, basic_down, nonbasic_up = coefficient_ranges(
+            self.B_inv, self.c_B, self._A_full[:, nonbasic], self._c_full[nonbasic]
+        )
+        
+        # Non-basic coefficients can fall without limit
+        up = np.full(n, np.inf)
+        down = np.full(n, np.inf)
+        structural = nonbasic < n
+        up[nonbasic[structural]] = nonbasic_up[structural]
+        structural = self.basis < n
+        up[self.basis[structural]] = basic_up[structural]
+        down[self.basis[structural]] = basic_down[structural]
+        
+        # A minimization objective is ranged in negated form, so the directions swap
+        return (up, down) if self.maximize else (down, up)
+    
+    def reoptimize(
+        self,
+        c: Optional[np.ndarray] = None,
+        b_ub: Optional[np.ndarray] = None
+    ) -> Optional[SimplexResult]:
+        """
+        Update the solution for a new objective and/or RHS without re-solving
+        
+        The stored basis stays optimal as long as B_inv b >= 0 and no reduced cost
+        turns negative, in which case the new solution follows in closed form.
+        
+        Args:
+            c: New objective coefficients (defaults to the current ones)
+            b_ub: New inequality right-hand side (defaults to the current one)
+            
+        Returns:
+            SimplexResult for the updated problem, or None if the basis is no longer optimal
+        """
+        if self.B_inv is None:
+            return None
+        
+        c_new = self.c if c is None else _as_float_array(c)
+        b_new = self.b_ub if b_ub is None else _as_float_array(b_ub)
+        if c_new.shape != self.c.shape or b_new.shape != self.b_ub.shape:
+            return None
+        
+        x_B = self.B_inv @ b_new
+        c_full = np.concatenate([c_new if self.maximize else -c_new, np.zeros(len(b_new))])
+        reduced = c_full[self.basis] @ self.B_inv @ self._A_full - c_full
+        if (x_B.min() < -1e-7 * max(1.0, np.abs(b_new).max())
+                or reduced.min() < -1e-7 * max(1.0, np.abs(c_full).max())):
+            return None
+        
+        self.c, self.b_ub = c_new, b_new
+        return self._result_from_basis(self.basis, self.B_inv, iterations=0)
+    
+    def _solve_from_basis(self, initial_basis: np.ndarray) -> Optional[SimplexResult]:
+        """
+        Pivot to optimality from a starting basis
+        
+        A primal feasible basis continues with primal simplex steps and a dual feasible
+        one (e.g. after an RHS change) with dual simplex steps, both using Bland's rule.
+        
+        Returns:
+            SimplexResult, or None if the basis is unusable or neither primal nor dual
+            feasible, in which case the caller solves from scratch
+        """
+        if not self._has_standard_form():
+            return None
+        
+        m, n = self.A_ub.shape
+        basis = np.array(initial_basis, dtype=np.intp)
+        if basis.shape != (m,) or basis.min(initial=0) < 0 or basis.max(initial=0) >= n + m:
+            return None
+        
+        A_full, c_full = self._standard_form()
+        try:
+            B_inv = np.linalg.inv(A_full[:, basis])
+        except np.linalg.LinAlgError:
+            return None
+        
+        primal_tol = 1e-7 * max(1.0, np.abs(self.b_ub).max(initial=0.0))
+        dual_tol = 1e-7 * max(1.0, np.abs(c_full).max(initial=0.0))
+        
+        # Scratch buffers reused by every pivot instead of allocating temporaries
+        c_B = c_full[basis]
+        x_B = np.empty(m)
+        duals = np.empty(m)
+        reduced = np.empty(n + m)
+        column = np.empty(m)
+        pivot_row = np.empty(m)
+        row = np.empty(n + m)
+        row_ratios = np.empty(n + m)
+        column_ratios = np.empty(m)
+        outer = np.empty((m, m))
+        
+        for iteration in range(50 * (m + n)):
+            np.matmul(B_inv, self.b_ub, out=x_B)
+            np.matmul(c_B, B_inv, out=duals)
+            np.matmul(duals, A_full, out=reduced)
+            reduced -= c_full
+            primal_feasible = x_B.min() >= -primal_tol
+            dual_feasible = reduced.min() >= -dual_tol
+            
+            if primal_feasible and dual_feasible:
+                self._A_full, self._c_full = A_full, c_full
+                # Refactor once so pivoting round-off does not carry into the ranges
+                return self._result_from_basis(basis, np.linalg.inv(A_full[:, basis]), iterations=iteration)
+            
+            if primal_feasible:
+                # Primal step: lowest-index improving column enters, ratio test picks the row
+                entering = np.flatnonzero(reduced < -dual_tol)[0]
+                np.matmul(B_inv, A_full[:, entering], out=column)
+                np.maximum(x_B, 0.0, out=x_B)
+                column_ratios.fill(np.inf)
+                np.divide(x_B, column, out=column_ratios, where=column > _BASIS_TOL)
+                if np.isinf(column_ratios).all():
+                    return None  # Unbounded; the cold solve reports it
+                ties = np.flatnonzero(column_ratios == column_ratios.min())
+                leaving = ties[np.argmin(basis[ties])]
+            elif dual_feasible:
+                # Dual step: an infeasible row leaves, dual ratio test picks the column
+                leaving = np.flatnonzero(x_B < -primal_tol)[0]
+                np.matmul(B_inv[leaving], A_full, out=row)
+                np.maximum(reduced, 0.0, out=reduced)
+                np.negative(row, out=row)
+                row_ratios.fill(np.inf)
+                np.divide(reduced, row, out=row_ratios, where=row > _BASIS_TOL)
+                if np.isinf(row_ratios).all():
+                    return None  # Infeasible; the cold solve reports it
+                entering = np.flatnonzero(row_ratios == row_ratios.min())[0]
+                np.matmul(B_inv, A_full[:, entering], out=column)
+            else:
+                return None
+            
+            # Rank-1 update of B_inv for the basis change
+            np.divide(B_inv[leaving], column[leaving], out=pivot_row)
+            np.multiply(column[:, None], pivot_row, out=outer)
+            B_inv -= outer
+            B_inv[leaving] = pivot_row
+            basis[leaving] = entering
+            c_B[leaving] = c_full[entering]
+        
+        return None
+    
+    def _result_from_basis(self, basis: np.ndarray, B_inv: np.ndarray, iterations: int) -> SimplexResult:
+        """Store an optimal basis and build the solution, duals and ranges it implies"""
+        n = len(self.c)
+        c_full = np.concatenate([self.c if self.maximize else -self.c, np.zeros(len(self.b_ub))])
+        c_B = c_full[basis]
+        duals = c_B @ B_inv
+        reduced = duals @ self._A_full - c_full
+        
+        self._set_basis(basis, B_inv, c_B)
+        self._c_full = c_full
+        
+        values = np.zeros(len(c_full))
+        values[basis] = np.maximum(B_inv @ self.b_ub, 0.0)
+        x = values[:n]
+        
+        # Same sign conventions as the solver's dual values
+        shadow_prices = duals if self.maximize else -duals
+        reduced_costs = -reduced[:n] if self.maximize else reduced[:n]
+        
+        self._result = SimplexResult(
+            success=True,
+            message="Optimal solution found",
+            optimal_value=float(self.c @ x),
+            solution=x,
+            sensitivity=self._build_sensitivity(x, shadow_prices, reduced_costs),
+            iterations=iterations,
+            status=0
+        )
+        return self._result
+    
+    def get_result(self) -> Optional[SimplexResult]:
+        """Get the result of the last solve, or None if not solved yet"""
+        return self._result
+    
     def get_solution_summary(self) -> Dict[str, Any]:
         """
         Get a formatted summary of the solution
@@ -5,6 +5,9 @@ Contains navigation and view management with professional UI
 
 import customtkinter as ctk
 import tkinter as tk
+from dataclasses import dataclass
+from functools import partial
+from typing import Optional
 from config.settings import (
     APP_NAME, WINDOW_WIDTH, WINDOW_HEIGHT, 
     MIN_WIDTH, MIN_HEIGHT, COLORS, FONTS, GROUP_NAME
@@ -15,6 +18,36 @@ from ui.assignment_view import AssignmentView
 from ui.transportation_view import TransportationView
 
 
+@dataclass(frozen=True)
+class _NavStyle:
+    """Fonts and colors shared by the sidebar widgets"""
+    logo_font: ctk.CTkFont
+    badge_font: ctk.CTkFont
+    company_font: ctk.CTkFont
+    tagline_font: ctk.CTkFont
+    icon_font: ctk.CTkFont
+    main_font: ctk.CTkFont
+    sub_font: ctk.CTkFont
+    theme_font: ctk.CTkFont
+    main_color: str = "#FFFFFF"
+    sub_color: str = COLORS["text_muted"]
+
+
+def _build_nav_style() -> _NavStyle:
+    """Create the sidebar fonts once (requires an existing Tk root)"""
+    family = FONTS["family"]
+    return _NavStyle(
+        logo_font=ctk.CTkFont(family=family, size=28, weight="bold"),
+        badge_font=ctk.CTkFont(family=family, size=10, weight="bold"),
+        company_font=ctk.CTkFont(family=family, size=12, weight="bold"),
+        tagline_font=ctk.CTkFont(family=family, size=11),
+        icon_font=ctk.CTkFont(size=16),
+        main_font=ctk.CTkFont(family=family, size=13, weight="bold"),
+        sub_font=ctk.CTkFont(family=family, size=10),
+        theme_font=ctk.CTkFont(family=family, size=12)
+    )
+
+
 class App(ctk.CTk):
     """
     Main application window for The Best Laboratory Pakistan OR Solver
@@ -35,7 +68,6 @@ class App(ctk.CTk):
         
         # Configure window
         self.title(APP_NAME)
-        self.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
         self.minsize(MIN_WIDTH, MIN_HEIGHT)
         
         # Center window on screen
@@ -48,6 +80,9 @@ class App(ctk.CTk):
         # Configure default font
         self.default_font = ctk.CTkFont(family=FONTS["family"], size=FONTS["size_md"])
         
+        # Sidebar fonts/colors, built once and reused by every nav item
+        self._style = _build_nav_style()
+        
         # Track current theme
         self.is_dark_mode = False
         
@@ -75,8 +110,7 @@ class App(ctk.CTk):
             pass
     
     def _center_window(self):
-        """Center the window on the screen"""
-        self.update_idletasks()
+        """Size and center the window on the screen in a single geometry call"""
         screen_width = self.winfo_screenwidth()
         screen_height = self.winfo_screenheight()
         x = (screen_width - WINDOW_WIDTH) // 2
@@ -99,11 +133,11 @@ class App(ctk.CTk):
         self.sidebar.grid(row=0, column=0, sticky="nsew")
         self.sidebar.grid_propagate(False)
         
-        # Main content frame with subtle background
+        # Main content frame with subtle background (light, dark variants)
         self.main_frame = ctk.CTkFrame(
             self, 
             corner_radius=0,
-            fg_color=COLORS["background"]
+            fg_color=(COLORS["background"], COLORS["background_dark"])
         )
         self.main_frame.grid(row=0, column=1, sticky="nsew")
         self.main_frame.grid_columnconfigure(0, weight=1)
@@ -111,50 +145,39 @@ class App(ctk.CTk):
     
     def _create_sidebar(self):
         """Create the navigation sidebar with modern design"""
+        # Sidebar children are gridded in a single column
+        self.sidebar.grid_columnconfigure(0, weight=1)
+        
         # Logo container with padding
         logo_container = ctk.CTkFrame(self.sidebar, fg_color="transparent")
-        logo_container.pack(fill="x", padx=20, pady=(25, 15))
+        logo_container.grid(row=0, column=0, sticky="ew", padx=20, pady=(25, 15))
         
         # Logo text with modern styling
         logo_frame = ctk.CTkFrame(logo_container, fg_color="transparent")
         logo_frame.pack(anchor="w")
         
-        ctk.CTkLabel(
-            logo_frame,
-            text="TBLP",
-            font=ctk.CTkFont(family=FONTS["family"], size=28, weight="bold"),
-            text_color="#FFFFFF"
-        ).pack(side="left")
+        self._lbl(logo_frame, "TBLP", self._style.logo_font).pack(side="left")
         
         # Group name badge
         group_badge = ctk.CTkFrame(logo_frame, fg_color=COLORS["accent"], corner_radius=4)
         group_badge.pack(side="left", padx=(8, 0), pady=(8, 0))
-        ctk.CTkLabel(
-            group_badge,
-            text=f" {GROUP_NAME} ",
-            font=ctk.CTkFont(family=FONTS["family"], size=10, weight="bold"),
-            text_color="#FFFFFF"
-        ).pack(padx=4, pady=2)
+        self._lbl(group_badge, f" {GROUP_NAME} ", self._style.badge_font).pack(padx=4, pady=2)
         
         # Company full name
-        ctk.CTkLabel(
-            logo_container,
-            text="The Best Laboratory Pakistan",
-            font=ctk.CTkFont(family=FONTS["family"], size=12, weight="bold"),
-            text_color=COLORS["accent_light"]
+        self._lbl(
+            logo_container, "The Best Laboratory Pakistan",
+            self._style.company_font, COLORS["accent_light"]
         ).pack(anchor="w", pady=(8, 0))
         
         # Tagline
-        ctk.CTkLabel(
-            logo_container,
-            text="Operations Research Suite",
-            font=ctk.CTkFont(family=FONTS["family"], size=11),
-            text_color=COLORS["text_muted"]
+        self._lbl(
+            logo_container, "Operations Research Suite",
+            self._style.tagline_font, self._style.sub_color
         ).pack(anchor="w", pady=(3, 0))
         
         # Divider with accent color
         divider_frame = ctk.CTkFrame(self.sidebar, fg_color="transparent")
-        divider_frame.pack(fill="x", padx=20, pady=15)
+        divider_frame.grid(row=1, column=0, sticky="ew", padx=20, pady=15)
         
         ctk.CTkFrame(
             divider_frame,
@@ -163,16 +186,17 @@ class App(ctk.CTk):
         ).pack(fill="x")
         
         # Navigation section label
-        ctk.CTkLabel(
-            self.sidebar,
-            text="MAIN MENU",
-            font=ctk.CTkFont(family=FONTS["family"], size=10, weight="bold"),
-            text_color=COLORS["text_muted"]
-        ).pack(anchor="w", padx=25, pady=(5, 10))
+        self._lbl(
+            self.sidebar, "MAIN MENU", self._style.badge_font, self._style.sub_color
+        ).grid(row=2, column=0, sticky="w", padx=25, pady=(5, 10))
         
         # Navigation buttons with modern icons
         self.nav_buttons = {}
         
+        # (button fg, icon fg) colors for the selected and idle nav states
+        self._nav_state_active = (COLORS["sidebar_active"], COLORS["accent"])
+        self._nav_state_inactive = ("transparent", COLORS["sidebar_hover"])
+        
         nav_items = [
             ("dashboard", "⌂", "Dashboard", "Home & Overview"),
             ("simplex", "◈", "Linear Programming", "Simplex Method"),
@@ -180,9 +204,11 @@ class App(ctk.CTk):
             ("transportation", "⇄", "Transportation", "VAM + MODI")
         ]
         
-        for view_id, icon, label, subtitle in nav_items:
+        for row, (view_id, icon, label, subtitle) in enumerate(nav_items, start=3):
+            on_click = partial(self._on_nav_click, view_id)
+            
             btn_frame = ctk.CTkFrame(self.sidebar, fg_color="transparent")
-            btn_frame.pack(fill="x", padx=12, pady=3)
+            btn_frame.grid(row=row, column=0, sticky="ew", padx=12, pady=3)
             
             btn = ctk.CTkButton(
                 btn_frame,
@@ -192,14 +218,14 @@ class App(ctk.CTk):
                 corner_radius=10,
                 fg_color="transparent",
                 hover_color=COLORS["sidebar_hover"],
-                command=lambda v=view_id: self._show_view(v)
+                command=partial(self._show_view, view_id)
             )
             btn.pack(fill="x")
             
             # Custom button content
             inner_frame = ctk.CTkFrame(btn, fg_color="transparent")
             inner_frame.place(relx=0.02, rely=0.5, anchor="w")
-            inner_frame.bind("<Button-1>", lambda e, v=view_id: self._show_view(v))
+            inner_frame.bind("<Button-1>", on_click)
             
             # Icon with colored background
             icon_bg = ctk.CTkFrame(
@@ -210,75 +236,61 @@ class App(ctk.CTk):
                 fg_color=COLORS["sidebar_hover"]
             )
             icon_bg.pack(side="left", padx=(8, 12))
-            icon_bg.pack_propagate(False)
-            icon_bg.bind("<Button-1>", lambda e, v=view_id: self._show_view(v))
+            icon_bg.grid_propagate(False)
+            icon_bg.grid_rowconfigure(0, weight=1)
+            icon_bg.grid_columnconfigure(0, weight=1)
+            icon_bg.bind("<Button-1>", on_click)
             
-            icon_label = ctk.CTkLabel(
-                icon_bg,
-                text=icon,
-                font=ctk.CTkFont(size=16),
-                text_color="#FFFFFF"
-            )
-            icon_label.place(relx=0.5, rely=0.5, anchor="center")
-            icon_label.bind("<Button-1>", lambda e, v=view_id: self._show_view(v))
+            icon_label = self._lbl(icon_bg, icon, self._style.icon_font)
+            icon_label.grid(row=0, column=0)
+            icon_label.bind("<Button-1>", on_click)
             
             # Text content
             text_frame = ctk.CTkFrame(inner_frame, fg_color="transparent")
             text_frame.pack(side="left", fill="y")
-            text_frame.bind("<Button-1>", lambda e, v=view_id: self._show_view(v))
+            text_frame.bind("<Button-1>", on_click)
             
-            main_label = ctk.CTkLabel(
-                text_frame,
-                text=label,
-                font=ctk.CTkFont(family=FONTS["family"], size=13, weight="bold"),
-                text_color="#FFFFFF",
-                anchor="w"
-            )
+            main_label = self._lbl(text_frame, label, self._style.main_font, anchor="w")
             main_label.pack(anchor="w")
-            main_label.bind("<Button-1>", lambda e, v=view_id: self._show_view(v))
+            main_label.bind("<Button-1>", on_click)
             
-            sub_label = ctk.CTkLabel(
-                text_frame,
-                text=subtitle,
-                font=ctk.CTkFont(family=FONTS["family"], size=10),
-                text_color=COLORS["text_muted"],
-                anchor="w"
+            sub_label = self._lbl(
+                text_frame, subtitle, self._style.sub_font, self._style.sub_color, anchor="w"
             )
             sub_label.pack(anchor="w")
-            sub_label.bind("<Button-1>", lambda e, v=view_id: self._show_view(v))
+            sub_label.bind("<Button-1>", on_click)
             
             self.nav_buttons[view_id] = (btn, icon_bg)
         
-        # Spacer
-        ctk.CTkFrame(self.sidebar, fg_color="transparent").pack(fill="both", expand=True)
+        # Empty stretch row pushes the bottom section down
+        row += 1
+        self.sidebar.grid_rowconfigure(row, weight=1)
         
         # Bottom section divider
         ctk.CTkFrame(
             self.sidebar,
             height=1,
             fg_color=COLORS["sidebar_hover"]
-        ).pack(fill="x", padx=20, pady=10)
+        ).grid(row=row + 1, column=0, sticky="ew", padx=20, pady=10)
         
         # Theme toggle section
         theme_frame = ctk.CTkFrame(self.sidebar, fg_color="transparent")
-        theme_frame.pack(fill="x", padx=20, pady=10)
+        theme_frame.grid(row=row + 2, column=0, sticky="ew", padx=20, pady=10)
         
         theme_label_frame = ctk.CTkFrame(theme_frame, fg_color="transparent")
         theme_label_frame.pack(side="left")
         
-        ctk.CTkLabel(
-            theme_label_frame,
-            text="☀" if not self.is_dark_mode else "☾",
-            font=ctk.CTkFont(size=16),
-            text_color="#FFFFFF"
-        ).pack(side="left")
+        self._theme_icon_label = self._lbl(
+            theme_label_frame, "☀" if not self.is_dark_mode else "☾", self._style.icon_font
+        )
+        self._theme_icon_label.pack(side="left")
         
-        ctk.CTkLabel(
+        self._theme_text_label = self._lbl(
             theme_label_frame,
-            text="  Light Mode" if not self.is_dark_mode else "  Dark Mode",
-            font=ctk.CTkFont(family=FONTS["family"], size=12),
-            text_color="#FFFFFF"
-        ).pack(side="left")
+            "  Light Mode" if not self.is_dark_mode else "  Dark Mode",
+            self._style.theme_font
+        )
+        self._theme_text_label.pack(side="left")
         
         self.theme_switch = ctk.CTkSwitch(
             theme_frame,
@@ -294,15 +306,23 @@ class App(ctk.CTk):
         
         # Version info with styling
         version_frame = ctk.CTkFrame(self.sidebar, fg_color=COLORS["primary_dark"])
-        version_frame.pack(fill="x", side="bottom")
+        version_frame.grid(row=row + 3, column=0, sticky="ew")
         
-        ctk.CTkLabel(
-            version_frame,
-            text=f"TBLP OR Suite v1.0.0 | {GROUP_NAME}",
-            font=ctk.CTkFont(family=FONTS["family"], size=10),
-            text_color=COLORS["text_muted"]
+        self._lbl(
+            version_frame, f"TBLP OR Suite v1.0.0 | {GROUP_NAME}",
+            self._style.sub_font, self._style.sub_color
         ).pack(pady=12)
     
+    def _lbl(self, parent, text: str, font: ctk.CTkFont, color: Optional[str] = None, **kwargs) -> ctk.CTkLabel:
+        """Create a sidebar label, defaulting to the main text color"""
+        return ctk.CTkLabel(
+            parent,
+            text=text,
+            font=font,
+            text_color=color or self._style.main_color,
+            **kwargs
+        )
+    
     def _create_views(self):
         """Create all view frames"""
         self.views = {}
@@ -322,6 +342,10 @@ class App(ctk.CTk):
         # Transportation view
         self.views["transportation"] = TransportationView(self.main_frame)
     
+    def _on_nav_click(self, view_id: str, event):
+        """Handle a click on the custom content of a nav button"""
+        self._show_view(view_id)
+    
     def _show_view(self, view_name: str):
         """Show a specific view with smooth transition"""
         # Hide all views
@@ -334,23 +358,22 @@ class App(ctk.CTk):
         
         # Update nav button states with visual feedback
         for name, (btn, icon_bg) in self.nav_buttons.items():
-            if name == view_name:
-                btn.configure(fg_color=COLORS["sidebar_active"])
-                icon_bg.configure(fg_color=COLORS["accent"])
-            else:
-                btn.configure(fg_color="transparent")
-                icon_bg.configure(fg_color=COLORS["sidebar_hover"])
+            btn_color, icon_color = (
+                self._nav_state_active if name == view_name else self._nav_state_inactive
+            )
+            btn.configure(fg_color=btn_color)
+            icon_bg.configure(fg_color=icon_color)
     
     def _toggle_theme(self):
         """Toggle between light and dark theme"""
         self.is_dark_mode = self.theme_switch.get()
         
-        if self.is_dark_mode:
-            ctk.set_appearance_mode("dark")
-            self.main_frame.configure(fg_color=COLORS["background_dark"])
-        else:
-            ctk.set_appearance_mode("light")
-            self.main_frame.configure(fg_color=COLORS["background"])
+        # main_frame carries both color variants, so the mode switch alone redraws it
+        ctk.set_appearance_mode("dark" if self.is_dark_mode else "light")
+        
+        # Update the theme indicator in place
+        self._theme_icon_label.configure(text="☾" if self.is_dark_mode else "☀")
+        self._theme_text_label.configure(text="  Dark Mode" if self.is_dark_mode else "  Light Mode")
 
 
 def run():
@@ -10,9 +10,35 @@ from typing import Optional, List
 from ui.components.matrix_input import MatrixInput
 from ui.components.result_display import ResultDisplay, AllocationMatrixDisplay
 from ui.components.panel_controls import PanelHeader, PanelToggleBar, FullscreenWindow
-from algorithms.assignment import AssignmentSolver, create_sample_problem
+from ui.components.theme import get_font
 from config.settings import WORKERS, TASKS, DEFAULT_MATRIX_SIZE, COLORS, SPACING, FONTS
 
+# Sample TBLP worker efficiency matrix (read-only, shared across loads)
+_SAMPLE_EFFICIENCY = np.array([
+    [85, 70, 65, 80, 75, 90, 60, 50, 70, 65],
+    [75, 85, 70, 65, 80, 75, 70, 60, 65, 70],
+    [80, 75, 90, 70, 65, 80, 75, 55, 80, 60],
+    [65, 80, 75, 90, 70, 65, 80, 70, 75, 80],
+    [70, 65, 80, 75, 90, 70, 65, 75, 60, 85],
+    [90, 75, 70, 65, 80, 85, 70, 80, 65, 70],
+    [60, 90, 65, 80, 75, 70, 95, 65, 80, 75],
+    [55, 65, 80, 70, 85, 75, 70, 90, 70, 80],
+    [75, 70, 85, 75, 70, 80, 75, 70, 95, 65],
+    [70, 75, 60, 85, 80, 70, 80, 75, 70, 90]
+], dtype=np.int16)
+_SAMPLE_EFFICIENCY.setflags(write=False)
+
+_SAMPLE_WORKERS = (
+    "Ali Khan", "Bilal Ahmed", "Chaudhry Imran", "Danish Malik",
+    "Ejaz Shah", "Farhan Raza", "Ghulam Abbas", "Hassan Javed",
+    "Irfan Siddiqui", "Junaid Tariq"
+)
+
+_SAMPLE_TASKS = (
+    "Mixing", "Heating", "Testing", "Packing", "Loading",
+    "QC", "Maintenance", "Docs", "Safety", "Dispatch"
+)
+
 
 class AssignmentView(ctk.CTkFrame):
     """
@@ -26,10 +52,16 @@ class AssignmentView(ctk.CTkFrame):
     - Load sample problem
     """
     
+    # Bits of _panel_flags marking which panels are shown
+    _INPUTS_PANEL = 1
+    _RESULTS_PANEL = 2
+    
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
         
         self.matrix_size = DEFAULT_MATRIX_SIZE
+        self._rng = np.random.default_rng()
+        self._last_solve_key = None
         
         self._create_layout()
         self._create_widgets()
@@ -60,11 +92,12 @@ class AssignmentView(ctk.CTkFrame):
         self.main_container.pack(fill="both", expand=True, padx=SPACING["sm"], pady=SPACING["sm"])
         
         # Track panel states
-        self.inputs_panel_visible = True
-        self.results_panel_visible = True
+        self._panel_flags = self._INPUTS_PANEL | self._RESULTS_PANEL
         self.inputs_popup = None
         self.results_popup = None
         self.last_result = None
+        self._last_fs_body = None
+        self._last_fs_result_id = None
         
         # Left panel container (inputs)
         self.left_container = ctk.CTkFrame(self.main_container, fg_color="transparent")
@@ -133,7 +166,7 @@ class AssignmentView(ctk.CTkFrame):
             self._bind_smooth_scroll(panel)
     
     def _bind_smooth_scroll(self, scrollable_frame):
-        """Bind smooth scroll events to a scrollable frame"""
+        """Bind smooth scroll events to a scrollable frame's canvas"""
         try:
             canvas = scrollable_frame._parent_canvas
             
@@ -145,20 +178,9 @@ class AssignmentView(ctk.CTkFrame):
                 canvas.yview_scroll(scroll_amount, "units")
                 return "break"
             
-            scrollable_frame.bind("<MouseWheel>", smooth_scroll, add="+")
-            scrollable_frame.bind("<Button-4>", smooth_scroll, add="+")
-            scrollable_frame.bind("<Button-5>", smooth_scroll, add="+")
-            canvas.bind("<MouseWheel>", smooth_scroll, add="+")
-            canvas.bind("<Button-4>", smooth_scroll, add="+")
-            canvas.bind("<Button-5>", smooth_scroll, add="+")
-            
-            def bind_children(widget):
-                widget.bind("<MouseWheel>", smooth_scroll, add="+")
-                widget.bind("<Button-4>", smooth_scroll, add="+")
-                widget.bind("<Button-5>", smooth_scroll, add="+")
-                for child in widget.winfo_children():
-                    bind_children(child)
-            bind_children(scrollable_frame)
+            # Child widgets fall through to CTkScrollableFrame's own wheel handling
+            for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                canvas.bind(sequence, smooth_scroll)
         except Exception:
             pass
     
@@ -181,7 +203,7 @@ class AssignmentView(ctk.CTkFrame):
         ctk.CTkLabel(
             title_frame,
             text="👥",
-            font=ctk.CTkFont(size=28)
+            font=get_font(28, family=None)
         ).pack(side="left", padx=(0, SPACING["sm"]))
         
         text_frame = ctk.CTkFrame(title_frame, fg_color="transparent")
@@ -190,14 +212,14 @@ class AssignmentView(ctk.CTkFrame):
         ctk.CTkLabel(
             text_frame,
             text="Assignment Problem",
-            font=ctk.CTkFont(family=FONTS["family"], size=22, weight="bold"),
+            font=get_font(22, "bold"),
             text_color="#FFFFFF"
         ).pack(anchor="w")
         
         ctk.CTkLabel(
             text_frame,
             text="Hungarian Algorithm Solver",
-            font=ctk.CTkFont(family=FONTS["family"], size=12),
+            font=get_font(12),
             text_color=COLORS["text_muted"]
         ).pack(anchor="w")
         
@@ -208,7 +230,7 @@ class AssignmentView(ctk.CTkFrame):
             command=self._load_sample,
             width=180,
             height=38,
-            font=ctk.CTkFont(family=FONTS["family"], size=13, weight="bold"),
+            font=get_font(13, "bold"),
             fg_color=COLORS["accent"],
             hover_color=COLORS["accent_hover"],
             corner_radius=8
@@ -233,7 +255,7 @@ class AssignmentView(ctk.CTkFrame):
         ctk.CTkLabel(
             card_header,
             text="⚙️  Configuration",
-            font=ctk.CTkFont(family=FONTS["family"], size=14, weight="bold"),
+            font=get_font(14, "bold"),
             text_color=COLORS["text_primary"]
         ).pack(side="left")
         
@@ -249,7 +271,7 @@ class AssignmentView(ctk.CTkFrame):
         ctk.CTkLabel(
             size_frame, 
             text="Matrix Size:",
-            font=ctk.CTkFont(family=FONTS["family"], size=13)
+            font=get_font(13)
         ).pack(side="left", padx=(0, SPACING["sm"]))
         
         self.rows_entry = ctk.CTkEntry(
@@ -265,7 +287,7 @@ class AssignmentView(ctk.CTkFrame):
         ctk.CTkLabel(
             size_frame, 
             text="×",
-            font=ctk.CTkFont(family=FONTS["family"], size=14, weight="bold")
+            font=get_font(14, "bold")
         ).pack(side="left", padx=SPACING["sm"])
         
         self.cols_entry = ctk.CTkEntry(
@@ -296,7 +318,7 @@ class AssignmentView(ctk.CTkFrame):
         ctk.CTkLabel(
             obj_frame, 
             text="Objective:",
-            font=ctk.CTkFont(family=FONTS["family"], size=13)
+            font=get_font(13)
         ).pack(side="left", padx=(0, SPACING["md"]))
         
         self.objective_var = ctk.StringVar(value="maximize")
@@ -305,7 +327,7 @@ class AssignmentView(ctk.CTkFrame):
             text="Maximize Efficiency",
             variable=self.objective_var,
             value="maximize",
-            font=ctk.CTkFont(family=FONTS["family"], size=13)
+            font=get_font(13)
         ).pack(side="left", padx=(0, SPACING["lg"]))
         
         ctk.CTkRadioButton(
@@ -313,7 +335,7 @@ class AssignmentView(ctk.CTkFrame):
             text="Minimize Cost",
             variable=self.objective_var,
             value="minimize",
-            font=ctk.CTkFont(family=FONTS["family"], size=13)
+            font=get_font(13)
         ).pack(side="left")
         
         # Tip section
@@ -323,7 +345,7 @@ class AssignmentView(ctk.CTkFrame):
         ctk.CTkLabel(
             tip_frame,
             text="💡 Tip: Enter efficiency scores (higher = better) or costs (lower = better)",
-            font=ctk.CTkFont(family=FONTS["family"], size=12),
+            font=get_font(12),
             text_color=COLORS["text_secondary"]
         ).pack(padx=SPACING["md"], pady=SPACING["sm"])
     
@@ -346,14 +368,14 @@ class AssignmentView(ctk.CTkFrame):
         ctk.CTkLabel(
             card_header,
             text="📊  Cost/Efficiency Matrix",
-            font=ctk.CTkFont(family=FONTS["family"], size=14, weight="bold"),
+            font=get_font(14, "bold"),
             text_color=COLORS["text_primary"]
         ).pack(side="left")
         
         ctk.CTkLabel(
             card_header,
             text="Workers × Tasks",
-            font=ctk.CTkFont(family=FONTS["family"], size=11),
+            font=get_font(11),
             text_color=COLORS["text_muted"]
         ).pack(side="right")
         
@@ -393,41 +415,28 @@ class AssignmentView(ctk.CTkFrame):
         btn_frame = ctk.CTkFrame(btn_card, fg_color="transparent")
         btn_frame.pack(fill="x", padx=SPACING["card_padding"], pady=SPACING["card_padding"])
         
-        ctk.CTkButton(
-            btn_frame,
-            text="🔍 Find Optimal Assignment",
-            command=self._solve,
-            width=200,
-            height=44,
-            font=ctk.CTkFont(family=FONTS["family"], size=14, weight="bold"),
-            fg_color=COLORS["primary"],
-            hover_color=COLORS["primary_dark"],
-            corner_radius=8
-        ).pack(side="left", padx=(0, SPACING["md"]))
-        
-        ctk.CTkButton(
-            btn_frame,
-            text="🗑️ Clear All",
-            command=self._clear,
-            width=130,
-            height=44,
-            font=ctk.CTkFont(family=FONTS["family"], size=13),
-            fg_color=COLORS["error"],
-            hover_color=COLORS["error_light"],
-            corner_radius=8
-        ).pack(side="left", padx=(0, SPACING["md"]))
-        
-        ctk.CTkButton(
-            btn_frame,
-            text="🎲 Random Data",
-            command=self._generate_random,
-            width=140,
-            height=44,
-            font=ctk.CTkFont(family=FONTS["family"], size=13),
-            fg_color="#9C27B0",
-            hover_color="#7B1FA2",
-            corner_radius=8
-        ).pack(side="left")
+        # (text, command, width, font, fg, hover) for each action
+        buttons = [
+            ("🔍 Find Optimal Assignment", self._solve, 200, get_font(14, "bold"),
+             COLORS["primary"], COLORS["primary_dark"]),
+            ("🗑️ Clear All", self._clear, 130, get_font(13),
+             COLORS["error"], COLORS["error_light"]),
+            ("🎲 Random Data", self._generate_random, 140, get_font(13),
+             "#9C27B0", "#7B1FA2"),
+        ]
+        
+        for col, (text, command, width, font, fg, hover) in enumerate(buttons):
+            ctk.CTkButton(
+                btn_frame,
+                text=text,
+                command=command,
+                width=width,
+                height=44,
+                font=font,
+                fg_color=fg,
+                hover_color=hover,
+                corner_radius=8
+            ).grid(row=0, column=col, padx=(0, SPACING["md"] if col < len(buttons) - 1 else 0))
     
     def _create_results_panel(self):
         """Create the results display panel with improved spacing"""
@@ -438,10 +447,19 @@ class AssignmentView(ctk.CTkFrame):
         ctk.CTkLabel(
             header_frame,
             text="📊  Results",
-            font=ctk.CTkFont(family=FONTS["family"], size=16, weight="bold"),
+            font=get_font(16, "bold"),
             text_color=COLORS["text_primary"]
         ).pack(side="left")
         
+        # Result widgets are built on the first solve
+        self.result_display = None
+        self.allocation_display = None
+    
+    def _ensure_results_widgets(self):
+        """Create the result display widgets if they do not exist yet"""
+        if self.result_display is not None:
+            return
+        
         # Result display
         self.result_display = ResultDisplay(
             self.right_panel,
@@ -458,30 +476,9 @@ class AssignmentView(ctk.CTkFrame):
     
     def _load_sample(self):
         """Load sample TBLP worker assignment"""
-        # Sample efficiency matrix
-        efficiency_matrix = np.array([
-            [85, 70, 65, 80, 75, 90, 60, 50, 70, 65],
-            [75, 85, 70, 65, 80, 75, 70, 60, 65, 70],
-            [80, 75, 90, 70, 65, 80, 75, 55, 80, 60],
-            [65, 80, 75, 90, 70, 65, 80, 70, 75, 80],
-            [70, 65, 80, 75, 90, 70, 65, 75, 60, 85],
-            [90, 75, 70, 65, 80, 85, 70, 80, 65, 70],
-            [60, 90, 65, 80, 75, 70, 95, 65, 80, 75],
-            [55, 65, 80, 70, 85, 75, 70, 90, 70, 80],
-            [75, 70, 85, 75, 70, 80, 75, 70, 95, 65],
-            [70, 75, 60, 85, 80, 70, 80, 75, 70, 90]
-        ])
-        
-        self.matrix_input.set_matrix(efficiency_matrix)
-        self.matrix_input.set_row_headers([
-            "Ali Khan", "Bilal Ahmed", "Chaudhry Imran", "Danish Malik",
-            "Ejaz Shah", "Farhan Raza", "Ghulam Abbas", "Hassan Javed",
-            "Irfan Siddiqui", "Junaid Tariq"
-        ])
-        self.matrix_input.set_col_headers([
-            "Mixing", "Heating", "Testing", "Packing", "Loading",
-            "QC", "Maintenance", "Docs", "Safety", "Dispatch"
-        ])
+        self.matrix_input.set_matrix(_SAMPLE_EFFICIENCY)
+        self.matrix_input.set_row_headers(list(_SAMPLE_WORKERS))
+        self.matrix_input.set_col_headers(list(_SAMPLE_TASKS))
         
         self.objective_var.set("maximize")
     
@@ -494,6 +491,10 @@ class AssignmentView(ctk.CTkFrame):
             if new_rows < 1 or new_cols < 1:
                 return
             
+            # Skip a rebuild when the size is unchanged
+            if (new_rows, new_cols) == (self.matrix_input.rows, self.matrix_input.cols):
+                return
+            
             self.matrix_size = max(new_rows, new_cols)
             self.matrix_input.resize(new_rows, new_cols)
             
@@ -502,18 +503,28 @@ class AssignmentView(ctk.CTkFrame):
     
     def _generate_random(self):
         """Generate random matrix data"""
-        matrix = np.random.randint(10, 100, (self.matrix_size, self.matrix_size))
+        matrix = self._rng.integers(10, 100, (self.matrix_size, self.matrix_size), dtype=np.int32)
         self.matrix_input.set_matrix(matrix)
     
     def _solve(self):
         """Solve the assignment problem"""
+        # Imported here so SciPy loads on the first solve, not at window start-up
+        from algorithms.assignment import AssignmentSolver
+        
+        self._ensure_results_widgets()
+        
         try:
             # Get input data
-            cost_matrix = self.matrix_input.get_matrix()
+            cost_matrix = np.ascontiguousarray(self.matrix_input.get_matrix(), dtype=np.float64)
             maximize = self.objective_var.get() == "maximize"
             row_names = self.matrix_input.get_row_headers()
             col_names = self.matrix_input.get_col_headers()
             
+            # The displayed result is still current if nothing changed since the last solve
+            solve_key = (cost_matrix.shape, cost_matrix.tobytes(), maximize, tuple(row_names), tuple(col_names))
+            if self.last_result is not None and solve_key == self._last_solve_key:
+                return
+            
             # Create and solve
             solver = AssignmentSolver(
                 cost_matrix=cost_matrix,
@@ -526,6 +537,7 @@ class AssignmentView(ctk.CTkFrame):
             
             # Store for fullscreen display
             self.last_result = result
+            self._last_fs_result_id = None
             self.last_row_names = row_names
             self.last_col_names = col_names
             self.last_cost_matrix = cost_matrix
@@ -556,51 +568,62 @@ class AssignmentView(ctk.CTkFrame):
                     highlight_nonzero=True
                 )
             
+            self._last_solve_key = solve_key
+            
         except Exception as e:
             self.result_display.set_status(False, f"Error: {str(e)}")
     
     def _clear(self):
         """Clear all inputs and results"""
         self.matrix_input.clear()
-        self.result_display.clear()
-        self.allocation_display.clear()
+        if self.result_display is not None:
+            self.result_display.clear()
+            self.allocation_display.clear()
         self.last_result = None
+        self._last_fs_result_id = None
+        self._last_solve_key = None
     
     def _toggle_inputs_panel(self, visible=None):
         """Toggle the visibility of the Inputs panel"""
-        if visible is None:
-            visible = not self.inputs_panel_visible
+        flags = self._panel_flags
+        new_flags = self._set_panel_flag(flags, self._INPUTS_PANEL, visible)
         
-        if visible:
-            if not self.inputs_panel_visible:
+        if new_flags != flags:
+            if new_flags & self._INPUTS_PANEL:
                 self.left_container.pack(side="left", fill="both", expand=True, padx=(0, SPACING["md"]), pady=0, before=self.right_container)
-                self.inputs_panel_visible = True
-        else:
-            if self.inputs_panel_visible:
+            else:
                 self.left_container.pack_forget()
-                self.inputs_panel_visible = False
+            self._panel_flags = new_flags
         
-        self.panel_toggles.set_visible("inputs", visible)
+        self.panel_toggles.set_visible("inputs", bool(new_flags & self._INPUTS_PANEL))
     
     def _toggle_results_panel(self, visible=None):
         """Toggle the visibility of the Results panel"""
-        if visible is None:
-            visible = not self.results_panel_visible
+        flags = self._panel_flags
+        new_flags = self._set_panel_flag(flags, self._RESULTS_PANEL, visible)
         
-        if visible:
-            if not self.results_panel_visible:
+        if new_flags != flags:
+            if new_flags & self._RESULTS_PANEL:
                 self.right_container.pack(side="right", fill="both", expand=True, padx=0, pady=0)
-                self.results_panel_visible = True
-        else:
-            if self.results_panel_visible:
+            else:
                 self.right_container.pack_forget()
-                self.results_panel_visible = False
+            self._panel_flags = new_flags
         
-        self.panel_toggles.set_visible("results", visible)
+        self.panel_toggles.set_visible("results", bool(new_flags & self._RESULTS_PANEL))
+    
+    @staticmethod
+    def _set_panel_flag(flags: int, bit: int, visible=None) -> int:
+        """Return flags with a panel bit flipped (visible=None), set or cleared"""
+        if visible is None:
+            return flags ^ bit
+        return flags | bit if visible else flags & ~bit
     
     def _fullscreen_inputs(self):
         """Open inputs panel in fullscreen window"""
         if self.inputs_popup:
+            # Reuse the hidden window, refreshing the summary only if the inputs changed
+            self.inputs_popup.deiconify()
+            self._refresh_matrix_summary()
             self.inputs_popup.lift()
             self.inputs_popup.focus()
             return
@@ -618,69 +641,77 @@ class AssignmentView(ctk.CTkFrame):
         ctk.CTkLabel(
             body,
             text="💡 Fullscreen view of the assignment matrix. Edit in main window.",
-            font=ctk.CTkFont(family=FONTS["family"], size=12),
+            font=get_font(12),
             text_color=COLORS["text_secondary"]
         ).pack(pady=SPACING["md"])
         
         # Display matrix summary
         self._display_matrix_summary(body)
+        self._refresh_matrix_summary()
     
     def _display_matrix_summary(self, parent):
-        """Display matrix content in fullscreen"""
+        """Create the fullscreen matrix card with an empty summary textbox"""
+        # Matrix card
+        matrix_card = ctk.CTkFrame(parent, fg_color=COLORS["surface"], corner_radius=10)
+        matrix_card.pack(fill="both", expand=True, padx=SPACING["md"], pady=SPACING["sm"])
+        
+        ctk.CTkLabel(
+            matrix_card,
+            text="📊 Cost/Efficiency Matrix",
+            font=get_font(16, "bold"),
+            text_color=COLORS["text_primary"]
+        ).pack(anchor="w", padx=SPACING["md"], pady=SPACING["sm"])
+        
+        self._summary_textbox = ctk.CTkTextbox(
+            matrix_card,
+            font=get_font(12, family=FONTS["family_mono"]),
+            text_color=COLORS["text_primary"],
+            fg_color=COLORS["background"],
+            wrap="none"
+        )
+        self._summary_textbox.pack(fill="both", expand=True, padx=SPACING["md"], pady=SPACING["sm"])
+        self._summary_key = None
+    
+    def _refresh_matrix_summary(self):
+        """Render the matrix as preformatted text in the summary textbox"""
         try:
             matrix = self.matrix_input.get_matrix()
             row_headers = self.matrix_input.get_row_headers()
             col_headers = self.matrix_input.get_col_headers()
             
-            # Matrix card
-            matrix_card = ctk.CTkFrame(parent, fg_color=COLORS["surface"], corner_radius=10)
-            matrix_card.pack(fill="both", expand=True, padx=SPACING["md"], pady=SPACING["sm"])
-            
-            ctk.CTkLabel(
-                matrix_card,
-                text="📊 Cost/Efficiency Matrix",
-                font=ctk.CTkFont(family=FONTS["family"], size=16, weight="bold"),
-                text_color=COLORS["text_primary"]
-            ).pack(anchor="w", padx=SPACING["md"], pady=SPACING["sm"])
-            
-            # Display matrix as grid
-            grid_frame = ctk.CTkFrame(matrix_card, fg_color="transparent")
-            grid_frame.pack(fill="both", expand=True, padx=SPACING["md"], pady=SPACING["sm"])
+            key = (matrix.shape, matrix.tobytes(), tuple(row_headers), tuple(col_headers))
+            if key == self._summary_key:
+                return
             
-            # Header row
-            header_row = ctk.CTkFrame(grid_frame, fg_color=COLORS["primary"])
-            header_row.pack(fill="x", pady=2)
+            # Truncate and pad the headers once, outside the row loop
+            row_labels = [f"{str(name)[:15]:<15}" for name in row_headers]
+            col_labels = [f"{str(col)[:12]:>13}" for col in col_headers]
             
-            ctk.CTkLabel(header_row, text="Worker / Task", width=120, text_color="#FFFFFF", 
-                        font=ctk.CTkFont(family=FONTS["family"], size=11, weight="bold")).pack(side="left", padx=2)
-            for j, col in enumerate(col_headers[:10]):
-                ctk.CTkLabel(header_row, text=str(col)[:12], width=80, text_color="#FFFFFF",
-                            font=ctk.CTkFont(family=FONTS["family"], size=10)).pack(side="left", padx=2)
+            header = f"{'Worker / Task':<15}" + "".join(col_labels)
+            lines = [header, "-" * len(header)]
+            formatted = np.char.mod("%13.0f", matrix)
+            for label, row in zip(row_labels, formatted):
+                lines.append(label + "".join(row))
             
-            # Data rows
-            for i in range(min(len(matrix), 10)):
-                row_frame = ctk.CTkFrame(grid_frame, fg_color=COLORS["background"] if i % 2 == 0 else COLORS["surface"])
-                row_frame.pack(fill="x", pady=1)
-                
-                ctk.CTkLabel(row_frame, text=str(row_headers[i])[:15], width=120,
-                            font=ctk.CTkFont(family=FONTS["family"], size=11, weight="bold"),
-                            text_color=COLORS["text_primary"]).pack(side="left", padx=2)
-                for j in range(min(len(matrix[i]), 10)):
-                    ctk.CTkLabel(row_frame, text=f"{matrix[i][j]:.0f}", width=80,
-                                font=ctk.CTkFont(family=FONTS["family"], size=10),
-                                text_color=COLORS["text_secondary"]).pack(side="left", padx=2)
+            textbox = self._summary_textbox
+            textbox.configure(state="normal")
+            textbox.delete("1.0", "end")
+            textbox.insert("1.0", "\n".join(lines))
+            textbox.configure(state="disabled")
+            self._summary_key = key
         except:
             pass
     
     def _close_inputs_popup(self):
-        """Close inputs fullscreen popup"""
+        """Hide the inputs fullscreen popup so it can be reused"""
         if self.inputs_popup:
-            self.inputs_popup.destroy()
-            self.inputs_popup = None
+            self.inputs_popup.withdraw()
     
     def _fullscreen_results(self):
         """Open results panel in fullscreen window"""
         if self.results_popup:
+            self.results_popup.deiconify()
+            self._render_results_body()
             self.results_popup.lift()
             self.results_popup.focus()
             return
@@ -693,7 +724,20 @@ class AssignmentView(ctk.CTkFrame):
         )
         self.results_popup.protocol("WM_DELETE_WINDOW", self._close_results_popup)
         
-        body = self.results_popup.body_frame
+        self._render_results_body()
+    
+    def _render_results_body(self):
+        """Fill the results popup, keeping the rendered body while the result is unchanged"""
+        result_id = id(self.last_result)
+        body = self._last_fs_body
+        
+        if body is not None and body.winfo_exists():
+            if self._last_fs_result_id == result_id:
+                return
+            body.destroy()
+        
+        body = ctk.CTkFrame(self.results_popup.body_frame, fg_color="transparent")
+        body.pack(fill="both", expand=True)
         
         if self.last_result and self.last_result.success:
             self._display_results_fullscreen(body)
@@ -701,9 +745,12 @@ class AssignmentView(ctk.CTkFrame):
             ctk.CTkLabel(
                 body,
                 text="⚠️ No solution available. Solve a problem first.",
-                font=ctk.CTkFont(family=FONTS["family"], size=16),
+                font=get_font(16),
                 text_color=COLORS["warning"]
             ).pack(pady=SPACING["xl"])
+        
+        self._last_fs_body = body
+        self._last_fs_result_id = result_id
     
     def _display_results_fullscreen(self, parent):
         """Display assignment results in fullscreen"""
@@ -718,7 +765,7 @@ class AssignmentView(ctk.CTkFrame):
         ctk.CTkLabel(
             summary_card,
             text=f"✓ Optimal {label}: {result.total_cost:,.2f}",
-            font=ctk.CTkFont(family=FONTS["family"], size=24, weight="bold"),
+            font=get_font(24, "bold"),
             text_color="#FFFFFF"
         ).pack(padx=SPACING["lg"], pady=SPACING["lg"])
         
@@ -729,43 +776,50 @@ class AssignmentView(ctk.CTkFrame):
         ctk.CTkLabel(
             assign_card,
             text="👥 Optimal Assignments",
-            font=ctk.CTkFont(family=FONTS["family"], size=16, weight="bold"),
+            font=get_font(16, "bold"),
             text_color=COLORS["text_primary"]
         ).pack(anchor="w", padx=SPACING["md"], pady=SPACING["sm"])
         
+        # Resolve names and costs for all assignments up front
+        row_names = getattr(self, 'last_row_names', None)
+        col_names = getattr(self, 'last_col_names', None)
+        pairs = np.asarray(result.assignments, dtype=int).reshape(-1, 2)
+        workers, tasks = pairs[:, 0], pairs[:, 1]
+        
+        worker_names = (np.asarray(row_names, dtype=object)[workers] if row_names
+                        else [f"Worker {w + 1}" for w in workers.tolist()])
+        task_names = (np.asarray(col_names, dtype=object)[tasks] if col_names
+                      else [f"Task {t + 1}" for t in tasks.tolist()])
+        costs = self.last_cost_matrix[workers, tasks].tolist()
+        
         # List assignments
-        for i, (worker, task) in enumerate(result.assignments):
-            worker_name = self.last_row_names[worker] if hasattr(self, 'last_row_names') else f"Worker {worker+1}"
-            task_name = self.last_col_names[task] if hasattr(self, 'last_col_names') else f"Task {task+1}"
-            cost = result.individual_costs[i] if i < len(result.individual_costs) else 0
-            
+        for worker_name, task_name, cost in zip(worker_names, task_names, costs):
             item = ctk.CTkFrame(assign_card, fg_color=COLORS["background"], corner_radius=8)
             item.pack(fill="x", padx=SPACING["md"], pady=3)
             
             ctk.CTkLabel(
                 item,
                 text=f"➜ {worker_name}",
-                font=ctk.CTkFont(family=FONTS["family"], size=13, weight="bold"),
+                font=get_font(13, "bold"),
                 text_color=COLORS["text_primary"]
             ).pack(side="left", padx=SPACING["md"], pady=SPACING["sm"])
             
             ctk.CTkLabel(
                 item,
                 text=f"→ {task_name}",
-                font=ctk.CTkFont(family=FONTS["family"], size=13),
+                font=get_font(13),
                 text_color=COLORS["secondary"]
             ).pack(side="left", padx=SPACING["sm"])
             
             ctk.CTkLabel(
                 item,
                 text=f"({cost:,.0f})",
-                font=ctk.CTkFont(family=FONTS["family"], size=12),
+                font=get_font(12),
                 text_color=COLORS["accent"]
             ).pack(side="right", padx=SPACING["md"])
     
     def _close_results_popup(self):
-        """Close results fullscreen popup"""
+        """Hide the results fullscreen popup so it can be reused"""
         if self.results_popup:
-            self.results_popup.destroy()
-            self.results_popup = None
+            self.results_popup.withdraw()
 
@@ -0,0 +1,50 @@
+"""
+Emoji Icons
+Emoji pre-rendered to images, so labels show a bitmap instead of drawing a color glyph
+"""
+
+import customtkinter as ctk
+from functools import lru_cache
+from typing import Optional
+
+# Pillow is optional; without it callers fall back to plain emoji text
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:
+    Image = None
+
+# Color emoji fonts to try, with the pixel size each one renders at
+_EMOJI_FONTS = (
+    ("seguiemj.ttf", 64),           # Windows (Segoe UI Emoji)
+    ("NotoColorEmoji.ttf", 109),    # Linux; bitmap font with a single size
+)
+
+
+@lru_cache(maxsize=1)
+def _emoji_font():
+    """Load the first available color emoji font, or None"""
+    if Image is None:
+        return None
+    for name, size in _EMOJI_FONTS:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return None
+
+
+@lru_cache(maxsize=None)
+def emoji_icon(emoji: str, size: int) -> Optional[ctk.CTkImage]:
+    """Return the emoji as a size x size CTkImage, or None if it cannot be rendered"""
+    font = _emoji_font()
+    if font is None:
+        return None
+
+    image = Image.new("RGBA", (font.size * 2, font.size * 2), (0, 0, 0, 0))
+    ImageDraw.Draw(image).text((0, 0), emoji, font=font, embedded_color=True)
+    bbox = image.getbbox()
+    if bbox is None:
+        return None
+
+    image = image.crop(bbox)
+    return ctk.CTkImage(light_image=image, dark_image=image, size=(size, size))
@@ -4,10 +4,13 @@ A scrollable, editable grid for entering matrices
 """
 
 import customtkinter as ctk
+import math
 import tkinter as tk
-from typing import List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Tuple
 import numpy as np
 
+from ui.components.theme import get_font, resolve_color, track_appearance_mode
+
 # Try to import COLORS, fallback to defaults if not available
 try:
     from config.settings import COLORS, FONTS
@@ -21,6 +24,27 @@ except ImportError:
     FONTS = {"family": "Segoe UI"}
 
 
+# Tcl lambda setting the text of many canvas items in a single interpreter call
+_SET_ITEM_TEXTS = "{canvas ids texts} {foreach id $ids text $texts {$canvas itemconfigure $id -text $text}}"
+
+# Tcl lambda assigning many global variables in a single interpreter call
+_SET_VARIABLES = "{names values} {foreach name $names value $values {set ::$name $value}}"
+
+
+def _auto_labels(prefix: str, start: int, stop: int) -> List[str]:
+    """Default names for indices start..stop-1, numbered from 1 (e.g. "R1", "R2")"""
+    template = prefix + "%d"
+    return [template % n for n in range(start + 1, stop + 1)]
+
+
+def _to_float(text: str) -> float:
+    """Parse a cell's text, treating invalid input as 0"""
+    try:
+        return float(text)
+    except ValueError:
+        return 0.0
+
+
 class ScrollableFrame(ctk.CTkFrame):
     """
     A frame that supports both horizontal and vertical scrolling.
@@ -28,17 +52,23 @@ class ScrollableFrame(ctk.CTkFrame):
     Supports trackpad gestures on Windows.
     """
     
-    def __init__(self, parent, width=800, height=400, **kwargs):
+    _WHEEL_SEQUENCES = ("<MouseWheel>", "<Shift-MouseWheel>")
+    
+    def __init__(self, parent, width=800, height=400, inner_frame=True, **kwargs):
         super().__init__(parent, corner_radius=10, **kwargs)
         
+        # Global wheel bindings replaced while the pointer is over the canvas
+        self._saved_wheel_bindings = None
+        
+        # Pending scroll region update, and whether updates are held during a bulk build
+        self._bbox_job = None
+        self._bbox_suspended = False
+        
         # Store parent reference
         self._parent = parent
         
         # Get background color for canvas
-        try:
-            bg_color = self._apply_appearance_mode(self._fg_color)
-        except:
-            bg_color = "#FFFFFF"
+        bg_color = self._canvas_color(ctk.get_appearance_mode())
         
         # Create canvas with modern styling
         self.canvas = tk.Canvas(
@@ -72,49 +102,113 @@ class ScrollableFrame(ctk.CTkFrame):
         self.h_scrollbar.pack(side="bottom", fill="x", padx=2, pady=(5, 2))
         self.canvas.pack(side="left", fill="both", expand=True, padx=2, pady=2)
         
-        # Inner frame for content with transparent background
-        self.inner_frame = ctk.CTkFrame(self.canvas, fg_color="transparent")
-        self.canvas_window = self.canvas.create_window((0, 0), window=self.inner_frame, anchor="nw")
+        # Inner frame for content, a plain tk.Frame in the canvas color since a CTkFrame
+        # redraws itself on every resize; callers that draw directly on the canvas
+        # skip it and manage the scrollregion themselves
+        if inner_frame:
+            self.inner_frame = tk.Frame(self.canvas, bg=bg_color, bd=0, highlightthickness=0)
+            self.canvas_window = self.canvas.create_window((0, 0), window=self.inner_frame, anchor="nw")
+            self.inner_frame.bind("<Configure>", self._on_frame_configure)
+            self.inner_frame.bind("<MouseWheel>", self._on_mousewheel)
+            self.inner_frame.bind("<Shift-MouseWheel>", self._on_shift_mousewheel)
+        else:
+            self.inner_frame = None
         
         # Bind events
-        self.inner_frame.bind("<Configure>", self._on_frame_configure)
         self.canvas.bind("<Configure>", self._on_canvas_configure)
         
         # Bind mouse wheel for this specific canvas (not global)
         self.canvas.bind("<MouseWheel>", self._on_mousewheel)
         self.canvas.bind("<Shift-MouseWheel>", self._on_shift_mousewheel)
-        self.inner_frame.bind("<MouseWheel>", self._on_mousewheel)
-        self.inner_frame.bind("<Shift-MouseWheel>", self._on_shift_mousewheel)
         
         # Bind trackpad/touchpad gestures for Windows
         # These events handle two-finger scrolling on trackpads
         self.canvas.bind("<Button-4>", self._on_scroll_up)      # Linux scroll up
         self.canvas.bind("<Button-5>", self._on_scroll_down)    # Linux scroll down
         
-        # Bind enter/leave to manage scroll focus
+        # Bind enter/leave to manage scroll focus; a canvas destroyed under the
+        # pointer never sees <Leave>, so restore the bindings on destroy too
         self.canvas.bind("<Enter>", self._bind_scroll)
         self.canvas.bind("<Leave>", self._unbind_scroll)
+        self.canvas.bind("<Destroy>", self._restore_wheel_bindings, add="+")
         
         # Set initial size
         self.canvas.configure(width=width, height=height)
+        
+        track_appearance_mode(self, self._on_appearance_change)
+    
+    def _canvas_color(self, mode: str) -> str:
+        """The frame's own color for an appearance mode, used behind the scrolled content"""
+        fg_color = self._fg_color
+        if isinstance(fg_color, list):
+            fg_color = tuple(fg_color)
+        return resolve_color(fg_color, mode)
+    
+    def _on_appearance_change(self, mode: str):
+        """Recolor the canvas and the inner frame for a new appearance mode"""
+        bg_color = self._canvas_color(mode)
+        self.canvas.configure(bg=bg_color)
+        if self.inner_frame is not None:
+            self.inner_frame.configure(bg=bg_color)
     
     def _bind_scroll(self, event):
-        """Bind scroll events when mouse enters this widget"""
+        """Route wheel events to this canvas while the pointer is over it"""
+        if self._saved_wheel_bindings is not None:
+            return
+        
+        # Remember the global bindings (e.g. CTkScrollableFrame's) to restore on leave
+        self._saved_wheel_bindings = {
+            sequence: self.canvas.bind_all(sequence) for sequence in self._WHEEL_SEQUENCES
+        }
         self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
         self.canvas.bind_all("<Shift-MouseWheel>", self._on_shift_mousewheel)
     
     def _unbind_scroll(self, event):
-        """Unbind scroll events when mouse leaves this widget"""
+        """Restore the previous global wheel bindings once the pointer leaves the canvas"""
+        if self._saved_wheel_bindings is None:
+            return
+        
+        # Moving onto a widget embedded in the canvas also fires <Leave>
         try:
-            self.canvas.unbind_all("<MouseWheel>")
-            self.canvas.unbind_all("<Shift-MouseWheel>")
-        except:
+            widget = self.winfo_containing(event.x_root, event.y_root)
+            if widget is not None and str(widget).startswith(str(self.canvas)):
+                return
+        except (KeyError, tk.TclError):
             pass
+        
+        self._restore_wheel_bindings()
+    
+    def _restore_wheel_bindings(self, event=None):
+        """Put back the global wheel bindings saved on enter, if any"""
+        if self._saved_wheel_bindings is None:
+            return
+        for sequence, script in self._saved_wheel_bindings.items():
+            self.canvas.tk.call("bind", "all", sequence, script)
+        self._saved_wheel_bindings = None
     
     def _on_frame_configure(self, event):
-        """Update scroll region when inner frame size changes"""
+        """Update scroll region when inner frame size changes, at most once per idle cycle"""
+        if self._bbox_suspended or self._bbox_job is not None:
+            return
+        self._bbox_job = self.canvas.after_idle(self._flush_bbox)
+    
+    def _flush_bbox(self):
+        """Fit the scroll region to the canvas contents"""
+        self._bbox_job = None
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
     
+    def _suspend_bbox(self):
+        """Stop tracking the content size while many widgets are added"""
+        self._bbox_suspended = True
+    
+    def _resume_bbox(self, width: Optional[int] = None, height: Optional[int] = None):
+        """Resume tracking, using the content size directly when the caller knows it"""
+        self._bbox_suspended = False
+        if width is not None and height is not None:
+            self.canvas.configure(scrollregion=(0, 0, width, height))
+        elif self._bbox_job is None:
+            self._bbox_job = self.canvas.after_idle(self._flush_bbox)
+    
     def _on_canvas_configure(self, event):
         """Handle canvas resize"""
         pass
@@ -172,6 +266,9 @@ class MatrixInput(ctk.CTkFrame):
     """
     A scrollable matrix input widget for entering 2D data
     
+    The grid is drawn as rectangles and text on a single canvas; one shared
+    entry is floated over a cell while it is being edited.
+    
     Features:
     - Dynamic row/column sizing
     - Custom row and column headers
@@ -179,6 +276,16 @@ class MatrixInput(ctk.CTkFrame):
     - Get/set matrix values
     """
     
+    # (light, dark) colors for the canvas-drawn cells
+    CELL_FILL = ("#F9F9FA", "#343638")
+    CELL_OUTLINE = ("#979DA2", "#565B5E")
+    HEADER_FILL = ("gray80", "gray30")
+    TEXT_COLOR = ("black", "white")
+    
+    # Fonts shared by every MatrixInput, created on first use
+    _BOLD_FONT: Optional[ctk.CTkFont] = None
+    _CELL_FONT: Optional[ctk.CTkFont] = None
+    
     def __init__(
         self,
         parent,
@@ -219,187 +326,343 @@ class MatrixInput(ctk.CTkFrame):
         self.on_change = on_change
         
         # Initialize headers
-        self.row_headers = row_headers or [f"R{i+1}" for i in range(rows)]
-        self.col_headers = col_headers or [f"C{j+1}" for j in range(cols)]
+        self.row_headers = list(row_headers or _auto_labels("R", 0, rows))
+        self.col_headers = list(col_headers or _auto_labels("C", 0, cols))
+        self._compute_display_headers()
         
-        # Storage for entry widgets
-        self.cells: List[List[ctk.CTkEntry]] = []
-        self.row_header_entries: List[ctk.CTkEntry] = []
-        self.col_header_entries: List[ctk.CTkEntry] = []
+        # Parsed cell values, the texts of cells that differ from the default,
+        # and the canvas ids drawing each cell (0 = not drawn)
+        self._default_float = _to_float(default_value)
+        self._values = np.full((rows, cols), self._default_float, dtype=np.float64)
+        self._texts: Dict[Tuple[int, int], str] = {}
+        self.cell_items = np.zeros((rows, cols), dtype=np.int64)
+        self.cell_rects = np.zeros((rows, cols), dtype=np.int64)
+        self.row_header_items: List[int] = []
+        self.col_header_items: List[int] = []
+        
+        # (grid row, grid column) of the cell being edited, 0 being the header
+        self._editing = None
+        self._edit_window = None
+        self._on_change_pending: Optional[str] = None
+        
+        # Colors of highlighted cells, reapplied when the appearance mode changes
+        self._highlights: Dict[Tuple[int, int], str] = {}
+        
+        # Widget scaling the drawn geometry and fonts were computed for
+        self._scaling = None
         
         self._create_widgets()
     
     def _create_widgets(self):
-        """Create the matrix grid widgets"""
-        # Create scrollable frame with both horizontal and vertical scrolling
-        self.scroll_container = ScrollableFrame(
-            self,
-            width=min(750, (self.cols + 1) * self.cell_width + 60),
-            height=min(450, (self.rows + 1) * self.cell_height + 60)
-        )
+        """Create the canvas, the shared edit entry and the drawn grid"""
+        # Scrollable canvas without an embedded frame; the grid is drawn on it directly
+        self._apply_scaling()
+        width, height = self._viewport_size()
+        self.scroll_container = ScrollableFrame(self, width=width, height=height, inner_frame=False)
         self.scroll_container.pack(fill="both", expand=True, padx=5, pady=5)
+        self.canvas = self.scroll_container.canvas
         
-        # Get the inner frame for placing widgets
-        self.scroll_frame = self.scroll_container.get_inner_frame()
-        
-        # Create corner cell (empty)
-        corner = ctk.CTkLabel(
-            self.scroll_frame,
-            text="",
+        # Single entry reused for whichever cell is being edited
+        self._edit_var = tk.StringVar()
+        self._edit_entry = ctk.CTkEntry(
+            self.canvas,
             width=self.cell_width,
-            height=self.cell_height
+            height=self.cell_height,
+            justify="center",
+            textvariable=self._edit_var
         )
-        corner.grid(row=0, column=0, padx=1, pady=1)
-        
-        # Create column headers
-        for j, header in enumerate(self.col_headers):
-            if self.editable_headers:
-                entry = ctk.CTkEntry(
-                    self.scroll_frame,
-                    width=self.cell_width,
-                    height=self.cell_height,
-                    justify="center"
-                )
-                entry.insert(0, header)
-                entry.grid(row=0, column=j+1, padx=1, pady=1)
-                self.col_header_entries.append(entry)
-            else:
-                label = ctk.CTkLabel(
-                    self.scroll_frame,
-                    text=header[:10],
-                    width=self.cell_width,
-                    height=self.cell_height,
-                    font=ctk.CTkFont(weight="bold"),
-                    fg_color=("gray80", "gray30"),
-                    corner_radius=5
-                )
-                label.grid(row=0, column=j+1, padx=1, pady=1)
-        
-        # Create rows with headers and cells
-        for i in range(self.rows):
-            row_cells = []
-            
-            # Row header
-            if self.editable_headers:
-                entry = ctk.CTkEntry(
-                    self.scroll_frame,
-                    width=self.cell_width,
-                    height=self.cell_height,
-                    justify="center"
-                )
-                entry.insert(0, self.row_headers[i] if i < len(self.row_headers) else f"R{i+1}")
-                entry.grid(row=i+1, column=0, padx=1, pady=1)
-                self.row_header_entries.append(entry)
-            else:
-                label = ctk.CTkLabel(
-                    self.scroll_frame,
-                    text=self.row_headers[i][:12] if i < len(self.row_headers) else f"R{i+1}",
-                    width=self.cell_width,
-                    height=self.cell_height,
-                    font=ctk.CTkFont(weight="bold"),
-                    fg_color=("gray80", "gray30"),
-                    corner_radius=5
-                )
-                label.grid(row=i+1, column=0, padx=1, pady=1)
-            
-            # Data cells
-            for j in range(self.cols):
-                entry = ctk.CTkEntry(
-                    self.scroll_frame,
-                    width=self.cell_width,
-                    height=self.cell_height,
-                    justify="center"
-                )
-                entry.insert(0, self.default_value)
-                entry.grid(row=i+1, column=j+1, padx=1, pady=1)
-                
-                if self.on_change:
-                    entry.bind("<KeyRelease>", lambda e: self.on_change())
-                
-                row_cells.append(entry)
-            
-            self.cells.append(row_cells)
-    
-    def _recreate_grid_widgets(self):
-        """Recreate only the grid widgets (used by resize)"""
-        # Create corner cell (empty)
-        corner = ctk.CTkLabel(
-            self.scroll_frame,
-            text="",
-            width=self.cell_width,
-            height=self.cell_height
+        self._edit_var.trace_add("write", self._on_edit_write)
+        self._edit_entry.bind("<Return>", self._end_edit)
+        self._edit_entry.bind("<Escape>", self._end_edit)
+        self._edit_entry.bind("<FocusOut>", self._end_edit)
+        self._edit_entry.bind("<Tab>", self._edit_next)
+        
+        self.canvas.bind("<Button-1>", self._on_canvas_click)
+        
+        # Draw cells lazily as the view scrolls or the canvas is resized
+        self._realize_job = None
+        self.canvas.configure(xscrollcommand=self._on_xview, yscrollcommand=self._on_yview)
+        self.canvas.bind("<Configure>", lambda e: self._schedule_realize(), add="+")
+        
+        self._draw_grid()
+        track_appearance_mode(self, self._on_appearance_change)
+    
+    @classmethod
+    def _get_bold_font(cls) -> ctk.CTkFont:
+        """Return the shared bold header font"""
+        if cls._BOLD_FONT is None:
+            cls._BOLD_FONT = ctk.CTkFont(weight="bold")
+        return cls._BOLD_FONT
+    
+    @classmethod
+    def _get_cell_font(cls) -> ctk.CTkFont:
+        """Return the shared cell font"""
+        if cls._CELL_FONT is None:
+            cls._CELL_FONT = ctk.CTkFont()
+        return cls._CELL_FONT
+    
+    @staticmethod
+    def _color(color):
+        """Resolve a (light, dark) color pair for the current appearance mode"""
+        return resolve_color(color, ctk.get_appearance_mode())
+    
+    def _scaled(self, value: float) -> int:
+        """Screen pixels of a CTk size at the widget's current scaling, rounded up"""
+        return math.ceil(value * ctk.ScalingTracker.get_widget_scaling(self))
+    
+    def _apply_scaling(self) -> bool:
+        """Recompute the cell geometry and canvas fonts for the current widget scaling
+        
+        The canvas draws in raw pixels, so cell sizes and fonts are scaled here to
+        match the CTk edit entry, which CTk scales itself. Rounding up keeps each
+        cell at least as large as the entry floated over it. Returns whether the
+        scaling changed.
+        """
+        scaling = ctk.ScalingTracker.get_widget_scaling(self)
+        if scaling == self._scaling:
+            return False
+        self._scaling = scaling
+        self._cell_size = (self._scaled(self.cell_width), self._scaled(self.cell_height))
+        self._margin = self._scaled(1)
+        self._pitch = (self._cell_size[0] + 2 * self._margin, self._cell_size[1] + 2 * self._margin)
+        self._cell_font = self._get_cell_font().create_scaled_tuple(scaling)
+        self._header_font = self._get_bold_font().create_scaled_tuple(scaling)
+        return True
+    
+    def _viewport_size(self):
+        """Canvas size that fits the grid, capped so large grids scroll"""
+        return (
+            min(self._scaled(750), (self.cols + 1) * self._cell_size[0] + self._scaled(60)),
+            min(self._scaled(450), (self.rows + 1) * self._cell_size[1] + self._scaled(60))
         )
-        corner.grid(row=0, column=0, padx=1, pady=1)
-        
-        # Create column headers
-        for j, header in enumerate(self.col_headers[:self.cols]):
-            if self.editable_headers:
-                entry = ctk.CTkEntry(
-                    self.scroll_frame,
-                    width=self.cell_width,
-                    height=self.cell_height,
-                    justify="center"
-                )
-                entry.insert(0, header)
-                entry.grid(row=0, column=j+1, padx=1, pady=1)
-                self.col_header_entries.append(entry)
-            else:
-                label = ctk.CTkLabel(
-                    self.scroll_frame,
-                    text=header[:10],
-                    width=self.cell_width,
-                    height=self.cell_height,
-                    font=ctk.CTkFont(weight="bold"),
-                    fg_color=("gray80", "gray30"),
-                    corner_radius=5
-                )
-                label.grid(row=0, column=j+1, padx=1, pady=1)
-        
-        # Create rows with headers and cells
-        for i in range(self.rows):
-            row_cells = []
-            
-            # Row header
-            if self.editable_headers:
-                entry = ctk.CTkEntry(
-                    self.scroll_frame,
-                    width=self.cell_width,
-                    height=self.cell_height,
-                    justify="center"
-                )
-                entry.insert(0, self.row_headers[i] if i < len(self.row_headers) else f"R{i+1}")
-                entry.grid(row=i+1, column=0, padx=1, pady=1)
-                self.row_header_entries.append(entry)
-            else:
-                label = ctk.CTkLabel(
-                    self.scroll_frame,
-                    text=self.row_headers[i][:12] if i < len(self.row_headers) else f"R{i+1}",
-                    width=self.cell_width,
-                    height=self.cell_height,
-                    font=ctk.CTkFont(weight="bold"),
-                    fg_color=("gray80", "gray30"),
-                    corner_radius=5
-                )
-                label.grid(row=i+1, column=0, padx=1, pady=1)
-            
-            # Data cells
-            for j in range(self.cols):
-                entry = ctk.CTkEntry(
-                    self.scroll_frame,
-                    width=self.cell_width,
-                    height=self.cell_height,
-                    justify="center"
-                )
-                entry.insert(0, self.default_value)
-                entry.grid(row=i+1, column=j+1, padx=1, pady=1)
-                
-                if self.on_change:
-                    entry.bind("<KeyRelease>", lambda e: self.on_change())
-                
-                row_cells.append(entry)
-            
-            self.cells.append(row_cells)
-
+    
+    def _cell_box(self, grid_row: int, grid_col: int):
+        """Canvas rectangle of a grid position, header row/column being 0"""
+        x0 = grid_col * self._pitch[0] + self._margin
+        y0 = grid_row * self._pitch[1] + self._margin
+        return x0, y0, x0 + self._cell_size[0], y0 + self._cell_size[1]
+    
+    def _draw_item(self, grid_row: int, grid_col: int, text: str, fill: str, outline: str, font, tags=()):
+        """Draw one rectangle with centered text, returning both item ids
+        
+        Rectangles are also tagged "rect" and texts "text" so a theme change can
+        recolor every item of a kind at once.
+        """
+        x0, y0, x1, y1 = self._cell_box(grid_row, grid_col)
+        rect = self.canvas.create_rectangle(x0, y0, x1, y1, fill=fill, outline=outline, tags=tags + ("rect",))
+        item = self.canvas.create_text(
+            (x0 + x1) // 2, (y0 + y1) // 2, text=text, fill=self._color(self.TEXT_COLOR),
+            font=font, tags=tags + ("text",)
+        )
+        return rect, item
+    
+    def _compute_display_headers(self):
+        """Precompute the truncated header texts drawn for each row and column"""
+        self._row_display = (
+            [header[:12] for header in self.row_headers[:self.rows]]
+            + _auto_labels("R", len(self.row_headers), self.rows)
+        )
+        self._col_display = (
+            [header[:10] for header in self.col_headers[:self.cols]]
+            + _auto_labels("C", len(self.col_headers), self.cols)
+        )
+    
+    def _draw_grid(self):
+        """Draw the headers; cells are drawn as they scroll into view"""
+        self.row_header_items = []
+        self.col_header_items = []
+        self._build_grid(range(self.rows), range(self.cols))
+    
+    def _build_grid(self, row_range: range, col_range: range):
+        """Draw headers for new rows and columns and any newly visible cells
+        
+        Items are tagged "row<i>" / "col<j>" so a resize can delete whole rows or columns.
+        """
+        header_fill = self._color(self.HEADER_FILL)
+        
+        # Column headers
+        for j in col_range:
+            self.col_header_items.append(self._draw_item(
+                0, j + 1, self._col_display[j], header_fill, header_fill, self._header_font, (f"col{j}", "header")
+            )[1])
+        
+        # Row headers
+        for i in row_range:
+            self.row_header_items.append(self._draw_item(
+                i + 1, 0, self._row_display[i], header_fill, header_fill, self._header_font, (f"row{i}", "header")
+            )[1])
+        
+        self.canvas.configure(scrollregion=(
+            0, 0, (self.cols + 1) * self._pitch[0], (self.rows + 1) * self._pitch[1]
+        ))
+        self._realize_viewport()
+    
+    def _redraw(self):
+        """Draw the whole grid again, e.g. at a new scaling, keeping highlighted cells"""
+        self._end_edit()
+        self.canvas.delete("all")
+        self.cell_items.fill(0)
+        self.cell_rects.fill(0)
+        width, height = self._viewport_size()
+        self.canvas.configure(width=width, height=height)
+        self._draw_grid()
+        for (row, col), color in self._highlights.items():
+            self.highlight_cell(row, col, color)
+    
+    def _draw_cell(self, i: int, j: int):
+        """Draw data cell (i, j) if it has not been drawn yet"""
+        if not self.cell_items[i, j]:
+            self.cell_rects[i, j], self.cell_items[i, j] = self._draw_item(
+                i + 1, j + 1, self._texts.get((i, j), self.default_value),
+                self._color(self.CELL_FILL), self._color(self.CELL_OUTLINE), self._cell_font,
+                (f"row{i}", f"col{j}", "cell")
+            )
+    
+    def _on_appearance_change(self, mode: str):
+        """Recolor the drawn grid for a new appearance mode, keeping highlighted cells"""
+        canvas = self.canvas
+        header_fill = resolve_color(self.HEADER_FILL, mode)
+        canvas.itemconfigure("text", fill=resolve_color(self.TEXT_COLOR, mode))
+        canvas.itemconfigure("header&&rect", fill=header_fill, outline=header_fill)
+        canvas.itemconfigure(
+            "cell&&rect",
+            fill=resolve_color(self.CELL_FILL, mode),
+            outline=resolve_color(self.CELL_OUTLINE, mode)
+        )
+        for (row, col), color in self._highlights.items():
+            canvas.itemconfigure(int(self.cell_rects[row, col]), fill=resolve_color(color, mode))
+    
+    def _on_xview(self, first, last):
+        """Forward horizontal view changes to the scrollbar and draw newly exposed cells"""
+        self.scroll_container.h_scrollbar.set(first, last)
+        self._schedule_realize()
+    
+    def _on_yview(self, first, last):
+        """Forward vertical view changes to the scrollbar and draw newly exposed cells"""
+        self.scroll_container.v_scrollbar.set(first, last)
+        self._schedule_realize()
+    
+    def _schedule_realize(self):
+        """Coalesce view changes into one viewport update per idle cycle"""
+        if self._realize_job is None:
+            self._realize_job = self.after_idle(self._realize_viewport)
+    
+    def _realize_viewport(self):
+        """Draw the cells in the visible area plus one viewport of margin on each side"""
+        self._realize_job = None
+        # A scaling change moves every cell, so the grid is drawn again from scratch
+        if self._apply_scaling():
+            self._redraw()
+            return
+        
+        canvas = self.canvas
+        width = max(canvas.winfo_width(), int(canvas.cget("width")))
+        height = max(canvas.winfo_height(), int(canvas.cget("height")))
+        left, top = canvas.canvasx(0), canvas.canvasy(0)
+        
+        pitch_x, pitch_y = self._pitch
+        first_col = max(int((left - width) // pitch_x) - 1, 0)
+        last_col = min(int((left + 2 * width) // pitch_x), self.cols)
+        first_row = max(int((top - height) // pitch_y) - 1, 0)
+        last_row = min(int((top + 2 * height) // pitch_y), self.rows)
+        
+        undrawn = np.argwhere(self.cell_items[first_row:last_row, first_col:last_col] == 0)
+        for i, j in undrawn.tolist():
+            self._draw_cell(first_row + i, first_col + j)
+        
+        # Keep the edit entry above freshly drawn items
+        if self._edit_window is not None:
+            canvas.tag_raise(self._edit_window)
+    
+    def _on_canvas_click(self, event):
+        """Start editing the cell under the pointer"""
+        x = self.canvas.canvasx(event.x)
+        y = self.canvas.canvasy(event.y)
+        grid_row = int(y // self._pitch[1])
+        grid_col = int(x // self._pitch[0])
+        
+        if grid_row > self.rows or grid_col > self.cols or (grid_row == 0 and grid_col == 0):
+            return
+        if (grid_row == 0 or grid_col == 0) and not self.editable_headers:
+            return
+        
+        self._begin_edit(grid_row, grid_col)
+    
+    def _cell_text(self, grid_row: int, grid_col: int) -> str:
+        """Full text of a grid position (cell value or header name)"""
+        if grid_row == 0:
+            return self.col_headers[grid_col - 1]
+        if grid_col == 0:
+            return self.row_headers[grid_row - 1]
+        return self._texts.get((grid_row - 1, grid_col - 1), self.default_value)
+    
+    def _begin_edit(self, grid_row: int, grid_col: int):
+        """Float the shared entry over a grid position"""
+        self._end_edit()
+        if grid_row and grid_col:
+            self._draw_cell(grid_row - 1, grid_col - 1)
+        
+        x0, y0, _, _ = self._cell_box(grid_row, grid_col)
+        self._edit_var.set(self._cell_text(grid_row, grid_col))
+        self._editing = (grid_row, grid_col)
+        self._edit_window = self.canvas.create_window(
+            x0, y0, window=self._edit_entry, anchor="nw"
+        )
+        self._edit_entry.focus_set()
+        self._edit_entry.select_range(0, "end")
+    
+    def _end_edit(self, event=None):
+        """Hide the edit entry; its value was already written through"""
+        self._editing = None
+        if self._edit_window is not None:
+            self.canvas.delete(self._edit_window)
+            self._edit_window = None
+    
+    def _edit_next(self, event=None):
+        """Move editing to the next data cell"""
+        if self._editing is None:
+            return "break"
+        
+        grid_row, grid_col = self._editing
+        if grid_col < self.cols:
+            grid_col += 1
+        elif grid_row < self.rows:
+            grid_row, grid_col = grid_row + 1, 1
+        self._begin_edit(max(grid_row, 1), max(grid_col, 1))
+        return "break"
+    
+    def _on_edit_write(self, *args):
+        """Write the edit entry's text back into the edited cell"""
+        if self._editing is None:
+            return
+        
+        grid_row, grid_col = self._editing
+        text = self._edit_var.get()
+        
+        if grid_row == 0:
+            self.col_headers[grid_col - 1] = text
+            self._col_display[grid_col - 1] = text[:10]
+            self.canvas.itemconfigure(self.col_header_items[grid_col - 1], text=text[:10])
+        elif grid_col == 0:
+            self.row_headers[grid_row - 1] = text
+            self._row_display[grid_row - 1] = text[:12]
+            self.canvas.itemconfigure(self.row_header_items[grid_row - 1], text=text[:12])
+        else:
+            self.set_cell(grid_row - 1, grid_col - 1, text)
+            if self.on_change:
+                self._schedule_on_change()
+    
+    def _schedule_on_change(self):
+        """Coalesce bursts of edits into one on_change call"""
+        if self._on_change_pending is not None:
+            self.after_cancel(self._on_change_pending)
+        self._on_change_pending = self.after(150, self._fire_on_change)
+    
+    def _fire_on_change(self):
+        """Run the debounced on_change callback"""
+        self._on_change_pending = None
+        self.on_change()
+    
     def get_matrix(self) -> np.ndarray:
         """
         Get the current matrix values as a numpy array
@@ -407,17 +670,8 @@ class MatrixInput(ctk.CTkFrame):
         Returns:
             2D numpy array of float values
         """
-        matrix = np.zeros((self.rows, self.cols))
-        
-        for i in range(self.rows):
-            for j in range(self.cols):
-                try:
-                    value = float(self.cells[i][j].get())
-                except ValueError:
-                    value = 0.0
-                matrix[i, j] = value
-        
-        return matrix
+        # Cells are parsed as they are set, so this is a plain copy
+        return self._values.copy()
     
     def set_matrix(self, matrix: np.ndarray):
         """
@@ -426,99 +680,145 @@ class MatrixInput(ctk.CTkFrame):
         Args:
             matrix: 2D numpy array of values
         """
-        rows, cols = matrix.shape
+        self._end_edit()
+        rows, cols = min(matrix.shape[0], self.rows), min(matrix.shape[1], self.cols)
+        block = np.asarray(matrix[:rows, :cols], dtype=np.float64)
+        self._values[:rows, :cols] = block
+        
+        # Only cells away from the default keep a text of their own; format them
+        # all in one NumPy call ("1" rather than "1.0") before touching the canvas
+        texts = {key: text for key, text in self._texts.items() if key[0] >= rows or key[1] >= cols}
+        row_idx, col_idx = np.nonzero(block != self._default_float)
+        formatted = np.char.mod("%.15g", block[row_idx, col_idx]).tolist()
+        texts.update(zip(zip(row_idx.tolist(), col_idx.tolist()), formatted))
+        self._texts = texts
         
-        for i in range(min(rows, self.rows)):
-            for j in range(min(cols, self.cols)):
-                self.cells[i][j].delete(0, "end")
-                self.cells[i][j].insert(0, str(matrix[i, j]))
+        self._refresh_cells(self.cell_items[:rows, :cols])
     
     def get_row_headers(self) -> List[str]:
         """Get current row headers"""
         if self.editable_headers:
-            return [entry.get() for entry in self.row_header_entries]
+            return self.row_headers[:self.rows]
         return self.row_headers
     
     def get_col_headers(self) -> List[str]:
         """Get current column headers"""
         if self.editable_headers:
-            return [entry.get() for entry in self.col_header_entries]
+            return self.col_headers[:self.cols]
         return self.col_headers
     
     def set_row_headers(self, headers: List[str]):
         """Set row headers"""
-        self.row_headers = headers
-        if self.editable_headers:
-            for i, entry in enumerate(self.row_header_entries):
-                entry.delete(0, "end")
-                entry.insert(0, headers[i] if i < len(headers) else f"R{i+1}")
+        self._end_edit()
+        self.row_headers = list(headers) + _auto_labels("R", len(headers), self.rows)
+        self._compute_display_headers()
+        for item, text in zip(self.row_header_items, self._row_display):
+            self.canvas.itemconfigure(item, text=text)
     
     def set_col_headers(self, headers: List[str]):
         """Set column headers"""
-        self.col_headers = headers
-        if self.editable_headers:
-            for j, entry in enumerate(self.col_header_entries):
-                entry.delete(0, "end")
-                entry.insert(0, headers[j] if j < len(headers) else f"C{j+1}")
+        self._end_edit()
+        self.col_headers = list(headers) + _auto_labels("C", len(headers), self.cols)
+        self._compute_display_headers()
+        for item, text in zip(self.col_header_items, self._col_display):
+            self.canvas.itemconfigure(item, text=text)
     
     def clear(self):
         """Clear all cell values to default"""
-        for i in range(self.rows):
-            for j in range(self.cols):
-                self.cells[i][j].delete(0, "end")
-                self.cells[i][j].insert(0, self.default_value)
+        self._end_edit()
+        self._texts.clear()
+        self._values.fill(self._default_float)
+        self._refresh_cells(self.cell_items)
+    
+    def _refresh_cells(self, items: np.ndarray):
+        """Update the drawn text items of a top-left block of cells in one Tcl call"""
+        cells = np.argwhere(items)
+        if not len(cells):
+            return
+        ids = items[cells[:, 0], cells[:, 1]].tolist()
+        texts = [self._texts.get((i, j), self.default_value) for i, j in cells.tolist()]
+        self.canvas.tk.call("apply", _SET_ITEM_TEXTS, self.canvas._w, tuple(ids), tuple(texts))
     
     def get_cell(self, row: int, col: int) -> str:
         """Get value of a specific cell"""
         if 0 <= row < self.rows and 0 <= col < self.cols:
-            return self.cells[row][col].get()
+            return self._texts.get((row, col), self.default_value)
         return ""
     
     def set_cell(self, row: int, col: int, value: str):
         """Set value of a specific cell"""
         if 0 <= row < self.rows and 0 <= col < self.cols:
-            self.cells[row][col].delete(0, "end")
-            self.cells[row][col].insert(0, value)
+            if value == self.default_value:
+                self._texts.pop((row, col), None)
+            else:
+                self._texts[row, col] = value
+            self._values[row, col] = _to_float(value)
+            if self.cell_items[row, col]:
+                self.canvas.itemconfigure(int(self.cell_items[row, col]), text=value)
     
     def highlight_cell(self, row: int, col: int, color: str = "#4CAF50"):
         """Highlight a specific cell"""
         if 0 <= row < self.rows and 0 <= col < self.cols:
-            self.cells[row][col].configure(fg_color=color)
+            self._draw_cell(row, col)
+            self._highlights[row, col] = color
+            self.canvas.itemconfigure(int(self.cell_rects[row, col]), fill=self._color(color))
     
     def clear_highlights(self):
         """Clear all cell highlights"""
-        for i in range(self.rows):
-            for j in range(self.cols):
-                self.cells[row][col].configure(fg_color=("white", "gray20"))
+        self._highlights = {}
+        self.canvas.itemconfigure("cell&&rect", fill=self._color(self.CELL_FILL))
     
     def resize(self, rows: int, cols: int):
-        """Resize the matrix (recreates the widget)"""
-        self.rows = rows
-        self.cols = cols
+        """Resize the matrix, only drawing or deleting the rows and columns that change"""
+        self._end_edit()
+        old_rows, old_cols = self.rows, self.cols
+        keep_rows, keep_cols = min(rows, old_rows), min(cols, old_cols)
         
-        # Clear existing widgets
-        for widget in self.scroll_frame.winfo_children():
-            widget.destroy()
+        # Carry the kept block of every per-cell array over to the new size
+        def resized(array, fill):
+            new = np.full((rows, cols), fill, dtype=array.dtype)
+            new[:keep_rows, :keep_cols] = array[:keep_rows, :keep_cols]
+            return new
         
-        self.cells = []
-        self.row_header_entries = []
-        self.col_header_entries = []
+        self._values = resized(self._values, self._default_float)
+        self._texts = {key: text for key, text in self._texts.items() if key[0] < rows and key[1] < cols}
+        self._highlights = {key: color for key, color in self._highlights.items() if key[0] < rows and key[1] < cols}
+        self.cell_items = resized(self.cell_items, 0)
+        self.cell_rects = resized(self.cell_rects, 0)
         
         # Update headers if needed
-        if len(self.row_headers) < rows:
-            self.row_headers.extend([f"R{i+1}" for i in range(len(self.row_headers), rows)])
-        if len(self.col_headers) < cols:
-            self.col_headers.extend([f"C{j+1}" for j in range(len(self.col_headers), cols)])
+        self.row_headers.extend(_auto_labels("R", len(self.row_headers), rows))
+        self.col_headers.extend(_auto_labels("C", len(self.col_headers), cols))
+        
+        # Delete removed rows and columns
+        for i in range(rows, old_rows):
+            self.canvas.delete(f"row{i}")
+        for j in range(cols, old_cols):
+            self.canvas.delete(f"col{j}")
+        del self.row_header_items[rows:]
+        del self.col_header_items[cols:]
+        
+        # Draw headers for the added rows and columns
+        self.rows, self.cols = rows, cols
+        self._compute_display_headers()
         
-        # Recreate all widgets
-        self._recreate_grid_widgets()
+        # Fit the viewport to the new size; _build_grid updates the scroll region
+        width, height = self._viewport_size()
+        self.canvas.configure(width=width, height=height)
+        self._build_grid(range(keep_rows, rows), range(keep_cols, cols))
 
 
 class VectorInput(ctk.CTkFrame):
     """
     A simple vector input widget for 1D data (supply, demand, etc.)
+    
+    Only the label/entry pairs near the visible part of the vector exist;
+    pairs scrolled out of view are returned to a pool and reused.
     """
     
+    # Pairs kept alive beyond each edge of the view
+    PREFETCH = 4
+    
     def __init__(
         self,
         parent,
@@ -538,15 +838,23 @@ class VectorInput(ctk.CTkFrame):
         self.cell_height = cell_height
         self.default_value = default_value
         self.orientation = orientation
-        self.labels = labels or [f"V{i+1}" for i in range(size)]
+        self.labels = labels or _auto_labels("V", 0, size)
         self.title = title
         
-        self.entries: List[ctk.CTkEntry] = []
+        # Entry texts and their parsed values for every index, kept current as the user types
+        self.values = np.full(size, default_value, dtype=object)
+        self._floats = np.full(size, _to_float(default_value), dtype=np.float64)
+        
+        # Label/entry/variable triples by index, free triples, and the index behind each variable name
+        self._live: Dict[int, Tuple[ctk.CTkLabel, tk.Entry, tk.StringVar]] = {}
+        self._pool: List[Tuple[ctk.CTkLabel, tk.Entry, tk.StringVar]] = []
+        self._var_index: Dict[str, int] = {}
+        self._realize_job = None
         
         self._create_widgets()
     
     def _create_widgets(self):
-        """Create the vector input widgets"""
+        """Create the scroll container and the pairs in the initial view"""
         if self.title:
             title_label = ctk.CTkLabel(
                 self,
@@ -563,71 +871,240 @@ class VectorInput(ctk.CTkFrame):
                 height=self.cell_height * 2 + 50
             )
             self.scroll_container.pack(fill="both", expand=True, padx=5, pady=5)
-            container = self.scroll_container.get_inner_frame()
+            self._container = self.scroll_container.get_inner_frame()
+            self._canvas = self.scroll_container.canvas
+            self._scrollbar = self.scroll_container.h_scrollbar
+            self._canvas.configure(xscrollcommand=self._on_view)
         else:
             # Use CTkScrollableFrame for vertical (only needs vertical scroll)
-            container = ctk.CTkScrollableFrame(
+            self._container = ctk.CTkScrollableFrame(
                 self,
                 width=self.cell_width * 2 + 40,
                 height=min(400, self.size * (self.cell_height + 8))
             )
-            container.pack(fill="both", expand=True, padx=5, pady=5)
+            self._container.pack(fill="both", expand=True, padx=5, pady=5)
+            self._canvas = self._container._parent_canvas
+            self._scrollbar = self._container._scrollbar
+            self._canvas.configure(yscrollcommand=self._on_view)
         
-        for i in range(self.size):
-            if self.orientation == "horizontal":
-                col = i
-                row = 0
-            else:
-                col = 0
-                row = i
-            
-            # Label
+        self._label_font = get_font(11, family=None)
+        self._entry_options = self._get_entry_options()
+        track_appearance_mode(self, self._on_appearance_change)
+        
+        # Reserve every slot up front so the scroll region covers the whole vector
+        self._pitch = self._slot_pitch()
+        self._reserve_slots(range(self.size), self._pitch)
+        
+        self._canvas.bind("<Configure>", lambda e: self._schedule_realize(), add="+")
+        
+        # Hold the container's size and the scroll region fixed while gridding
+        # so both are recomputed once
+        if self.orientation == "horizontal":
+            self.scroll_container._suspend_bbox()
+        self._container.grid_propagate(False)
+        self._realize_viewport()
+        self._container.grid_propagate(True)
+        if self.orientation == "horizontal":
+            self.scroll_container._resume_bbox()
+    
+    def _scaled(self, value: float) -> int:
+        """Screen pixels of a CTk size at the widget's current scaling, rounded up"""
+        return math.ceil(value * ctk.ScalingTracker.get_widget_scaling(self))
+    
+    def _slot_pitch(self) -> int:
+        """Screen pixels per slot: the scaled label size plus its scaled grid padding
+        
+        Rounding up keeps the pitch at least as large as the label's own slot, so
+        every slot is exactly its reserved minsize.
+        """
+        cell = self.cell_width if self.orientation == "horizontal" else self.cell_height
+        return self._scaled(cell) + 2 * self._scaled(2)
+    
+    def _reserve_slots(self, slots: range, minsize: int):
+        """Set the grid minsize of a range of slots"""
+        slots = tuple(slots)
+        if not slots:
+            return
+        if self.orientation == "horizontal":
+            self._container.grid_columnconfigure(slots, minsize=minsize)
+        else:
+            self._container.grid_rowconfigure(slots, minsize=minsize)
+            self._container.grid_columnconfigure(1, minsize=self._scaled(self.cell_width) + 4)
+    
+    def _get_entry_options(self) -> dict:
+        """Options that style a plain tk.Entry like the theme's CTkEntry"""
+        return dict(
+            justify="center",
+            width=1,
+            relief="flat",
+            bd=0,
+            font=self._entry_font(),
+            highlightthickness=ctk.ThemeManager.theme["CTkEntry"]["border_width"],
+            **self._entry_colors(ctk.get_appearance_mode())
+        )
+    
+    def _entry_font(self) -> tuple:
+        """The label font scaled for a plain tk.Entry, which CTk does not scale itself"""
+        return self._label_font.create_scaled_tuple(ctk.ScalingTracker.get_widget_scaling(self))
+    
+    @staticmethod
+    def _entry_colors(mode: str) -> dict:
+        """The theme's CTkEntry colors for an appearance mode, as tk.Entry options"""
+        theme = ctk.ThemeManager.theme["CTkEntry"]
+        text_color = resolve_color(tuple(theme["text_color"]), mode)
+        return dict(
+            bg=resolve_color(tuple(theme["fg_color"]), mode),
+            fg=text_color,
+            insertbackground=text_color,
+            highlightbackground=resolve_color(tuple(theme["border_color"]), mode),
+            highlightcolor=resolve_color(COLORS["primary"], mode)
+        )
+    
+    def _configure_entries(self, **options):
+        """Apply options to every entry, in view or pooled, and to entries created later"""
+        self._entry_options.update(options)
+        for _, entry, _ in list(self._live.values()) + self._pool:
+            entry.configure(**options)
+    
+    def _on_appearance_change(self, mode: str):
+        """Restyle the entries for a new appearance mode"""
+        self._configure_entries(**self._entry_colors(mode))
+    
+    def _on_view(self, first, last):
+        """Forward view changes to the scrollbar and fill in newly exposed pairs"""
+        self._scrollbar.set(first, last)
+        self._schedule_realize()
+    
+    def _schedule_realize(self):
+        """Coalesce view changes into one update per idle cycle"""
+        if self._realize_job is None:
+            self._realize_job = self.after_idle(self._realize_viewport)
+    
+    def _realize_viewport(self):
+        """Show pairs for the visible indices and pool the rest"""
+        self._realize_job = None
+        if self.orientation == "horizontal":
+            start = self._canvas.canvasx(0)
+            extent = max(self._canvas.winfo_width(), int(self._canvas.cget("width")))
+        else:
+            start = self._canvas.canvasy(0)
+            extent = max(self._canvas.winfo_height(), int(self._canvas.cget("height")))
+        
+        # The window may have moved to a display with another scaling
+        pitch = self._slot_pitch()
+        if pitch != self._pitch:
+            self._pitch = pitch
+            self._reserve_slots(range(self.size), pitch)
+            self._configure_entries(font=self._entry_font())
+        
+        first = max(int(start // pitch) - self.PREFETCH, 0)
+        last = min(int((start + extent) // pitch) + 1 + self.PREFETCH, self.size)
+        
+        for i in [i for i in self._live if not first <= i < last]:
+            self._release(i)
+        for i in range(first, last):
+            if i not in self._live:
+                self._acquire(i)
+    
+    def _acquire(self, i: int):
+        """Place a pooled (or new) label/entry pair at index i"""
+        if self._pool:
+            label, entry, var = self._pool.pop()
+        else:
             label = ctk.CTkLabel(
-                container,
-                text=self.labels[i][:10] if i < len(self.labels) else f"V{i+1}",
-                width=self.cell_width,
-                font=ctk.CTkFont(size=11)
-            )
-            
-            if self.orientation == "horizontal":
-                label.grid(row=0, column=col, padx=2, pady=2)
-            else:
-                label.grid(row=row, column=0, padx=2, pady=2, sticky="w")
-            
-            # Entry
-            entry = ctk.CTkEntry(
-                container,
+                self._container,
                 width=self.cell_width,
                 height=self.cell_height,
-                justify="center"
+                font=self._label_font
             )
-            entry.insert(0, self.default_value)
-            
-            if self.orientation == "horizontal":
-                entry.grid(row=1, column=col, padx=2, pady=2)
-            else:
-                entry.grid(row=row, column=1, padx=2, pady=2)
-            
-            self.entries.append(entry)
+            # Plain tk.Entry: far cheaper to build than a canvas-drawn CTkEntry
+            var = tk.StringVar(self)
+            var.trace_add("write", self._on_entry_write)
+            entry = tk.Entry(self._container, textvariable=var, **self._entry_options)
+        
+        label.configure(text=self.labels[i][:10] if i < len(self.labels) else "V%d" % (i + 1))
+        self._var_index[str(var)] = i
+        self._live[i] = (label, entry, var)
+        var.set(self.values[i])
+        
+        # Entries stretch to the slot width reserved for them
+        if self.orientation == "horizontal":
+            label.grid(row=0, column=i, padx=2, pady=2)
+            entry.grid(row=1, column=i, padx=2, pady=2, ipady=4, sticky="ew")
+        else:
+            label.grid(row=i, column=0, padx=2, pady=2, sticky="w")
+            entry.grid(row=i, column=1, padx=2, pady=2, ipady=4, sticky="ew")
+    
+    def _release(self, i: int):
+        """Return the pair at index i to the pool; its text is already saved"""
+        label, entry, var = self._live.pop(i)
+        del self._var_index[str(var)]
+        label.grid_forget()
+        entry.grid_forget()
+        self._pool.append((label, entry, var))
+    
+    def _on_entry_write(self, name, *args):
+        """Save and parse an entry's text as it is typed"""
+        i = self._var_index.get(name)
+        if i is None:
+            return
+        text = self._live[i][2].get()
+        self.values[i] = text
+        self._floats[i] = _to_float(text)
     
     def get_values(self) -> np.ndarray:
         """Get values as numpy array"""
-        values = np.zeros(self.size)
-        for i, entry in enumerate(self.entries):
-            try:
-                values[i] = float(entry.get())
-            except ValueError:
-                values[i] = 0.0
-        return values
+        # Entries are parsed as they change, so this is a plain copy
+        return self._floats.copy()
     
     def set_values(self, values: np.ndarray):
         """Set values from numpy array"""
-        for i in range(min(len(values), self.size)):
-            self.entries[i].delete(0, "end")
-            self.entries[i].insert(0, str(values[i]))
+        count = min(len(values), self.size)
+        floats = np.asarray(values[:count], dtype=np.float64)
+        self._floats[:count] = floats
+        self.values[:count] = np.char.mod("%.15g", floats).tolist()
+        self._refresh_live()
     
     def clear(self):
         """Clear all values"""
-        for entry in self.entries:
-            entry.delete(0, "end")
-            entry.insert(0, self.default_value)
+        self.values.fill(self.default_value)
+        self._floats.fill(_to_float(self.default_value))
+        self._refresh_live()
+    
+    def _refresh_live(self):
+        """Show the backing values in the visible entries in one Tcl call"""
+        if self._live:
+            names = tuple(str(var) for _, _, var in self._live.values())
+            texts = tuple(self.values[i] for i in self._live)
+            self.tk.call("apply", _SET_VARIABLES, names, texts)
+    
+    def resize(self, size: int, labels: Optional[List[str]] = None):
+        """Resize the vector, keeping existing values and reusing the pooled pairs"""
+        old_size = self.size
+        keep = min(size, old_size)
+        
+        values = np.full(size, self.default_value, dtype=object)
+        values[:keep] = self.values[:keep]
+        floats = np.full(size, _to_float(self.default_value), dtype=np.float64)
+        floats[:keep] = self._floats[:keep]
+        self.values, self._floats = values, floats
+        
+        if labels is not None:
+            self.labels = list(labels)
+            for i, (label, _, _) in self._live.items():
+                label.configure(text=self.labels[i][:10] if i < len(self.labels) else "V%d" % (i + 1))
+        
+        # Pairs past the new end go back to the pool
+        for i in [i for i in self._live if i >= size]:
+            self._release(i)
+        
+        # Reserve the added slots or free the removed ones
+        self.size = size
+        if size != old_size:
+            self._reserve_slots(range(keep, max(size, old_size)), self._pitch if size > old_size else 0)
+            if self.orientation == "horizontal":
+                self.scroll_container.canvas.configure(width=min(700, size * (self.cell_width + 10)))
+            else:
+                self._container.configure(height=min(400, size * (self.cell_height + 8)))
+        
+        self._realize_viewport()
@@ -4,7 +4,16 @@ Provides fullscreen, expand, and toggle functionality for UI panels
 """
 
 import customtkinter as ctk
-from config.settings import COLORS, FONTS, SPACING
+import tkinter as tk
+from functools import partial
+from typing import Optional
+from config.settings import COLORS, SPACING
+from ui.components.emoji_icons import emoji_icon
+from ui.components.theme import get_font
+
+
+# Options shared by the small icon buttons in a PanelHeader
+_HEADER_BTN_KW = dict(width=32, height=28, corner_radius=6)
 
 
 class PanelHeader(ctk.CTkFrame):
@@ -33,62 +42,52 @@ class PanelHeader(ctk.CTkFrame):
         self.on_fullscreen = on_fullscreen
         self.on_toggle = on_toggle
         
-        # Inner container with padding
-        inner = ctk.CTkFrame(self, fg_color="transparent")
-        inner.pack(fill="x", padx=SPACING["sm"], pady=SPACING["sm"])
-        
-        # Title section
-        title_frame = ctk.CTkFrame(inner, fg_color="transparent")
-        title_frame.pack(side="left", fill="x", expand=True)
+        # Title and buttons are packed straight into the header, no wrapper frames
+        pad = SPACING["sm"]
         
         if icon:
+            # Pre-rendered emoji image when available, else the emoji as text
+            image = emoji_icon(icon, 18)
             ctk.CTkLabel(
-                title_frame,
-                text=icon,
-                font=ctk.CTkFont(size=16),
+                self,
+                text="" if image else icon,
+                image=image,
+                font=get_font(16, family=None),
                 text_color="#FFFFFF"
-            ).pack(side="left", padx=(0, 8))
+            ).pack(side="left", padx=(pad, 8), pady=pad)
         
         ctk.CTkLabel(
-            title_frame,
+            self,
             text=title,
-            font=ctk.CTkFont(family=FONTS["family"], size=14, weight="bold"),
+            font=get_font(14, "bold"),
             text_color="#FFFFFF"
-        ).pack(side="left")
+        ).pack(side="left", padx=(0 if icon else pad, 0), pady=pad)
         
-        # Buttons container
-        btn_container = ctk.CTkFrame(inner, fg_color="transparent")
-        btn_container.pack(side="right")
+        # Buttons are packed from the right edge, so the toggle goes first
+        if show_toggle:
+            self.toggle_btn = ctk.CTkButton(
+                self,
+                text="✕",
+                font=get_font(12, family=None),
+                fg_color=COLORS["text_secondary"],
+                hover_color="#475569",
+                command=self._on_toggle_click,
+                **_HEADER_BTN_KW
+            )
+            self.toggle_btn.pack(side="right", padx=(0, pad), pady=pad)
         
         # Fullscreen button
         if show_fullscreen:
             self.fullscreen_btn = ctk.CTkButton(
-                btn_container,
+                self,
                 text="⛶",
-                width=32,
-                height=28,
-                font=ctk.CTkFont(size=14),
+                font=get_font(14, family=None),
                 fg_color=COLORS["accent"],
                 hover_color=COLORS["accent_hover"],
-                corner_radius=6,
-                command=self._on_fullscreen_click
+                command=self._on_fullscreen_click,
+                **_HEADER_BTN_KW
             )
-            self.fullscreen_btn.pack(side="left", padx=(0, 5))
-        
-        # Toggle/close button
-        if show_toggle:
-            self.toggle_btn = ctk.CTkButton(
-                btn_container,
-                text="✕",
-                width=32,
-                height=28,
-                font=ctk.CTkFont(size=12),
-                fg_color=COLORS["text_secondary"],
-                hover_color="#475569",
-                corner_radius=6,
-                command=self._on_toggle_click
-            )
-            self.toggle_btn.pack(side="left")
+            self.fullscreen_btn.pack(side="right", padx=(0, 5 if show_toggle else pad), pady=pad)
     
     def _on_fullscreen_click(self):
         if self.on_fullscreen:
@@ -108,17 +107,14 @@ class FullscreenWindow(ctk.CTkToplevel):
     def __init__(self, parent, title: str = "Fullscreen View", width: int = 1000, height: int = 700):
         super().__init__(parent)
         
-        self.title(title)
-        self.geometry(f"{width}x{height}")
-        self.minsize(600, 400)
-        
-        # Center on screen
-        self.update_idletasks()
+        # Center on screen; the screen size needs no layout pass, so set geometry once
         screen_w = self.winfo_screenwidth()
         screen_h = self.winfo_screenheight()
         x = (screen_w - width) // 2
         y = (screen_h - height) // 2
         self.geometry(f"{width}x{height}+{x}+{y}")
+        self.title(title)
+        self.minsize(600, 400)
         
         # Stay on top briefly
         self.attributes('-topmost', True)
@@ -143,7 +139,7 @@ class FullscreenWindow(ctk.CTkToplevel):
         ctk.CTkLabel(
             header_inner,
             text=f"⛶ {title}",
-            font=ctk.CTkFont(family=FONTS["family"], size=18, weight="bold"),
+            font=get_font(18, "bold"),
             text_color="#FFFFFF"
         ).pack(side="left")
         
@@ -153,16 +149,24 @@ class FullscreenWindow(ctk.CTkToplevel):
             text="✕ Close",
             width=100,
             height=32,
-            font=ctk.CTkFont(family=FONTS["family"], size=12, weight="bold"),
+            font=get_font(12, "bold"),
             fg_color=COLORS["error"],
             hover_color=COLORS["error_light"],
             corner_radius=6,
-            command=self.destroy
+            command=self._close
         ).pack(side="right")
         
         # Body frame for content
         self.body_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
         self.body_frame.pack(fill="both", expand=True, padx=SPACING["sm"], pady=SPACING["sm"])
+    
+    def _close(self):
+        """Close via the WM_DELETE_WINDOW handler so owners can hide the window instead"""
+        handler = self.protocol("WM_DELETE_WINDOW")
+        if handler:
+            self.tk.call(handler)
+        else:
+            self.destroy()
 
 
 class PanelToggleBar(ctk.CTkFrame):
@@ -171,16 +175,32 @@ class PanelToggleBar(ctk.CTkFrame):
     Used at the top of views to control panel visibility.
     """
     
+    # Button colors for shown/hidden panels, and the font shared by every toggle button
+    _FG_ON = COLORS["secondary"]
+    _FG_OFF = COLORS["border"]
+    _BTN_FONT: Optional[ctk.CTkFont] = None
+    
     def __init__(self, parent, panels: dict = None, **kwargs):
         """
         panels: dict of {panel_name: {"label": str, "icon": str, "visible": bool}}
         """
         super().__init__(parent, fg_color=COLORS["surface"], corner_radius=8, height=40, **kwargs)
         
+        # Fonts need a Tk root, so the shared one is created with the first bar
+        if PanelToggleBar._BTN_FONT is None:
+            PanelToggleBar._BTN_FONT = get_font(11)
+        
         self.panels = panels or {}
         self.toggle_buttons = {}
         self.callbacks = {}
         
+        # Visibility each button is currently colored for
+        self._button_visible = {}
+        
+        # Panels toggled since the last flush; rapid clicks are applied once
+        self._pending_toggles = set()
+        self._flush_job = None
+        
         # Inner container
         inner = ctk.CTkFrame(self, fg_color="transparent")
         inner.pack(fill="x", padx=SPACING["sm"], pady=SPACING["xs"])
@@ -189,7 +209,7 @@ class PanelToggleBar(ctk.CTkFrame):
         ctk.CTkLabel(
             inner,
             text="👁️ Panels:",
-            font=ctk.CTkFont(family=FONTS["family"], size=12, weight="bold"),
+            font=get_font(12, "bold"),
             text_color=COLORS["text_secondary"]
         ).pack(side="left", padx=(5, 10))
         
@@ -202,30 +222,41 @@ class PanelToggleBar(ctk.CTkFrame):
         label = config.get("label", name)
         visible = config.get("visible", True)
         
+        image = emoji_icon(icon, 16)
         btn = ctk.CTkButton(
             parent,
-            text=f"{icon} {label}",
+            text=label if image else f"{icon} {label}",
+            image=image,
+            compound="left",
             width=120,
             height=28,
-            font=ctk.CTkFont(family=FONTS["family"], size=11),
-            fg_color=COLORS["secondary"] if visible else COLORS["border"],
+            font=self._BTN_FONT,
+            fg_color=self._FG_ON if visible else self._FG_OFF,
             hover_color=COLORS["secondary_light"],
             corner_radius=6,
-            command=lambda n=name: self._toggle_panel(n)
+            command=partial(self._toggle_panel, name)
         )
         btn.pack(side="left", padx=3)
         self.toggle_buttons[name] = btn
+        self._button_visible[name] = visible
     
     def _toggle_panel(self, name: str):
         if name in self.panels:
             self.panels[name]["visible"] = not self.panels[name]["visible"]
-            visible = self.panels[name]["visible"]
             
-            # Update button appearance
-            btn = self.toggle_buttons[name]
-            btn.configure(
-                fg_color=COLORS["secondary"] if visible else COLORS["border"]
-            )
+            # Apply the latest state once the clicks settle
+            self._pending_toggles.add(name)
+            if self._flush_job is None:
+                self._flush_job = self.after(50, self._flush_toggles)
+    
+    def _flush_toggles(self):
+        """Apply the final state of every panel toggled since the last flush"""
+        self._flush_job = None
+        pending, self._pending_toggles = self._pending_toggles, set()
+        
+        for name in pending:
+            visible = self.panels[name]["visible"]
+            self._color_button(name, visible)
             
             # Call registered callback
             if name in self.callbacks:
@@ -237,12 +268,18 @@ class PanelToggleBar(ctk.CTkFrame):
     
     def set_visible(self, panel_name: str, visible: bool):
         """Programmatically set panel visibility"""
-        if panel_name in self.panels:
-            self.panels[panel_name]["visible"] = visible
-            btn = self.toggle_buttons[panel_name]
-            btn.configure(
-                fg_color=COLORS["secondary"] if visible else COLORS["border"]
-            )
+        panel = self.panels.get(panel_name)
+        if not panel or panel["visible"] == visible:
+            return
+        panel["visible"] = visible
+        self._color_button(panel_name, visible)
+    
+    def _color_button(self, name: str, visible: bool):
+        """Recolor a toggle button, skipping the redraw when it already matches"""
+        if self._button_visible.get(name) == visible:
+            return
+        self._button_visible[name] = visible
+        self.toggle_buttons[name].configure(fg_color=self._FG_ON if visible else self._FG_OFF)
     
     def is_visible(self, panel_name: str) -> bool:
         return self.panels.get(panel_name, {}).get("visible", True)
@@ -271,6 +308,10 @@ class ExpandablePanel(ctk.CTkFrame):
         self.icon = icon
         self.panel_visible = initial_visible
         self.panel_width = panel_width
+        
+        # Requested visibility, applied once per idle cycle
+        self._desired_visible = initial_visible
+        self._apply_job = None
         self.fullscreen_window = None
         self.show_btn = None
         self.show_btn_parent = None
@@ -309,43 +350,65 @@ class ExpandablePanel(ctk.CTkFrame):
     
     def _toggle_visibility(self):
         """Toggle panel visibility"""
-        if self.panel_visible:
+        if self._desired_visible:
             self.hide()
         else:
             self.show()
     
     def hide(self):
         """Hide the panel"""
-        if self.panel_visible:
+        self._request_visibility(False)
+    
+    def show(self):
+        """Show the panel"""
+        self._request_visibility(True)
+    
+    def _request_visibility(self, visible: bool):
+        """Record the wanted state; rapid hide/show calls collapse into one change"""
+        self._desired_visible = visible
+        if self._apply_job is None:
+            self._apply_job = self.after_idle(self._apply_visibility)
+    
+    def _apply_visibility(self):
+        """Pack or forget the container once if the wanted state differs"""
+        self._apply_job = None
+        if self._desired_visible == self.panel_visible:
+            return
+        
+        if not self._desired_visible:
             self.container.pack_forget()
             self.panel_visible = False
             
             if self.on_visibility_change:
                 self.on_visibility_change(False)
-    
-    def show(self):
-        """Show the panel"""
-        if not self.panel_visible:
+        else:
             self.container.pack(fill="both", expand=True)
             self.panel_visible = True
             
-            # Destroy show button if it exists
+            # Hide the show button; it is reused the next time the panel is hidden
             if self.show_btn:
-                self.show_btn.destroy()
-                self.show_btn = None
+                try:
+                    self.show_btn.pack_forget()
+                except tk.TclError:
+                    # Its parent was destroyed along with it
+                    self.show_btn = None
             
             if self.on_visibility_change:
                 self.on_visibility_change(True)
     
     def create_show_button(self, parent):
         """Create a button to show this panel (used when panel is hidden)"""
+        if self.show_btn is not None and self.show_btn_parent is parent and self.show_btn.winfo_exists():
+            self.show_btn.pack(pady=SPACING["md"])
+            return self.show_btn
+        
         self.show_btn_parent = parent
         self.show_btn = ctk.CTkButton(
             parent,
             text=f"{self.icon} Show {self.title}",
             width=180,
             height=36,
-            font=ctk.CTkFont(family=FONTS["family"], size=13, weight="bold"),
+            font=get_font(13, "bold"),
             fg_color=COLORS["primary"],
             hover_color=COLORS["primary_dark"],
             corner_radius=8,
@@ -357,7 +420,10 @@ class ExpandablePanel(ctk.CTkFrame):
     def _open_fullscreen(self):
         """Open panel content in fullscreen window"""
         if self.fullscreen_window is not None:
-            # Bring existing window to focus
+            # Reuse the hidden window rather than building a new toplevel
+            if self.fullscreen_window.state() == "withdrawn":
+                self.fullscreen_window.deiconify()
+                self._repopulate_body()
             self.fullscreen_window.lift()
             self.fullscreen_window.focus()
             return
@@ -369,19 +435,25 @@ class ExpandablePanel(ctk.CTkFrame):
             height=750
         )
         
-        # Handle close
+        # Closing hides the window so the next open can reuse it
         self.fullscreen_window.protocol("WM_DELETE_WINDOW", self._close_fullscreen)
+        self._repopulate_body()
+    
+    def _repopulate_body(self):
+        """Clear the fullscreen body and let the owner fill it again"""
+        body = self.fullscreen_window.body_frame
+        for widget in body.winfo_children():
+            widget.destroy()
         
         # The body_frame in FullscreenWindow is where cloned content goes
         # We'll emit a callback so the parent can populate it
         if hasattr(self, 'on_fullscreen_open'):
-            self.on_fullscreen_open(self.fullscreen_window.body_frame)
+            self.on_fullscreen_open(body)
     
     def _close_fullscreen(self):
-        """Close fullscreen window"""
+        """Hide the fullscreen window"""
         if self.fullscreen_window:
-            self.fullscreen_window.destroy()
-            self.fullscreen_window = None
+            self.fullscreen_window.withdraw()
             
             if hasattr(self, 'on_fullscreen_close'):
                 self.on_fullscreen_close()
@@ -10,6 +10,7 @@ import numpy as np
 
 # Import ScrollableFrame from matrix_input
 from ui.components.matrix_input import ScrollableFrame
+from ui.components.theme import get_font, resolve_color, track_appearance_mode
 
 
 class ResultDisplay(ctk.CTkFrame):
@@ -259,6 +260,23 @@ class AllocationMatrixDisplay(ctk.CTkFrame):
         )
         self.scroll_container.pack(fill="both", expand=True, padx=5, pady=5)
         self.matrix_frame = self.scroll_container.get_inner_frame()
+        
+        track_appearance_mode(self, self._on_appearance_change)
+    
+    @staticmethod
+    def _header_colors(mode: str) -> dict:
+        """Background and text color of the header labels for an appearance mode"""
+        return dict(
+            bg=resolve_color(("gray80", "gray30"), mode),
+            fg=resolve_color(tuple(ctk.ThemeManager.theme["CTkLabel"]["text_color"]), mode)
+        )
+    
+    def _on_appearance_change(self, mode: str):
+        """Recolor the header labels for a new appearance mode"""
+        colors = self._header_colors(mode)
+        for widget in self.matrix_frame.winfo_children():
+            if isinstance(widget, tk.Label):
+                widget.configure(**colors)
     
     def display_matrix(
         self,
@@ -269,7 +287,8 @@ class AllocationMatrixDisplay(ctk.CTkFrame):
         highlight_nonzero: bool = True
     ):
         """Display a matrix with optional highlighting"""
-        # Clear existing widgets
+        # Clear existing widgets; the scroll region is fitted once the new grid is built
+        self.scroll_container._suspend_bbox()
         for widget in self.matrix_frame.winfo_children():
             widget.destroy()
         
@@ -280,6 +299,15 @@ class AllocationMatrixDisplay(ctk.CTkFrame):
         cell_width = 70
         cell_height = 30
         
+        # Headers are flat tk.Labels; a CTkLabel would draw each one on its own canvas.
+        # CTk does not scale plain tk widgets, so the header font is scaled here
+        header_options = dict(
+            font=get_font(10, "bold", family=None).create_scaled_tuple(
+                ctk.ScalingTracker.get_widget_scaling(self)
+            ),
+            **self._header_colors(ctk.get_appearance_mode())
+        )
+        
         # Corner cell
         ctk.CTkLabel(
             self.matrix_frame,
@@ -289,29 +317,19 @@ class AllocationMatrixDisplay(ctk.CTkFrame):
         ).grid(row=0, column=0)
         
         # Column headers
-        for j, name in enumerate(col_names):
-            ctk.CTkLabel(
-                self.matrix_frame,
-                text=name[:8],
-                width=cell_width,
-                height=cell_height,
-                font=ctk.CTkFont(size=10, weight="bold"),
-                fg_color=("gray80", "gray30"),
-                corner_radius=3
-            ).grid(row=0, column=j+1, padx=1, pady=1)
+        self._grid_row([
+            tk.Label(self.matrix_frame, text=name[:8], **header_options)
+            for name in col_names
+        ], row=0, column=1)
         
         # Rows
         for i in range(rows):
             # Row header
-            ctk.CTkLabel(
+            row_widgets = [tk.Label(
                 self.matrix_frame,
                 text=row_names[i][:10] if i < len(row_names) else f"R{i+1}",
-                width=80,
-                height=cell_height,
-                font=ctk.CTkFont(size=10, weight="bold"),
-                fg_color=("gray80", "gray30"),
-                corner_radius=3
-            ).grid(row=i+1, column=0, padx=1, pady=1)
+                **header_options
+            )]
             
             # Data cells
             for j in range(cols):
@@ -331,7 +349,7 @@ class AllocationMatrixDisplay(ctk.CTkFrame):
                     fg_color = ("white", "gray20")
                     text_color = ("black", "white")
                 
-                ctk.CTkLabel(
+                row_widgets.append(ctk.CTkLabel(
                     self.matrix_frame,
                     text=text,
                     width=cell_width,
@@ -339,7 +357,16 @@ class AllocationMatrixDisplay(ctk.CTkFrame):
                     fg_color=fg_color,
                     text_color=text_color,
                     corner_radius=3
-                ).grid(row=i+1, column=j+1, padx=1, pady=1)
+                ))
+            
+            self._grid_row(row_widgets, row=i+1, column=0)
+        
+        self.scroll_container._resume_bbox()
+    
+    def _grid_row(self, widgets: List[tk.Widget], row: int, column: int):
+        """Grid widgets into consecutive columns of one row"""
+        for offset, widget in enumerate(widgets):
+            widget.grid(row=row, column=column + offset, padx=1, pady=1, sticky="nsew")
     
     def clear(self):
         """Clear the display"""
@@ -4,12 +4,143 @@ Displays sensitivity analysis results in tabular format
 """
 
 import customtkinter as ctk
+import math
 import tkinter as tk
 from typing import List, Dict, Any, Optional
 import numpy as np
 
 # Import ScrollableFrame for horizontal scrolling support
 from ui.components.matrix_input import ScrollableFrame
+from ui.components.theme import get_font, resolve_color, track_appearance_mode
+
+
+def _format_column(values, spec: str, inf_text: Optional[str] = None) -> List[str]:
+    """Format a column of numbers, converting to Python floats in one call instead of per cell"""
+    values = np.asarray(values, dtype=np.float64)
+    texts = list(map(("{:" + spec + "}").format, values.tolist()))
+    if inf_text is not None:
+        for i in np.flatnonzero(np.isposinf(values)):
+            texts[i] = inf_text
+    return texts
+
+
+class _LazyTable:
+    """
+    The data rows of one sensitivity table
+    
+    Only the rows near the visible part of the table have label widgets;
+    rows scrolled out of view return their labels to a pool for reuse.
+    """
+    
+    # Rows kept alive beyond each edge of the view
+    PREFETCH = 4
+    
+    # Unscaled label height and grid padding of a data row
+    LABEL_HEIGHT = 28
+    ROW_PAD = 1
+    
+    def __init__(self, container: ScrollableFrame):
+        self.container = container
+        self.frame = container.get_inner_frame()
+        self.canvas = container.canvas
+        
+        # Cell texts for every row, labels by row index, and free label rows
+        self.rows: List[List[str]] = []
+        self._live: Dict[int, List[ctk.CTkLabel]] = {}
+        self._pool: List[List[ctk.CTkLabel]] = []
+        self._realize_job = None
+        self._pitch = self._row_pitch()
+        
+        self.canvas.configure(yscrollcommand=self._on_view)
+        self.canvas.bind("<Configure>", lambda e: self._schedule_realize(), add="+")
+    
+    def _row_pitch(self) -> int:
+        """Screen pixels per data row: the scaled label height plus its scaled grid padding
+        
+        Rounding up keeps the pitch at least as tall as a realized row, so every row
+        is exactly its reserved minsize.
+        """
+        scaling = ctk.ScalingTracker.get_widget_scaling(self.frame)
+        return math.ceil(self.LABEL_HEIGHT * scaling) + 2 * math.ceil(self.ROW_PAD * scaling)
+    
+    def _reserve_rows(self, minsize: int):
+        """Set the grid minsize of every data row"""
+        if self.rows:
+            self.frame.grid_rowconfigure(tuple(range(1, len(self.rows) + 1)), minsize=minsize)
+    
+    def set_rows(self, rows: List[List[str]]):
+        """Show new rows below the header, creating labels only for the rows in view"""
+        self.rows = rows
+        
+        # Reserve every row up front so the scroll region covers the whole table
+        self._pitch = self._row_pitch()
+        self._reserve_rows(self._pitch)
+        self._realize_viewport()
+    
+    def clear(self):
+        """Destroy the header and all rows"""
+        for widget in self.frame.winfo_children():
+            widget.destroy()
+        self._reserve_rows(0)
+        self.rows = []
+        self._live.clear()
+        self._pool.clear()
+    
+    def _on_view(self, first, last):
+        """Forward view changes to the scrollbar and fill in newly exposed rows"""
+        self.container.v_scrollbar.set(first, last)
+        self._schedule_realize()
+    
+    def _schedule_realize(self):
+        """Coalesce view changes into one update per idle cycle"""
+        if self._realize_job is None:
+            self._realize_job = self.canvas.after_idle(self._realize_viewport)
+    
+    def _realize_viewport(self):
+        """Show labels for the visible rows and pool the rest"""
+        self._realize_job = None
+        
+        # The window may have moved to a display with another scaling
+        pitch = self._row_pitch()
+        if pitch != self._pitch:
+            self._pitch = pitch
+            self._reserve_rows(pitch)
+        
+        # Data rows start one pitch down, below the header
+        start = self.canvas.canvasy(0) - pitch
+        extent = max(self.canvas.winfo_height(), int(self.canvas.cget("height")))
+        
+        first = max(int(start // pitch) - self.PREFETCH, 0)
+        last = min(int((start + extent) // pitch) + 1 + self.PREFETCH, len(self.rows))
+        
+        for i in [i for i in self._live if not first <= i < last]:
+            self._release(i)
+        for i in range(first, last):
+            if i not in self._live:
+                self._acquire(i)
+    
+    def _acquire(self, i: int):
+        """Place a pooled (or new) row of labels at row i"""
+        values = self.rows[i]
+        if self._pool:
+            labels = self._pool.pop()
+        else:
+            labels = [ctk.CTkLabel(self.frame, width=120, height=self.LABEL_HEIGHT) for _ in values]
+        
+        # Alternate row colors
+        fg_color = ("gray95", "gray25") if i % 2 == 0 else ("white", "gray20")
+        
+        for j, (label, value) in enumerate(zip(labels, values)):
+            label.configure(text=value, fg_color=fg_color)
+            label.grid(row=i + 1, column=j, padx=2, pady=self.ROW_PAD, sticky="ew")
+        self._live[i] = labels
+    
+    def _release(self, i: int):
+        """Return the labels of row i to the pool"""
+        labels = self._live.pop(i)
+        for label in labels:
+            label.grid_forget()
+        self._pool.append(labels)
 
 
 class SensitivityTable(ctk.CTkFrame):
@@ -58,43 +189,58 @@ class SensitivityTable(ctk.CTkFrame):
         self.shadow_container = ScrollableFrame(self.tabview.tab("Shadow Prices"), width=450, height=250)
         self.shadow_container.pack(fill="both", expand=True)
         self.shadow_frame = self.shadow_container.get_inner_frame()
+        self.shadow_table = _LazyTable(self.shadow_container)
         
         self.reduced_container = ScrollableFrame(self.tabview.tab("Reduced Costs"), width=450, height=250)
         self.reduced_container.pack(fill="both", expand=True)
         self.reduced_frame = self.reduced_container.get_inner_frame()
+        self.reduced_table = _LazyTable(self.reduced_container)
         
         self.constraint_container = ScrollableFrame(self.tabview.tab("Constraint Ranges"), width=450, height=250)
         self.constraint_container.pack(fill="both", expand=True)
         self.constraint_frame = self.constraint_container.get_inner_frame()
+        self.constraint_table = _LazyTable(self.constraint_container)
         
         self.variable_container = ScrollableFrame(self.tabview.tab("Variable Ranges"), width=450, height=250)
         self.variable_container.pack(fill="both", expand=True)
         self.variable_frame = self.variable_container.get_inner_frame()
+        self.variable_table = _LazyTable(self.variable_container)
+        
+        track_appearance_mode(self, self._on_appearance_change)
+    
+    @staticmethod
+    def _header_colors(mode: str) -> dict:
+        """Background and text color of the header labels for an appearance mode"""
+        return dict(
+            bg=resolve_color(("gray80", "gray30"), mode),
+            fg=resolve_color(tuple(ctk.ThemeManager.theme["CTkLabel"]["text_color"]), mode)
+        )
+    
+    def _on_appearance_change(self, mode: str):
+        """Recolor the header labels of every table for a new appearance mode"""
+        colors = self._header_colors(mode)
+        for frame in (self.shadow_frame, self.reduced_frame, self.constraint_frame, self.variable_frame):
+            for widget in frame.winfo_children():
+                if isinstance(widget, tk.Label):
+                    widget.configure(**colors)
     
     def _create_table_header(self, parent, columns: List[str]):
         """Create a table header row"""
+        # Flat tk.Labels; a CTkLabel would draw each header on its own canvas. CTk
+        # does not scale plain tk widgets, so the font and padding are scaled here
+        scaling = ctk.ScalingTracker.get_widget_scaling(parent)
+        font = get_font(13, "bold", family=None).create_scaled_tuple(scaling)
+        colors = self._header_colors(ctk.get_appearance_mode())
+        pad = math.ceil(2 * scaling)
+        
         for j, col in enumerate(columns):
-            ctk.CTkLabel(
+            tk.Label(
                 parent,
                 text=col,
-                font=ctk.CTkFont(weight="bold"),
-                fg_color=("gray80", "gray30"),
-                corner_radius=3,
-                width=120
-            ).grid(row=0, column=j, padx=2, pady=2, sticky="ew")
-    
-    def _create_table_row(self, parent, row_idx: int, values: List[str]):
-        """Create a table data row"""
-        for j, val in enumerate(values):
-            # Alternate row colors
-            fg_color = ("gray95", "gray25") if row_idx % 2 == 0 else ("white", "gray20")
-            
-            ctk.CTkLabel(
-                parent,
-                text=str(val),
-                fg_color=fg_color,
-                width=120
-            ).grid(row=row_idx + 1, column=j, padx=2, pady=1, sticky="ew")
+                font=font,
+                pady=math.ceil(4 * scaling),
+                **colors
+            ).grid(row=0, column=j, padx=pad, pady=pad, sticky="nsew")
     
     def display_shadow_prices(
         self,
@@ -104,31 +250,32 @@ class SensitivityTable(ctk.CTkFrame):
     ):
         """Display shadow prices and slack values"""
         # Clear existing
-        for widget in self.shadow_frame.winfo_children():
-            widget.destroy()
+        self.shadow_table.clear()
         
         # Create header
         columns = ["Constraint", "Shadow Price", "Slack/Surplus", "Status"]
         self._create_table_header(self.shadow_frame, columns)
         
-        # Add data rows
+        # Add data rows, formatting each column in one pass
         n = len(shadow_prices)
-        names = constraint_names or [f"Constraint {i+1}" for i in range(n)]
-        slacks = slack_values if slack_values is not None else np.zeros(n)
+        names = list(constraint_names or [])[:n]
+        names += [f"Constraint {i+1}" for i in range(len(names), n)]
+        slacks = np.zeros(n)
+        if slack_values is not None:
+            k = min(n, len(slack_values))
+            slacks[:k] = slack_values[:k]
         
-        for i in range(n):
-            name = names[i] if i < len(names) else f"Constraint {i+1}"
-            sp = shadow_prices[i]
-            slack = slacks[i] if i < len(slacks) else 0
-            
-            # Determine binding status
-            if abs(slack) < 1e-6:
-                status = "Binding"
-            else:
-                status = "Non-binding"
-            
-            values = [name[:20], f"{sp:,.4f}", f"{slack:,.4f}", status]
-            self._create_table_row(self.shadow_frame, i, values)
+        # Determine binding status
+        status = np.where(np.abs(slacks) < 1e-6, "Binding", "Non-binding").tolist()
+        
+        rows = list(map(list, zip(
+            [name[:20] for name in names],
+            _format_column(shadow_prices, ",.4f"),
+            _format_column(slacks, ",.4f"),
+            status
+        )))
+        
+        self.shadow_table.set_rows(rows)
     
     def display_reduced_costs(
         self,
@@ -138,79 +285,84 @@ class SensitivityTable(ctk.CTkFrame):
     ):
         """Display reduced costs"""
         # Clear existing
-        for widget in self.reduced_frame.winfo_children():
-            widget.destroy()
+        self.reduced_table.clear()
         
         # Create header
         columns = ["Variable", "Value", "Reduced Cost", "Status"]
         self._create_table_header(self.reduced_frame, columns)
         
-        # Add data rows
+        # Add data rows, formatting each column in one pass
         n = len(reduced_costs)
-        names = variable_names or [f"x{i+1}" for i in range(n)]
-        values_arr = solution if solution is not None else np.zeros(n)
+        names = list(variable_names or [])[:n]
+        names += [f"x{i+1}" for i in range(len(names), n)]
+        values_arr = np.zeros(n)
+        if solution is not None:
+            k = min(n, len(solution))
+            values_arr[:k] = solution[:k]
         
-        for i in range(n):
-            name = names[i] if i < len(names) else f"x{i+1}"
-            val = values_arr[i] if i < len(values_arr) else 0
-            rc = reduced_costs[i]
-            
-            # Determine status
-            if val > 1e-6:
-                status = "Basic"
-            else:
-                status = "Non-basic"
-            
-            row_values = [name[:20], f"{val:,.4f}", f"{rc:,.4f}", status]
-            self._create_table_row(self.reduced_frame, i, row_values)
+        # Determine status
+        status = np.where(values_arr > 1e-6, "Basic", "Non-basic").tolist()
+        
+        rows = list(map(list, zip(
+            [name[:20] for name in names],
+            _format_column(values_arr, ",.4f"),
+            _format_column(reduced_costs, ",.4f"),
+            status
+        )))
+        
+        self.reduced_table.set_rows(rows)
     
     def display_constraint_ranges(self, ranges: List[Dict]):
         """Display allowable ranges for constraint RHS values"""
         # Clear existing
-        for widget in self.constraint_frame.winfo_children():
-            widget.destroy()
+        self.constraint_table.clear()
         
         # Create header
         columns = ["Constraint", "Current RHS", "Shadow Price", "Allow. Increase", "Allow. Decrease"]
         self._create_table_header(self.constraint_frame, columns)
         
-        # Add data rows
-        for i, r in enumerate(ranges):
-            name = r.get('name', f"Constraint {i+1}")[:15]
-            current = r.get('current_rhs', 0)
-            sp = r.get('shadow_price', 0)
-            inc = r.get('allowable_increase', float('inf'))
-            dec = r.get('allowable_decrease', 0)
-            
-            inc_str = "∞" if inc == float('inf') else f"{inc:,.2f}"
-            dec_str = f"{dec:,.2f}"
-            
-            values = [name, f"{current:,.2f}", f"{sp:,.4f}", inc_str, dec_str]
-            self._create_table_row(self.constraint_frame, i, values)
+        # Add data rows, formatting each column in one pass
+        names = [r.get('name', f"Constraint {i+1}")[:15] for i, r in enumerate(ranges)]
+        current = [r.get('current_rhs', 0) for r in ranges]
+        sp = [r.get('shadow_price', 0) for r in ranges]
+        inc = [r.get('allowable_increase', float('inf')) for r in ranges]
+        dec = [r.get('allowable_decrease', 0) for r in ranges]
+        
+        rows = list(map(list, zip(
+            names,
+            _format_column(current, ",.2f"),
+            _format_column(sp, ",.4f"),
+            _format_column(inc, ",.2f", inf_text="∞"),
+            _format_column(dec, ",.2f", inf_text="∞")
+        )))
+        
+        self.constraint_table.set_rows(rows)
     
     def display_variable_ranges(self, ranges: List[Dict]):
         """Display allowable ranges for objective coefficients"""
         # Clear existing
-        for widget in self.variable_frame.winfo_children():
-            widget.destroy()
+        self.variable_table.clear()
         
         # Create header
         columns = ["Variable", "Current Coeff", "Value", "Allow. Increase", "Allow. Decrease"]
         self._create_table_header(self.variable_frame, columns)
         
-        # Add data rows
-        for i, r in enumerate(ranges):
-            name = r.get('name', f"x{i+1}")[:15]
-            coeff = r.get('current_coefficient', 0)
-            val = r.get('current_value', 0)
-            inc = r.get('allowable_increase', float('inf'))
-            dec = r.get('allowable_decrease', float('inf'))
-            
-            inc_str = "∞" if inc == float('inf') else f"{inc:,.2f}"
-            dec_str = "∞" if dec == float('inf') else f"{dec:,.2f}"
-            
-            values = [name, f"{coeff:,.2f}", f"{val:,.4f}", inc_str, dec_str]
-            self._create_table_row(self.variable_frame, i, values)
+        # Add data rows, formatting each column in one pass
+        names = [r.get('name', f"x{i+1}")[:15] for i, r in enumerate(ranges)]
+        coeff = [r.get('current_coefficient', 0) for r in ranges]
+        val = [r.get('current_value', 0) for r in ranges]
+        inc = [r.get('allowable_increase', float('inf')) for r in ranges]
+        dec = [r.get('allowable_decrease', float('inf')) for r in ranges]
+        
+        rows = list(map(list, zip(
+            names,
+            _format_column(coeff, ",.2f"),
+            _format_column(val, ",.4f"),
+            _format_column(inc, ",.2f", inf_text="∞"),
+            _format_column(dec, ",.2f", inf_text="∞")
+        )))
+        
+        self.variable_table.set_rows(rows)
     
     def display_full_analysis(self, sensitivity_report: Dict[str, Any]):
         """Display complete sensitivity analysis from a report dictionary"""
@@ -243,11 +395,7 @@ class SensitivityTable(ctk.CTkFrame):
     
     def clear(self):
         """Clear all tables"""
-        for widget in self.shadow_frame.winfo_children():
-            widget.destroy()
-        for widget in self.reduced_frame.winfo_children():
-            widget.destroy()
-        for widget in self.constraint_frame.winfo_children():
-            widget.destroy()
-        for widget in self.variable_frame.winfo_children():
-            widget.destroy()
+        self.shadow_table.clear()
+        self.reduced_table.clear()
+        self.constraint_table.clear()
+        self.variable_table.clear()
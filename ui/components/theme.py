@@ -0,0 +1,42 @@
+"""
+Shared Theme Helpers
+Cached fonts and appearance-mode color handling used across the views
+"""
+
+import customtkinter as ctk
+import tkinter as tk
+from functools import lru_cache
+from typing import Callable, Optional
+
+try:
+    from config.settings import FONTS
+except ImportError:
+    FONTS = {"family": "Segoe UI"}
+
+
+# Fonts shared by every view, keyed by (family, size, weight)
+_FONT_CACHE = {}
+
+
+def get_font(size: int, weight: str = "normal", family: Optional[str] = FONTS["family"]) -> ctk.CTkFont:
+    """Return a cached font; family None keeps CustomTkinter's default family"""
+    key = (family, size, weight)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = _FONT_CACHE[key] = ctk.CTkFont(family=family, size=size, weight=weight)
+    return font
+
+
+@lru_cache(maxsize=None)
+def resolve_color(color, appearance_mode: str) -> str:
+    """Pick the light or dark variant of a CTk color for an appearance mode"""
+    if isinstance(color, tuple):
+        return color[1] if appearance_mode == "Dark" else color[0]
+    return color
+
+
+def track_appearance_mode(widget: tk.Misc, callback: Callable[[str], None]):
+    """Call callback with the new mode ("Light" or "Dark") on every appearance change until widget is destroyed"""
+    ctk.AppearanceModeTracker.add(callback, widget)
+    # tk.Misc.bind: CTk widgets redirect their own bind() to an inner canvas
+    tk.Misc.bind(widget, "<Destroy>", lambda event: ctk.AppearanceModeTracker.remove(callback), add="+")
@@ -4,7 +4,97 @@ Home screen with company branding and quick navigation
 """
 
 import customtkinter as ctk
+import tkinter as tk
+from functools import lru_cache, partial
+from typing import NamedTuple, Tuple
 from config.settings import APP_NAME, COMPANY_NAME, COLORS, FONTS, GROUP_NAME
+from ui.components.emoji_icons import emoji_icon
+from ui.components.theme import get_font, resolve_color, track_appearance_mode
+
+
+@lru_cache(maxsize=32)
+def _darken(hex_color: str) -> str:
+    """Darken a hex color by 15%"""
+    hex_color = hex_color.lstrip('#')
+    rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    darker = tuple(max(0, int(c * 0.85)) for c in rgb)
+    return f"#{darker[0]:02x}{darker[1]:02x}{darker[2]:02x}"
+
+
+class _CardSpec(NamedTuple):
+    """Content of one problem type card; colors are COLORS keys"""
+    title: str
+    subtitle: str
+    description: str
+    icon: str
+    features: Tuple[Tuple[str, str], ...]
+    color_key: str
+    gradient_key: str
+    view_name: str
+
+
+# Hero stats as (value, label)
+_STATS = (
+    ("3", "Solver Types"),
+    ("10+", "Variables"),
+    ("10×10+", "Matrix Size"),
+    ("Rs.", "PKR Currency")
+)
+
+# Problem type cards, left to right
+_CARD_SPECS = (
+    _CardSpec(
+        title="Linear Programming",
+        subtitle="Simplex Method",
+        description="Optimize production planning with multiple products and "
+                   "resource constraints. Maximize profit or minimize costs "
+                   "with full sensitivity analysis.",
+        icon="📊",
+        features=(
+            ("10+ decision variables", "success"),
+            ("10+ constraints supported", "success"),
+            ("Shadow prices analysis", "secondary"),
+            ("Reduced costs report", "secondary")
+        ),
+        color_key="primary",
+        gradient_key="primary_light",
+        view_name="simplex"
+    ),
+    _CardSpec(
+        title="Assignment Problem",
+        subtitle="Hungarian Algorithm",
+        description="Optimally assign workers to tasks based on skills, "
+                   "efficiency ratings, or costs. Find the perfect one-to-one "
+                   "matching for maximum productivity.",
+        icon="👥",
+        features=(
+            ("10×10+ assignment matrix", "success"),
+            ("Maximize or minimize", "success"),
+            ("Visual assignment grid", "secondary"),
+            ("Detailed cost breakdown", "secondary")
+        ),
+        color_key="secondary",
+        gradient_key="secondary_light",
+        view_name="assignment"
+    ),
+    _CardSpec(
+        title="Transportation",
+        subtitle="VAM + MODI Method",
+        description="Plan cost-effective distribution from plants to "
+                   "construction sites. Minimize shipping costs while "
+                   "meeting supply and demand requirements.",
+        icon="🚚",
+        features=(
+            ("10+ sources/destinations", "success"),
+            ("VAM initial solution", "success"),
+            ("MODI optimization", "secondary"),
+            ("Route cost details", "secondary")
+        ),
+        color_key="accent",
+        gradient_key="accent_light",
+        view_name="transportation"
+    )
+)
 
 
 class DashboardView(ctk.CTkFrame):
@@ -12,72 +102,167 @@ class DashboardView(ctk.CTkFrame):
     Dashboard/Home view with company branding and quick access to problem types
     """
     
+    _WHEEL_SEQUENCES = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+    
     def __init__(self, parent, on_navigate=None, **kwargs):
         super().__init__(parent, fg_color="transparent", **kwargs)
         
         self.on_navigate = on_navigate
+        
+        # Global wheel bindings replaced while the pointer is over the page
+        self._saved_wheel_bindings = None
+        self._cards_built = False
         self._create_widgets()
     
     def _create_widgets(self):
-        """Create dashboard widgets"""
+        """Create dashboard widgets; the problem cards follow once the rest is shown"""
         # Main scrollable container
-        main_scroll = ctk.CTkScrollableFrame(self, fg_color="transparent")
-        main_scroll.pack(fill="both", expand=True, padx=0, pady=0)
+        main_scroll = self._create_scroller()
         
-        # Hero Header Section
+        self._create_hero(main_scroll)
+        self._create_content(main_scroll)
+        self._create_footer(main_scroll)
+        
+        self.after_idle(self._create_cards_deferred)
+    
+    def _create_scroller(self) -> ctk.CTkFrame:
+        """Create a plain canvas scroller and return the frame content goes in
+        
+        CTkScrollableFrame nests canvases and redraws them on every resize; one
+        tk.Canvas with a single embedded frame is enough for a vertical page.
+        """
+        background = (COLORS["background"], COLORS["background_dark"])
+        
+        self._canvas = tk.Canvas(
+            self,
+            highlightthickness=0,
+            bd=0,
+            bg=resolve_color(background, ctk.get_appearance_mode())
+        )
+        
+        # The embedded frame recolors itself; the canvas behind short content must follow
+        track_appearance_mode(
+            self, lambda mode: self._canvas.configure(bg=resolve_color(background, mode))
+        )
+        scrollbar = ctk.CTkScrollbar(self, orientation="vertical", command=self._canvas.yview)
+        self._canvas.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        self._canvas.pack(side="left", fill="both", expand=True)
+        
+        content = ctk.CTkFrame(self._canvas, fg_color=background, corner_radius=0)
+        self._content_window = self._canvas.create_window((0, 0), window=content, anchor="nw")
+        
+        # Keep the content as wide as the canvas and the scroll region fitted to it
+        content.bind("<Configure>", lambda e: self._canvas.configure(scrollregion=self._canvas.bbox("all")))
+        self._canvas.bind("<Configure>", lambda e: self._canvas.itemconfigure(self._content_window, width=e.width))
+        
+        # Wheel events land on whichever child is under the pointer, so the page
+        # takes over the global wheel bindings only while the pointer is over it; a
+        # canvas destroyed under the pointer never sees <Leave>, so restore on destroy too
+        self._canvas.bind("<Enter>", self._bind_wheel)
+        self._canvas.bind("<Leave>", self._unbind_wheel)
+        self._canvas.bind("<Destroy>", self._restore_wheel_bindings, add="+")
+        
+        return content
+    
+    def _bind_wheel(self, event):
+        """Route wheel events to the page while the pointer is over it"""
+        if self._saved_wheel_bindings is not None:
+            return
+        self._saved_wheel_bindings = {
+            sequence: self._canvas.bind_all(sequence) for sequence in self._WHEEL_SEQUENCES
+        }
+        for sequence in self._WHEEL_SEQUENCES:
+            self._canvas.bind_all(sequence, self._on_mousewheel)
+    
+    def _unbind_wheel(self, event):
+        """Restore the previous global wheel bindings once the pointer leaves the page"""
+        if self._saved_wheel_bindings is None:
+            return
+        
+        # Moving onto the embedded content also fires <Leave>
+        try:
+            widget = self.winfo_containing(event.x_root, event.y_root)
+            if widget is not None and str(widget).startswith(str(self._canvas)):
+                return
+        except (KeyError, tk.TclError):
+            pass
+        
+        self._restore_wheel_bindings()
+    
+    def _restore_wheel_bindings(self, event=None):
+        """Put back the global wheel bindings saved on enter, if any"""
+        if self._saved_wheel_bindings is None:
+            return
+        for sequence, script in self._saved_wheel_bindings.items():
+            self._canvas.tk.call("bind", "all", sequence, script)
+        self._saved_wheel_bindings = None
+    
+    def _on_mousewheel(self, event):
+        """Scroll the page when the wheel turns over the dashboard"""
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self._canvas.yview_scroll(-1, "units")
+        else:
+            self._canvas.yview_scroll(1, "units")
+        return "break"
+    
+    def _create_hero(self, parent):
+        """Create the branded hero header with the stats row"""
         hero_frame = ctk.CTkFrame(
-            main_scroll, 
+            parent, 
             fg_color=COLORS["primary"],
             corner_radius=0
         )
         hero_frame.pack(fill="x", padx=0, pady=0)
         
+        # Hero rows are gridded in a single column
         hero_content = ctk.CTkFrame(hero_frame, fg_color="transparent")
         hero_content.pack(fill="x", padx=50, pady=40)
+        hero_content.columnconfigure(0, weight=1)
         
         # Welcome text
         ctk.CTkLabel(
             hero_content,
             text="Welcome to",
-            font=ctk.CTkFont(family=FONTS["family"], size=16),
+            font=get_font(16),
             text_color=COLORS["text_muted"]
-        ).pack(anchor="w")
+        ).grid(row=0, column=0, sticky="w")
         
         # Company name with gradient effect simulation
         title_frame = ctk.CTkFrame(hero_content, fg_color="transparent")
-        title_frame.pack(anchor="w", pady=(5, 0))
+        title_frame.grid(row=1, column=0, sticky="w", pady=(5, 0))
         
         ctk.CTkLabel(
             title_frame,
             text="THE BEST LABORATORY",
-            font=ctk.CTkFont(family=FONTS["family"], size=FONTS["size_hero"], weight="bold"),
+            font=get_font(FONTS["size_hero"], "bold"),
             text_color="#FFFFFF"
         ).pack(side="left")
         
         ctk.CTkLabel(
             title_frame,
             text="  PAKISTAN",
-            font=ctk.CTkFont(family=FONTS["family"], size=FONTS["size_hero"], weight="bold"),
+            font=get_font(FONTS["size_hero"], "bold"),
             text_color=COLORS["accent"]
         ).pack(side="left")
         
         # Group badge
         group_frame = ctk.CTkFrame(hero_content, fg_color="transparent")
-        group_frame.pack(anchor="w", pady=(10, 0))
+        group_frame.grid(row=2, column=0, sticky="w", pady=(10, 0))
         
         group_badge = ctk.CTkFrame(group_frame, fg_color=COLORS["accent"], corner_radius=6)
         group_badge.pack(side="left")
         ctk.CTkLabel(
             group_badge,
             text=f"  {GROUP_NAME}  ",
-            font=ctk.CTkFont(family=FONTS["family"], size=12, weight="bold"),
+            font=get_font(12, "bold"),
             text_color="#FFFFFF"
         ).pack(padx=8, pady=4)
         
         ctk.CTkLabel(
             group_frame,
             text="  |  Operations Research Decision Support System",
-            font=ctk.CTkFont(family=FONTS["family"], size=FONTS["size_lg"]),
+            font=get_font(FONTS["size_lg"]),
             text_color=COLORS["secondary_light"]
         ).pack(side="left")
         
@@ -89,39 +274,30 @@ class DashboardView(ctk.CTkFrame):
             fg_color=COLORS["accent"],
             corner_radius=2
         )
-        accent_bar.pack(anchor="w", pady=(20, 0))
+        accent_bar.grid(row=3, column=0, sticky="w", pady=(20, 0))
         
-        # Stats row
+        # Stats row: value above label, one column per stat
         stats_frame = ctk.CTkFrame(hero_content, fg_color="transparent")
-        stats_frame.pack(fill="x", pady=(25, 0))
-        
-        stats = [
-            ("3", "Solver Types"),
-            ("10+", "Variables"),
-            ("10×10+", "Matrix Size"),
-            ("Rs.", "PKR Currency")
-        ]
-        
-        for value, label in stats:
-            stat_item = ctk.CTkFrame(stats_frame, fg_color="transparent")
-            stat_item.pack(side="left", padx=(0, 50))
-            
+        stats_frame.grid(row=4, column=0, sticky="ew", pady=(25, 0))
+        
+        for i, (value, label) in enumerate(_STATS):
             ctk.CTkLabel(
-                stat_item,
+                stats_frame,
                 text=value,
-                font=ctk.CTkFont(family=FONTS["family"], size=28, weight="bold"),
+                font=get_font(28, "bold"),
                 text_color=COLORS["accent"]
-            ).pack(anchor="w")
+            ).grid(row=0, column=i, sticky="w", padx=(0, 50))
             
             ctk.CTkLabel(
-                stat_item,
+                stats_frame,
                 text=label,
-                font=ctk.CTkFont(family=FONTS["family"], size=12),
+                font=get_font(12),
                 text_color=COLORS["text_muted"]
-            ).pack(anchor="w")
-        
-        # Content section
-        content_frame = ctk.CTkFrame(main_scroll, fg_color="transparent")
+            ).grid(row=1, column=i, sticky="w", padx=(0, 50))
+    
+    def _create_content(self, parent):
+        """Create the section title and the (initially empty) cards grid"""
+        content_frame = ctk.CTkFrame(parent, fg_color="transparent")
         content_frame.pack(fill="both", expand=True, padx=50, pady=30)
         
         # Section title
@@ -131,90 +307,52 @@ class DashboardView(ctk.CTkFrame):
         ctk.CTkLabel(
             section_header,
             text="Choose a Problem Type",
-            font=ctk.CTkFont(family=FONTS["family"], size=FONTS["size_xl"], weight="bold"),
+            font=get_font(FONTS["size_xl"], "bold"),
             text_color=COLORS["text_primary"]
         ).pack(side="left")
         
         ctk.CTkLabel(
             section_header,
             text="Select an optimization method to get started",
-            font=ctk.CTkFont(family=FONTS["family"], size=FONTS["size_sm"]),
+            font=get_font(FONTS["size_sm"]),
             text_color=COLORS["text_secondary"]
         ).pack(side="right", pady=(8, 0))
         
         # Problem type cards
-        cards_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
-        cards_frame.pack(fill="both", expand=True)
+        self._cards_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
+        self._cards_frame.pack(fill="both", expand=True)
         
         # Configure grid for 3 columns
-        cards_frame.columnconfigure((0, 1, 2), weight=1, uniform="card")
-        cards_frame.rowconfigure(0, weight=1)
-        
-        # Simplex card
-        self._create_card(
-            cards_frame,
-            title="Linear Programming",
-            subtitle="Simplex Method",
-            description="Optimize production planning with multiple products and "
-                       "resource constraints. Maximize profit or minimize costs "
-                       "with full sensitivity analysis.",
-            icon="📊",
-            features=[
-                ("10+ decision variables", COLORS["success"]),
-                ("10+ constraints supported", COLORS["success"]),
-                ("Shadow prices analysis", COLORS["secondary"]),
-                ("Reduced costs report", COLORS["secondary"])
-            ],
-            color=COLORS["primary"],
-            gradient_color=COLORS["primary_light"],
-            command=lambda: self._navigate("simplex"),
-            row=0, col=0
-        )
-        
-        # Assignment card
-        self._create_card(
-            cards_frame,
-            title="Assignment Problem",
-            subtitle="Hungarian Algorithm",
-            description="Optimally assign workers to tasks based on skills, "
-                       "efficiency ratings, or costs. Find the perfect one-to-one "
-                       "matching for maximum productivity.",
-            icon="👥",
-            features=[
-                ("10×10+ assignment matrix", COLORS["success"]),
-                ("Maximize or minimize", COLORS["success"]),
-                ("Visual assignment grid", COLORS["secondary"]),
-                ("Detailed cost breakdown", COLORS["secondary"])
-            ],
-            color=COLORS["secondary"],
-            gradient_color=COLORS["secondary_light"],
-            command=lambda: self._navigate("assignment"),
-            row=0, col=1
-        )
-        
-        # Transportation card
+        self._cards_frame.columnconfigure((0, 1, 2), weight=1, uniform="card")
+        self._cards_frame.rowconfigure(0, weight=1)
+    
+    def _create_cards_deferred(self):
+        """Build the problem cards one per event-loop turn so the view paints in between"""
+        if self._cards_built:
+            return
+        self._cards_built = True
+        
+        for col, spec in enumerate(_CARD_SPECS):
+            self.after(0, lambda spec=spec, col=col: self._create_card_from_spec(spec, col))
+    
+    def _create_card_from_spec(self, spec: _CardSpec, col: int):
+        """Create the card described by spec in the given grid column"""
         self._create_card(
-            cards_frame,
-            title="Transportation",
-            subtitle="VAM + MODI Method",
-            description="Plan cost-effective distribution from plants to "
-                       "construction sites. Minimize shipping costs while "
-                       "meeting supply and demand requirements.",
-            icon="🚚",
-            features=[
-                ("10+ sources/destinations", COLORS["success"]),
-                ("VAM initial solution", COLORS["success"]),
-                ("MODI optimization", COLORS["secondary"]),
-                ("Route cost details", COLORS["secondary"])
-            ],
-            color=COLORS["accent"],
-            gradient_color=COLORS["accent_light"],
-            command=lambda: self._navigate("transportation"),
-            row=0, col=2
+            self._cards_frame,
+            title=spec.title,
+            subtitle=spec.subtitle,
+            description=spec.description,
+            icon=spec.icon,
+            features=[(text, COLORS[key]) for text, key in spec.features],
+            color=COLORS[spec.color_key],
+            gradient_color=COLORS[spec.gradient_key],
+            command=partial(self._navigate, spec.view_name),
+            row=0, col=col
         )
-        
-        # Footer
-        footer_frame = ctk.CTkFrame(main_scroll, fg_color="transparent")
+    
+    def _create_footer(self, parent):
+        """Create the footer with divider and credits"""
+        footer_frame = ctk.CTkFrame(parent, fg_color="transparent")
         footer_frame.pack(fill="x", padx=50, pady=(10, 30))
         
         # Divider
@@ -230,14 +368,14 @@ class DashboardView(ctk.CTkFrame):
         ctk.CTkLabel(
             footer_content,
             text="🧪 The Best Laboratory Pakistan - Scientific Excellence | OptimizeX Group",
-            font=ctk.CTkFont(family=FONTS["family"], size=FONTS["size_sm"]),
+            font=get_font(FONTS["size_sm"]),
             text_color=COLORS["text_secondary"]
         ).pack(side="left")
         
         ctk.CTkLabel(
             footer_content,
             text="Made in Pakistan 🇵🇰",
-            font=ctk.CTkFont(family=FONTS["family"], size=FONTS["size_sm"]),
+            font=get_font(FONTS["size_sm"]),
             text_color=COLORS["text_muted"]
         ).pack(side="right")
     
@@ -256,13 +394,20 @@ class DashboardView(ctk.CTkFrame):
         col: int
     ):
         """Create a modern problem type card"""
+        # Theme colors used below, looked up once
+        surface = COLORS["surface"]
+        border = COLORS["border"]
+        text_primary = COLORS["text_primary"]
+        text_secondary = COLORS["text_secondary"]
+        background = COLORS["background"]
+        
         # Card container with shadow effect
         card = ctk.CTkFrame(
             parent, 
             corner_radius=16,
-            fg_color=COLORS["surface"],
+            fg_color=surface,
             border_width=1,
-            border_color=COLORS["border"]
+            border_color=border
         )
         card.grid(row=row, column=col, padx=12, pady=12, sticky="nsew")
         
@@ -276,23 +421,22 @@ class DashboardView(ctk.CTkFrame):
         accent.pack(fill="x", padx=20, pady=(20, 0))
         
         # Icon with background
-        icon_container = ctk.CTkFrame(card, fg_color="transparent")
-        icon_container.pack(pady=(20, 15))
-        
         icon_bg = ctk.CTkFrame(
-            icon_container,
+            card,
             width=70,
             height=70,
             corner_radius=20,
             fg_color=color
         )
-        icon_bg.pack()
+        icon_bg.pack(pady=(20, 15))
         icon_bg.pack_propagate(False)
         
+        image = emoji_icon(icon, 36)
         ctk.CTkLabel(
             icon_bg,
-            text=icon,
-            font=ctk.CTkFont(size=32),
+            text="" if image else icon,
+            image=image,
+            font=get_font(32, family=None),
             text_color="#FFFFFF"
         ).place(relx=0.5, rely=0.5, anchor="center")
         
@@ -300,8 +444,8 @@ class DashboardView(ctk.CTkFrame):
         ctk.CTkLabel(
             card,
             text=title,
-            font=ctk.CTkFont(family=FONTS["family"], size=FONTS["size_xl"], weight="bold"),
-            text_color=COLORS["text_primary"]
+            font=get_font(FONTS["size_xl"], "bold"),
+            text_color=text_primary
         ).pack(pady=(5, 0))
         
         # Subtitle badge
@@ -315,7 +459,7 @@ class DashboardView(ctk.CTkFrame):
         ctk.CTkLabel(
             subtitle_frame,
             text=f"  {subtitle}  ",
-            font=ctk.CTkFont(family=FONTS["family"], size=11, weight="bold"),
+            font=get_font(11, "bold"),
             text_color="#FFFFFF"
         ).pack(padx=12, pady=4)
         
@@ -323,44 +467,46 @@ class DashboardView(ctk.CTkFrame):
         ctk.CTkLabel(
             card,
             text=description,
-            font=ctk.CTkFont(family=FONTS["family"], size=FONTS["size_sm"]),
-            text_color=COLORS["text_secondary"],
+            font=get_font(FONTS["size_sm"]),
+            text_color=text_secondary,
             wraplength=260,
             justify="center"
         ).pack(padx=20, pady=(0, 15))
         
         # Features list with colored checkmarks
-        features_frame = ctk.CTkFrame(card, fg_color=COLORS["background"])
+        features_frame = ctk.CTkFrame(card, fg_color=background)
         features_frame.pack(fill="x", padx=15, pady=10)
         
-        for feature_text, feature_color in features:
-            feature_row = ctk.CTkFrame(features_frame, fg_color="transparent")
-            feature_row.pack(fill="x", padx=15, pady=4)
-            
+        # Checkmark and text share one grid instead of a frame per row
+        features_frame.columnconfigure(1, weight=1)
+        check_font = get_font(14, "bold", family=None)
+        feature_font = get_font(12)
+        
+        for i, (feature_text, feature_color) in enumerate(features):
             ctk.CTkLabel(
-                feature_row,
+                features_frame,
                 text="✓",
-                font=ctk.CTkFont(size=14, weight="bold"),
+                font=check_font,
                 text_color=feature_color,
                 width=20
-            ).pack(side="left")
+            ).grid(row=i, column=0, sticky="w", padx=(15, 5), pady=4)
             
             ctk.CTkLabel(
-                feature_row,
+                features_frame,
                 text=feature_text,
-                font=ctk.CTkFont(family=FONTS["family"], size=12),
-                text_color=COLORS["text_primary"],
+                font=feature_font,
+                text_color=text_primary,
                 anchor="w"
-            ).pack(side="left", padx=(5, 0))
+            ).grid(row=i, column=1, sticky="w", padx=(0, 15), pady=4)
         
         # Action button
         btn = ctk.CTkButton(
             card,
             text="Open Solver  →",
             command=command,
-            font=ctk.CTkFont(family=FONTS["family"], size=14, weight="bold"),
+            font=get_font(14, "bold"),
             fg_color=color,
-            hover_color=self._darken_color(color),
+            hover_color=_darken(color),
             height=45,
             corner_radius=10
         )
@@ -370,10 +516,3 @@ class DashboardView(ctk.CTkFrame):
         """Navigate to a view"""
         if self.on_navigate:
             self.on_navigate(view_name)
-    
-    def _darken_color(self, hex_color: str) -> str:
-        """Darken a hex color by 15%"""
-        hex_color = hex_color.lstrip('#')
-        rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        darker = tuple(max(0, int(c * 0.85)) for c in rgb)
-        return f"#{darker[0]:02x}{darker[1]:02x}{darker[2]:02x}"
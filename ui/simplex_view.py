@@ -5,16 +5,41 @@ UI for inputting and solving LP problems with sensitivity analysis
 
 import customtkinter as ctk
 import numpy as np
+import threading
 from tkinter import messagebox
-from typing import Optional, List
+from typing import Optional, List, Tuple, TYPE_CHECKING
 
 from ui.components.matrix_input import MatrixInput, VectorInput
 from ui.components.result_display import ResultDisplay
 from ui.components.sensitivity_table import SensitivityTable
 from ui.components.what_if_panel import WhatIfPanel
-from ui.components.panel_controls import PanelHeader, PanelToggleBar, FullscreenWindow
-from algorithms.simplex import SimplexSolver, create_sample_problem
-from config.settings import PRODUCTS, RESOURCES, DEFAULT_LP_VARIABLES, DEFAULT_LP_CONSTRAINTS, COLORS, SPACING, FONTS
+from ui.components.panel_controls import PanelHeader, PanelToggleBar
+from ui.components.theme import get_font
+from config.settings import PRODUCTS, RESOURCES, DEFAULT_LP_VARIABLES, DEFAULT_LP_CONSTRAINTS, COLORS, SPACING
+
+if TYPE_CHECKING:
+    from algorithms.simplex import SimplexSolver
+
+# Sample TBLP production problem (read-only, shared across loads)
+_SAMPLE_PROFITS = np.array([5000, 7500, 4000, 3500, 6000, 4500, 8000, 3000, 9000, 8500], dtype=np.float64)
+_SAMPLE_PROFITS.setflags(write=False)
+
+_SAMPLE_USAGE = np.array([
+    [2, 3, 1, 2, 1, 2, 3, 1, 2, 3],
+    [1, 2, 3, 1, 2, 1, 2, 3, 1, 2],
+    [3, 2, 4, 1, 2, 3, 1, 2, 4, 2],
+    [1, 2, 1, 3, 4, 2, 1, 2, 1, 3],
+    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+    [4, 5, 3, 4, 5, 3, 4, 5, 3, 4],
+    [0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5],
+    [0.1, 0.2, 0.15, 0.1, 0.2, 0.15, 0.1, 0.2, 0.15, 0.1],
+    [10, 15, 8, 12, 10, 8, 15, 10, 12, 14],
+    [1, 2, 1, 1, 2, 1, 2, 1, 1, 2]
+], dtype=np.float64)
+_SAMPLE_USAGE.setflags(write=False)
+
+_SAMPLE_CAPACITY = np.array([5000, 4000, 480, 400, 1000, 2000, 300, 100, 10000, 2500], dtype=np.float64)
+_SAMPLE_CAPACITY.setflags(write=False)
 
 
 class SimplexView(ctk.CTkFrame):
@@ -145,6 +170,10 @@ class SimplexView(ctk.CTkFrame):
         self.last_result = None
         self.last_solver = None
         
+        # Solver running on the worker thread, and the thread itself
+        self._pending_solver = None
+        self._solve_thread = None
+        
         # Popup window references
         self.popup_window = None
         self.inputs_popup = None
@@ -187,25 +216,25 @@ class SimplexView(ctk.CTkFrame):
                 canvas.yview_scroll(scroll_amount, "units")
                 return "break"
             
-            # Bind to the scrollable frame and all its children
-            scrollable_frame.bind("<MouseWheel>", smooth_scroll, add="+")
-            scrollable_frame.bind("<Button-4>", smooth_scroll, add="+")
-            scrollable_frame.bind("<Button-5>", smooth_scroll, add="+")
+            # One bindtag per panel carries the handler; descendants only get the tag
+            # added, instead of three Python callbacks registered on every widget
+            tag = f"SmoothScroll{id(canvas)}"
+            for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                self.bind_class(tag, sequence, smooth_scroll)
             
-            # Also bind to canvas
-            canvas.bind("<MouseWheel>", smooth_scroll, add="+")
-            canvas.bind("<Button-4>", smooth_scroll, add="+")
-            canvas.bind("<Button-5>", smooth_scroll, add="+")
+            # The tag goes right after each widget's own tag, where add="+" bindings used to run
+            def add_tag(widget):
+                tags = widget.bindtags()
+                widget.bindtags(tags[:1] + (tag,) + tags[1:])
             
-            # Bind to all children recursively
-            def bind_children(widget):
-                widget.bind("<MouseWheel>", smooth_scroll, add="+")
-                widget.bind("<Button-4>", smooth_scroll, add="+")
-                widget.bind("<Button-5>", smooth_scroll, add="+")
+            def tag_children(widget):
+                add_tag(widget)
                 for child in widget.winfo_children():
-                    bind_children(child)
+                    tag_children(child)
             
-            bind_children(scrollable_frame)
+            # Tag the canvas, the scrollable frame and all its children
+            add_tag(canvas)
+            tag_children(scrollable_frame)
             
         except Exception:
             pass  # Silently fail if canvas not accessible
@@ -229,7 +258,7 @@ class SimplexView(ctk.CTkFrame):
         ctk.CTkLabel(
             title_frame,
             text="📊",
-            font=ctk.CTkFont(size=28)
+            font=get_font(28, family=None)
         ).pack(side="left", padx=(0, SPACING["sm"]))
         
         text_frame = ctk.CTkFrame(title_frame, fg_color="transparent")
@@ -238,14 +267,14 @@ class SimplexView(ctk.CTkFrame):
         ctk.CTkLabel(
             text_frame,
             text="Linear Programming",
-            font=ctk.CTkFont(family=FONTS["family"], size=22, weight="bold"),
+            font=get_font(22, "bold"),
             text_color="#FFFFFF"
         ).pack(anchor="w")
         
         ctk.CTkLabel(
             text_frame,
             text="Simplex Method Solver",
-            font=ctk.CTkFont(family=FONTS["family"], size=12),
+            font=get_font(12),
             text_color=COLORS["text_muted"]
         ).pack(anchor="w")
         
@@ -256,7 +285,7 @@ class SimplexView(ctk.CTkFrame):
             command=self._load_sample,
             width=180,
             height=38,
-            font=ctk.CTkFont(family=FONTS["family"], size=13, weight="bold"),
+            font=get_font(13, "bold"),
             fg_color=COLORS["accent"],
             hover_color=COLORS["accent_hover"],
             corner_radius=8
@@ -281,7 +310,7 @@ class SimplexView(ctk.CTkFrame):
         ctk.CTkLabel(
             card_header,
             text="⚙️  Problem Configuration",
-            font=ctk.CTkFont(family=FONTS["family"], size=13, weight="bold"),
+            font=get_font(13, "bold"),
             text_color=COLORS["text_primary"]
         ).pack(side="left")
         
@@ -297,7 +326,7 @@ class SimplexView(ctk.CTkFrame):
         ctk.CTkLabel(
             size_frame, 
             text="Variables:",
-            font=ctk.CTkFont(family=FONTS["family"], size=12)
+            font=get_font(12)
         ).pack(side="left", padx=(0, SPACING["xs"]))
         
         self.var_spinbox = ctk.CTkEntry(
@@ -313,7 +342,7 @@ class SimplexView(ctk.CTkFrame):
         ctk.CTkLabel(
             size_frame, 
             text="Constraints:",
-            font=ctk.CTkFont(family=FONTS["family"], size=12)
+            font=get_font(12)
         ).pack(side="left", padx=(0, SPACING["xs"]))
         
         self.const_spinbox = ctk.CTkEntry(
@@ -344,7 +373,7 @@ class SimplexView(ctk.CTkFrame):
         ctk.CTkLabel(
             obj_frame, 
             text="Objective:",
-            font=ctk.CTkFont(family=FONTS["family"], size=13)
+            font=get_font(13)
         ).pack(side="left", padx=(0, SPACING["md"]))
         
         self.objective_var = ctk.StringVar(value="maximize")
@@ -353,7 +382,7 @@ class SimplexView(ctk.CTkFrame):
             text="Maximize Profit",
             variable=self.objective_var,
             value="maximize",
-            font=ctk.CTkFont(family=FONTS["family"], size=13)
+            font=get_font(13)
         ).pack(side="left", padx=(0, SPACING["lg"]))
         
         ctk.CTkRadioButton(
@@ -361,7 +390,7 @@ class SimplexView(ctk.CTkFrame):
             text="Minimize Cost",
             variable=self.objective_var,
             value="minimize",
-            font=ctk.CTkFont(family=FONTS["family"], size=13)
+            font=get_font(13)
         ).pack(side="left")
     
     def _create_objective_input(self):
@@ -383,14 +412,14 @@ class SimplexView(ctk.CTkFrame):
         ctk.CTkLabel(
             card_header,
             text="💰  Objective Function",
-            font=ctk.CTkFont(family=FONTS["family"], size=13, weight="bold"),
+            font=get_font(13, "bold"),
             text_color=COLORS["text_primary"]
         ).pack(side="left")
         
         ctk.CTkLabel(
             card_header,
             text="Profit/Cost per unit",
-            font=ctk.CTkFont(family=FONTS["family"], size=10),
+            font=get_font(10),
             text_color=COLORS["text_muted"]
         ).pack(side="right")
         
@@ -432,14 +461,14 @@ class SimplexView(ctk.CTkFrame):
         ctk.CTkLabel(
             card_header,
             text="📝  Constraint Coefficients",
-            font=ctk.CTkFont(family=FONTS["family"], size=13, weight="bold"),
+            font=get_font(13, "bold"),
             text_color=COLORS["text_primary"]
         ).pack(side="left")
         
         ctk.CTkLabel(
             card_header,
             text="Resources per unit",
-            font=ctk.CTkFont(family=FONTS["family"], size=10),
+            font=get_font(10),
             text_color=COLORS["text_muted"]
         ).pack(side="right")
         
@@ -470,7 +499,7 @@ class SimplexView(ctk.CTkFrame):
         ctk.CTkLabel(
             rhs_header,
             text="📋  Right-Hand Side (RHS)",
-            font=ctk.CTkFont(family=FONTS["family"], size=12, weight="bold"),
+            font=get_font(12, "bold"),
             text_color=COLORS["text_secondary"]
         ).pack(side="left")
         
@@ -503,17 +532,18 @@ class SimplexView(ctk.CTkFrame):
         btn_frame = ctk.CTkFrame(btn_card, fg_color="transparent")
         btn_frame.pack(fill="x", padx=SPACING["card_padding"], pady=SPACING["card_padding"])
         
-        ctk.CTkButton(
+        self.solve_btn = ctk.CTkButton(
             btn_frame,
             text="🔍 Solve Problem",
             command=self._solve,
             width=160,
             height=44,
-            font=ctk.CTkFont(family=FONTS["family"], size=14, weight="bold"),
+            font=get_font(14, "bold"),
             fg_color=COLORS["primary"],
             hover_color=COLORS["primary_dark"],
             corner_radius=8
-        ).pack(side="left", padx=(0, SPACING["md"]))
+        )
+        self.solve_btn.pack(side="left", padx=(0, SPACING["md"]))
         
         ctk.CTkButton(
             btn_frame,
@@ -521,7 +551,7 @@ class SimplexView(ctk.CTkFrame):
             command=self._clear,
             width=130,
             height=44,
-            font=ctk.CTkFont(family=FONTS["family"], size=13),
+            font=get_font(13),
             fg_color=COLORS["error"],
             hover_color=COLORS["error_light"],
             corner_radius=8
@@ -533,7 +563,7 @@ class SimplexView(ctk.CTkFrame):
             command=self._export,
             width=140,
             height=44,
-            font=ctk.CTkFont(family=FONTS["family"], size=13),
+            font=get_font(13),
             fg_color=COLORS["success"],
             hover_color=COLORS["success_light"],
             corner_radius=8
@@ -548,7 +578,7 @@ class SimplexView(ctk.CTkFrame):
         ctk.CTkLabel(
             header_frame,
             text="📊  Results",
-            font=ctk.CTkFont(family=FONTS["family"], size=16, weight="bold"),
+            font=get_font(16, "bold"),
             text_color=COLORS["text_primary"]
         ).pack(side="left")
         
@@ -579,7 +609,7 @@ class SimplexView(ctk.CTkFrame):
         ctk.CTkLabel(
             control_inner,
             text="📊 What-If Analysis",
-            font=ctk.CTkFont(family=FONTS["family"], size=14, weight="bold"),
+            font=get_font(14, "bold"),
             text_color="#FFFFFF"
         ).pack(side="left")
         
@@ -593,7 +623,7 @@ class SimplexView(ctk.CTkFrame):
             text="⇔",
             width=32,
             height=28,
-            font=ctk.CTkFont(size=14),
+            font=get_font(14, family=None),
             fg_color=COLORS["secondary"],
             hover_color=COLORS["secondary_light"],
             corner_radius=6,
@@ -607,7 +637,7 @@ class SimplexView(ctk.CTkFrame):
             text="⧉",
             width=32,
             height=28,
-            font=ctk.CTkFont(size=14),
+            font=get_font(14, family=None),
             fg_color=COLORS["accent"],
             hover_color=COLORS["accent_hover"],
             corner_radius=6,
@@ -621,7 +651,7 @@ class SimplexView(ctk.CTkFrame):
             text="✕",
             width=32,
             height=28,
-            font=ctk.CTkFont(size=12),
+            font=get_font(12, family=None),
             fg_color=COLORS["text_secondary"],
             hover_color="#475569",
             corner_radius=6,
@@ -637,6 +667,10 @@ class SimplexView(ctk.CTkFrame):
             on_constraint_change=self._on_constraint_change
         )
         self.whatif_panel.pack(fill="both", expand=True, padx=SPACING["md"], pady=SPACING["sm"])
+        
+        # The docked panel is kept while popped out; the popup's panel is built on first use
+        self._docked_whatif = self.whatif_panel
+        self._popup_whatif = None
     
     def _toggle_expand_panel(self):
         """Toggle panel between compact and expanded width"""
@@ -665,16 +699,43 @@ class SimplexView(ctk.CTkFrame):
         self.right_container.pack_forget()
         self.right_panel_visible = False
         
-        # Create popup window
-        self.popup_window = ctk.CTkToplevel(self)
-        self.popup_window.title("What-If Analysis - Linear Programming")
-        self.popup_window.geometry("600x700")
-        self.popup_window.minsize(400, 500)
+        # The popup is built once and only withdrawn when docked
+        if self.popup_window is None:
+            self._create_popup_window()
+        else:
+            self.popup_window.deiconify()
         
         # Make it stay on top initially
         self.popup_window.attributes('-topmost', True)
         self.popup_window.after(100, lambda: self.popup_window.attributes('-topmost', False))
         
+        # Carry the current What-If state over instead of rebuilding the panel
+        self._transfer_whatif(self._docked_whatif, self._popup_whatif)
+        self.whatif_panel = self._popup_whatif
+        
+        self.right_panel_popped = True
+        
+        # Add show button to results panel
+        self.show_panel_btn = ctk.CTkButton(
+            self.middle_panel,
+            text="📊 Open What-If Panel",
+            width=180,
+            height=36,
+            font=get_font(13, "bold"),
+            fg_color=COLORS["primary"],
+            hover_color=COLORS["primary_dark"],
+            corner_radius=8,
+            command=self._focus_popup
+        )
+        self.show_panel_btn.pack(pady=SPACING["md"])
+    
+    def _create_popup_window(self):
+        """Create the pop-out window with its own What-If panel"""
+        self.popup_window = ctk.CTkToplevel(self)
+        self.popup_window.title("What-If Analysis - Linear Programming")
+        self.popup_window.geometry("600x700")
+        self.popup_window.minsize(400, 500)
+        
         # Handle close
         self.popup_window.protocol("WM_DELETE_WINDOW", self._close_popup)
         
@@ -697,7 +758,7 @@ class SimplexView(ctk.CTkFrame):
         ctk.CTkLabel(
             header_inner,
             text="📊 What-If Analysis",
-            font=ctk.CTkFont(family=FONTS["family"], size=18, weight="bold"),
+            font=get_font(18, "bold"),
             text_color="#FFFFFF"
         ).pack(side="left")
         
@@ -707,42 +768,35 @@ class SimplexView(ctk.CTkFrame):
             text="📌 Dock Panel",
             width=120,
             height=32,
-            font=ctk.CTkFont(family=FONTS["family"], size=12),
+            font=get_font(12),
             fg_color=COLORS["accent"],
             hover_color=COLORS["accent_hover"],
             corner_radius=6,
             command=self._close_popup
         ).pack(side="right")
         
-        # Move whatif_panel to popup
-        self.whatif_panel.pack_forget()
-        self.whatif_panel = WhatIfPanel(
+        # What-If panel of the popup
+        self._popup_whatif = WhatIfPanel(
             popup_frame,
             on_resolve=self._resolve_whatif,
             on_variable_change=self._on_variable_change,
             on_constraint_change=self._on_constraint_change
         )
-        self.whatif_panel.pack(fill="both", expand=True, padx=SPACING["sm"], pady=SPACING["sm"])
-        
-        # Reload current problem data if available
-        if self.last_result and self.last_solver:
-            self._reload_whatif_data()
-        
-        self.right_panel_popped = True
-        
-        # Add show button to results panel
-        self.show_panel_btn = ctk.CTkButton(
-            self.middle_panel,
-            text="📊 Open What-If Panel",
-            width=180,
-            height=36,
-            font=ctk.CTkFont(family=FONTS["family"], size=13, weight="bold"),
-            fg_color=COLORS["primary"],
-            hover_color=COLORS["primary_dark"],
-            corner_radius=8,
-            command=self._focus_popup
+        self._popup_whatif.pack(fill="both", expand=True, padx=SPACING["sm"], pady=SPACING["sm"])
+    
+    def _transfer_whatif(self, source: WhatIfPanel, target: WhatIfPanel):
+        """Load the problem and solution shown in one What-If panel into the other"""
+        problem = source.get_modified_problem()
+        target.load_problem(
+            num_variables=problem['num_variables'],
+            num_constraints=problem['num_constraints'],
+            variable_names=problem['variable_names'],
+            constraint_names=problem['constraint_names'],
+            objective_coeffs=problem['objective_coeffs'],
+            constraint_matrix=problem['constraint_matrix'],
+            rhs_values=problem['rhs_values'],
+            solution=source.solution
         )
-        self.show_panel_btn.pack(pady=SPACING["md"])
     
     def _focus_popup(self):
         """Bring popup window to focus"""
@@ -753,8 +807,7 @@ class SimplexView(ctk.CTkFrame):
     def _close_popup(self):
         """Close popup and restore embedded panel"""
         if self.popup_window:
-            self.popup_window.destroy()
-            self.popup_window = None
+            self.popup_window.withdraw()
         
         self.right_panel_popped = False
         
@@ -766,50 +819,10 @@ class SimplexView(ctk.CTkFrame):
         self.right_container.pack(side="right", fill="both", expand=False, padx=(SPACING["sm"], 0), pady=0)
         self.right_panel_visible = True
         
-        # Recreate whatif panel in embedded location
-        self.whatif_panel = WhatIfPanel(
-            self.right_panel,
-            on_resolve=self._resolve_whatif,
-            on_variable_change=self._on_variable_change,
-            on_constraint_change=self._on_constraint_change
-        )
-        self.whatif_panel.pack(fill="both", expand=True, padx=SPACING["md"], pady=SPACING["sm"])
-        
-        # Reload data
-        if self.last_result and self.last_solver:
-            self._reload_whatif_data()
-    
-    def _reload_whatif_data(self):
-        """Reload problem data into What-If panel"""
-        try:
-            if hasattr(self, 'last_solver') and self.last_solver:
-                var_names = [PRODUCTS[i] if i < len(PRODUCTS) else f"x{i+1}" 
-                            for i in range(self.num_variables)]
-                const_names = [RESOURCES[i] if i < len(RESOURCES) else f"Constraint {i+1}"
-                              for i in range(self.num_constraints)]
-                
-                c = self.objective_input.get_values()
-                A_ub = self.constraint_matrix.get_matrix()
-                b_ub = self.rhs_input.get_values()
-                
-                result_dict = {
-                    'success': self.last_result.success,
-                    'optimal_value': self.last_result.optimal_value,
-                    'solution': self.last_result.solution,
-                }
-                
-                self.whatif_panel.load_problem(
-                    num_variables=self.num_variables,
-                    num_constraints=self.num_constraints,
-                    variable_names=var_names,
-                    constraint_names=const_names,
-                    objective_coeffs=c,
-                    constraint_matrix=A_ub,
-                    rhs_values=b_ub,
-                    solution=result_dict
-                )
-        except Exception:
-            pass
+        # Hand the popup's What-If state back to the kept embedded panel
+        if self._popup_whatif is not None:
+            self._transfer_whatif(self._popup_whatif, self._docked_whatif)
+        self.whatif_panel = self._docked_whatif
     
     def _toggle_inputs_panel(self, visible=None):
         """Toggle the visibility of the Inputs panel"""
@@ -845,6 +858,9 @@ class SimplexView(ctk.CTkFrame):
     
     def _fullscreen_inputs(self):
         """Open inputs panel in fullscreen window"""
+        # Imported on first use; fullscreen windows are only opened on demand
+        from ui.components.panel_controls import FullscreenWindow
+        
         if self.inputs_popup:
             self.inputs_popup.lift()
             self.inputs_popup.focus()
@@ -865,7 +881,7 @@ class SimplexView(ctk.CTkFrame):
         ctk.CTkLabel(
             body,
             text="💡 This is a read-only fullscreen view. Edit inputs in the main window.",
-            font=ctk.CTkFont(family=FONTS["family"], size=12),
+            font=get_font(12),
             text_color=COLORS["text_secondary"]
         ).pack(pady=SPACING["md"])
         
@@ -881,7 +897,7 @@ class SimplexView(ctk.CTkFrame):
         ctk.CTkLabel(
             obj_card,
             text="💰 Objective Function Coefficients",
-            font=ctk.CTkFont(family=FONTS["family"], size=14, weight="bold"),
+            font=get_font(14, "bold"),
             text_color=COLORS["text_primary"]
         ).pack(anchor="w", padx=SPACING["md"], pady=SPACING["sm"])
         
@@ -892,7 +908,7 @@ class SimplexView(ctk.CTkFrame):
             ctk.CTkLabel(
                 obj_card,
                 text=obj_text,
-                font=ctk.CTkFont(family=FONTS["family"], size=12),
+                font=get_font(12),
                 text_color=COLORS["text_secondary"],
                 wraplength=1000
             ).pack(anchor="w", padx=SPACING["md"], pady=(0, SPACING["md"]))
@@ -906,28 +922,35 @@ class SimplexView(ctk.CTkFrame):
         ctk.CTkLabel(
             const_card,
             text="📝 Constraint Matrix Summary",
-            font=ctk.CTkFont(family=FONTS["family"], size=14, weight="bold"),
+            font=get_font(14, "bold"),
             text_color=COLORS["text_primary"]
         ).pack(anchor="w", padx=SPACING["md"], pady=SPACING["sm"])
         
         try:
-            matrix = self.constraint_matrix.get_matrix()
+            matrix = np.asarray(self.constraint_matrix.get_matrix(), dtype=np.float64)
             rhs = self.rhs_input.get_values()
             
-            for i in range(min(len(matrix), 10)):
+            # Variable names and the non-zero pattern are worked out once for all rows
+            var_names = np.array([
+                (PRODUCTS[j] if j < len(PRODUCTS) else f"x{j+1}")[:10]
+                for j in range(matrix.shape[1])
+            ], dtype=object)
+            shown = matrix[:10]
+            nonzero = shown != 0
+            
+            for i in range(len(shown)):
                 row_name = RESOURCES[i] if i < len(RESOURCES) else f"Constraint {i+1}"
-                constraint_text = f"{row_name}: "
-                terms = []
-                for j in range(len(matrix[i])):
-                    if matrix[i][j] != 0:
-                        var_name = PRODUCTS[j] if j < len(PRODUCTS) else f"x{j+1}"
-                        terms.append(f"{matrix[i][j]:.1f}·{var_name[:10]}")
-                constraint_text += " + ".join(terms[:5]) + f" ≤ {rhs[i]:,.0f}"
+                
+                # Only the first five non-zero terms are shown, so only those are formatted
+                columns = np.flatnonzero(nonzero[i])[:5]
+                coefficients = np.char.mod("%.1f", shown[i, columns])
+                terms = [f"{value}·{name}" for value, name in zip(coefficients, var_names[columns])]
+                constraint_text = f"{row_name}: " + " + ".join(terms) + f" ≤ {rhs[i]:,.0f}"
                 
                 ctk.CTkLabel(
                     const_card,
                     text=constraint_text,
-                    font=ctk.CTkFont(family=FONTS["family"], size=11),
+                    font=get_font(11),
                     text_color=COLORS["text_secondary"]
                 ).pack(anchor="w", padx=SPACING["lg"], pady=2)
         except:
@@ -941,6 +964,9 @@ class SimplexView(ctk.CTkFrame):
     
     def _fullscreen_results(self):
         """Open results panel in fullscreen window"""
+        # Imported on first use; fullscreen windows are only opened on demand
+        from ui.components.panel_controls import FullscreenWindow
+        
         if self.results_popup:
             self.results_popup.lift()
             self.results_popup.focus()
@@ -964,7 +990,7 @@ class SimplexView(ctk.CTkFrame):
             ctk.CTkLabel(
                 body,
                 text="⚠️ No solution available. Solve a problem first.",
-                font=ctk.CTkFont(family=FONTS["family"], size=16),
+                font=get_font(16),
                 text_color=COLORS["warning"]
             ).pack(pady=SPACING["xl"])
     
@@ -979,7 +1005,7 @@ class SimplexView(ctk.CTkFrame):
         ctk.CTkLabel(
             value_card,
             text=f"✓ Optimal Value: Rs. {result.optimal_value:,.2f}",
-            font=ctk.CTkFont(family=FONTS["family"], size=24, weight="bold"),
+            font=get_font(24, "bold"),
             text_color="#FFFFFF"
         ).pack(padx=SPACING["lg"], pady=SPACING["lg"])
         
@@ -990,7 +1016,7 @@ class SimplexView(ctk.CTkFrame):
         ctk.CTkLabel(
             sol_card,
             text="📊 Optimal Production Plan",
-            font=ctk.CTkFont(family=FONTS["family"], size=16, weight="bold"),
+            font=get_font(16, "bold"),
             text_color=COLORS["text_primary"]
         ).pack(anchor="w", padx=SPACING["md"], pady=SPACING["sm"])
         
@@ -1007,14 +1033,14 @@ class SimplexView(ctk.CTkFrame):
                 ctk.CTkLabel(
                     item,
                     text=f"{var_name}:",
-                    font=ctk.CTkFont(family=FONTS["family"], size=13, weight="bold"),
+                    font=get_font(13, "bold"),
                     text_color=COLORS["text_primary"]
                 ).pack(side="left", padx=SPACING["md"], pady=SPACING["sm"])
                 
                 ctk.CTkLabel(
                     item,
                     text=f"{val:,.2f} units",
-                    font=ctk.CTkFont(family=FONTS["family"], size=13),
+                    font=get_font(13),
                     text_color=COLORS["accent"]
                 ).pack(side="right", padx=SPACING["md"], pady=SPACING["sm"])
         
@@ -1026,7 +1052,7 @@ class SimplexView(ctk.CTkFrame):
             ctk.CTkLabel(
                 sens_card,
                 text="📈 Sensitivity Analysis Summary",
-                font=ctk.CTkFont(family=FONTS["family"], size=16, weight="bold"),
+                font=get_font(16, "bold"),
                 text_color=COLORS["text_primary"]
             ).pack(anchor="w", padx=SPACING["md"], pady=SPACING["sm"])
             
@@ -1034,7 +1060,7 @@ class SimplexView(ctk.CTkFrame):
             ctk.CTkLabel(
                 sens_card,
                 text="Shadow Prices (marginal value of each constraint):",
-                font=ctk.CTkFont(family=FONTS["family"], size=12),
+                font=get_font(12),
                 text_color=COLORS["text_secondary"]
             ).pack(anchor="w", padx=SPACING["md"], pady=(SPACING["sm"], 0))
             
@@ -1043,7 +1069,7 @@ class SimplexView(ctk.CTkFrame):
                 ctk.CTkLabel(
                     sens_card,
                     text=f"  • {res_name}: Rs. {sp:,.2f}",
-                    font=ctk.CTkFont(family=FONTS["family"], size=11),
+                    font=get_font(11),
                     text_color=COLORS["text_secondary"]
                 ).pack(anchor="w", padx=SPACING["lg"])
     
@@ -1078,7 +1104,7 @@ class SimplexView(ctk.CTkFrame):
                     text="📊 Show What-If Panel",
                     width=180,
                     height=36,
-                    font=ctk.CTkFont(family=FONTS["family"], size=13, weight="bold"),
+                    font=get_font(13, "bold"),
                     fg_color=COLORS["primary"],
                     hover_color=COLORS["primary_dark"],
                     corner_radius=8,
@@ -1118,6 +1144,8 @@ class SimplexView(ctk.CTkFrame):
     
     def _resolve_whatif(self):
         """Re-solve with modified parameters from What-If panel"""
+        from algorithms.simplex import SimplexSolver
+        
         try:
             # Get modified problem data
             problem = self.whatif_panel.get_modified_problem()
@@ -1129,17 +1157,38 @@ class SimplexView(ctk.CTkFrame):
             const_names = problem['constraint_names']
             maximize = self.objective_var.get() == "maximize"
             
-            # Create and solve
-            solver = SimplexSolver(
-                c=c,
-                A_ub=A_ub,
-                b_ub=b_ub,
-                maximize=maximize,
-                variable_names=var_names,
-                constraint_names=const_names
-            )
+            # Objective and RHS edits that keep the last optimal basis are answered in
+            # closed form from B_inv; anything else (structural changes) is re-solved
+            solver = self.last_solver
+            result = None
+            if (solver is not None and solver.maximize == maximize
+                    and solver.A_ub is not None and A_ub is not None
+                    and np.array_equal(solver.A_ub, A_ub)):
+                solver.variable_names = var_names
+                solver.constraint_names = const_names
+                result = solver.reoptimize(c, b_ub)
             
-            result = solver.solve()
+            if result is None:
+                # Warm-start from the previous optimal basis while the shape is unchanged
+                warm_basis = None
+                if (solver is not None and solver.A_ub is not None and A_ub is not None
+                        and solver.A_ub.shape == np.shape(A_ub)):
+                    warm_basis = solver.basis
+                
+                # Create and solve
+                solver = SimplexSolver(
+                    c=c,
+                    A_ub=A_ub,
+                    b_ub=b_ub,
+                    maximize=maximize,
+                    variable_names=var_names,
+                    constraint_names=const_names
+                )
+                
+                result = solver.solve(initial_basis=warm_basis)
+            
+            # Keep the latest basis for the next What-If change
+            self.last_solver = solver
             
             # Build result dictionary
             result_dict = {
@@ -1177,28 +1226,10 @@ class SimplexView(ctk.CTkFrame):
     
     def _load_sample(self):
         """Load sample TBLP (The Best Laboratory Pakistan) problem"""
-        # Sample objective coefficients (profit per ton)
-        objectives = np.array([5000, 7500, 4000, 3500, 6000, 4500, 8000, 3000, 9000, 8500])
-        self.objective_input.set_values(objectives)
-        
-        # Sample constraint matrix
-        constraints = np.array([
-            [2, 3, 1, 2, 1, 2, 3, 1, 2, 3],    # Raw Material A
-            [1, 2, 3, 1, 2, 1, 2, 3, 1, 2],    # Raw Material B
-            [3, 2, 4, 1, 2, 3, 1, 2, 4, 2],    # Production Line 1
-            [1, 2, 1, 3, 4, 2, 1, 2, 1, 3],    # Production Line 2
-            [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],    # Storage
-            [4, 5, 3, 4, 5, 3, 4, 5, 3, 4],    # Labor
-            [0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5],  # QC
-            [0.1, 0.2, 0.15, 0.1, 0.2, 0.15, 0.1, 0.2, 0.15, 0.1],  # Environmental
-            [10, 15, 8, 12, 10, 8, 15, 10, 12, 14],  # Energy
-            [1, 2, 1, 1, 2, 1, 2, 1, 1, 2]     # Packaging
-        ])
-        self.constraint_matrix.set_matrix(constraints)
-        
-        # Sample RHS values
-        rhs = np.array([5000, 4000, 480, 400, 1000, 2000, 300, 100, 10000, 2500])
-        self.rhs_input.set_values(rhs)
+        # Each input pushes its values to Tk in one batch
+        self.objective_input.set_values(_SAMPLE_PROFITS)
+        self.constraint_matrix.set_matrix(_SAMPLE_USAGE)
+        self.rhs_input.set_values(_SAMPLE_CAPACITY)
         
         # Set to maximize
         self.objective_var.set("maximize")
@@ -1215,62 +1246,44 @@ class SimplexView(ctk.CTkFrame):
             self.num_variables = new_vars
             self.num_constraints = new_const
             
-            # Recreate input widgets
-            self.objective_input.destroy()
-            self.constraint_matrix.destroy()
-            self.rhs_input.destroy()
-            
             # Update headers
             var_labels = [PRODUCTS[i] if i < len(PRODUCTS) else f"x{i+1}" for i in range(new_vars)]
             const_labels = [RESOURCES[i] if i < len(RESOURCES) else f"C{i+1}" for i in range(new_const)]
             
-            # Recreate objective input
-            obj_parent = self.left_panel.winfo_children()[2]  # Objective frame
-            self.objective_input = VectorInput(
-                obj_parent,
-                size=new_vars,
-                labels=var_labels,
-                orientation="horizontal",
-                default_value="0",
-                cell_width=90
-            )
-            self.objective_input.pack(fill="x", padx=10, pady=5)
+            # Resize the inputs in place; existing values and widgets are kept and only
+            # the added or removed cells change. Headers are set first so new cells
+            # are drawn with their final labels
+            self.objective_input.resize(new_vars, var_labels)
             
-            # Recreate constraint matrix
-            const_parent = self.left_panel.winfo_children()[3]  # Constraint frame
-            self.constraint_matrix = MatrixInput(
-                const_parent,
-                rows=new_const,
-                cols=new_vars,
-                row_headers=const_labels,
-                col_headers=[v[:12] for v in var_labels],
-                default_value="0",
-                cell_width=70
-            )
-            self.constraint_matrix.pack(fill="both", expand=True, padx=10, pady=5)
+            self.constraint_matrix.set_row_headers(const_labels)
+            self.constraint_matrix.set_col_headers([v[:12] for v in var_labels])
+            self.constraint_matrix.resize(new_const, new_vars)
             
-            # Recreate RHS input
-            rhs_parent = const_parent.winfo_children()[-1]  # RHS frame
-            self.rhs_input = VectorInput(
-                rhs_parent,
-                size=new_const,
-                labels=const_labels,
-                orientation="vertical",
-                default_value="0",
-                cell_width=100
-            )
-            self.rhs_input.pack(fill="x", padx=10, pady=5)
+            self.rhs_input.resize(new_const, const_labels)
             
         except ValueError:
             pass
     
+    def _gather_tableau(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Read c, A_ub and b_ub from the inputs as C-contiguous float64 arrays"""
+        # The inputs keep parsed float64 values, so this is one copy per array and the
+        # solver then uses the arrays as they are
+        c = np.ascontiguousarray(self.objective_input.get_values(), dtype=np.float64)
+        A_ub = np.ascontiguousarray(self.constraint_matrix.get_matrix(), dtype=np.float64)
+        b_ub = np.ascontiguousarray(self.rhs_input.get_values(), dtype=np.float64)
+        return c, A_ub, b_ub
+    
     def _solve(self):
-        """Solve the LP problem"""
+        """Solve the LP problem on a worker thread so the UI stays responsive"""
+        if self._solve_thread is not None:
+            return
+        
+        # Imported here so SciPy loads on the first solve, not at window start-up
+        from algorithms.simplex import SimplexSolver
+        
         try:
             # Get input data
-            c = self.objective_input.get_values()
-            A_ub = self.constraint_matrix.get_matrix()
-            b_ub = self.rhs_input.get_values()
+            c, A_ub, b_ub = self._gather_tableau()
             maximize = self.objective_var.get() == "maximize"
             
             # Get variable names
@@ -1279,7 +1292,7 @@ class SimplexView(ctk.CTkFrame):
             const_names = [RESOURCES[i] if i < len(RESOURCES) else f"Constraint {i+1}"
                           for i in range(self.num_constraints)]
             
-            # Create and solve
+            # Create the solver; solving happens off the Tk thread
             solver = SimplexSolver(
                 c=c,
                 A_ub=A_ub,
@@ -1288,8 +1301,38 @@ class SimplexView(ctk.CTkFrame):
                 variable_names=var_names,
                 constraint_names=const_names
             )
-            
-            result = solver.solve()
+        except Exception as e:
+            self.result_display.set_status(False, f"Error: {str(e)}")
+            return
+        
+        self._pending_solver = solver
+        self._solve_thread = threading.Thread(target=solver.solve, daemon=True)
+        self._solve_thread.start()
+        self.solve_btn.configure(state="disabled")
+        self.after(20, self._poll_solve, solver)
+    
+    def _poll_solve(self, solver: 'SimplexSolver'):
+        """Wait for the worker thread on the Tk thread, then show its result"""
+        if self._solve_thread.is_alive():
+            self.after(20, self._poll_solve, solver)
+            return
+        
+        self._solve_thread = None
+        self.solve_btn.configure(state="normal")
+        
+        # A clear while solving discards the result
+        if solver is not self._pending_solver:
+            return
+        self._pending_solver = None
+        self._update_results_ui(solver)
+    
+    def _update_results_ui(self, solver: 'SimplexSolver'):
+        """Show a finished solve and load it into the What-If panel"""
+        try:
+            result = solver.get_result()
+            c, A_ub, b_ub = solver.c, solver.A_ub, solver.b_ub
+            var_names = solver.variable_names
+            const_names = solver.constraint_names
             
             # Display results
             result_dict = {
@@ -1321,8 +1364,8 @@ class SimplexView(ctk.CTkFrame):
             
             # Load problem into What-If panel
             self.whatif_panel.load_problem(
-                num_variables=self.num_variables,
-                num_constraints=self.num_constraints,
+                num_variables=len(c),
+                num_constraints=len(b_ub),
                 variable_names=var_names,
                 constraint_names=const_names,
                 objective_coeffs=c,
@@ -1354,6 +1397,7 @@ class SimplexView(ctk.CTkFrame):
         )
         self.last_result = None
         self.last_solver = None
+        self._pending_solver = None
     
     def _export(self):
         """Export results to file"""